@@ -2,5 +2,11 @@
 Init file for the Fintoc Python SDK.
 """
 
-from fintoc.core import Fintoc
+from fintoc.cache import MemoryCache, ResponseCache, SQLiteCache
+from fintoc.core import AsyncFintoc, Fintoc
+from fintoc.history import HistoryStore
+from fintoc.journal import FileJournal, SQLiteJournal
+from fintoc.rate_limiter import RateLimiter, RateLimitRule
+from fintoc.retry import RetryPolicy
+from fintoc.transport import TransportConfig
 from fintoc.version import __version__
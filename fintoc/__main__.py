@@ -0,0 +1,106 @@
+"""
+Command line entry point of the Fintoc Python SDK, used as
+`python -m fintoc export <resource>`.
+"""
+
+import argparse
+import os
+import sys
+
+from fintoc.core import Fintoc
+from fintoc.export import EXPORT_FORMATS, export, export_to_file, resolve_manager
+
+API_KEY_VARIABLE = "FINTOC_API_KEY"
+
+
+def parse_param(value):
+    """Parse a "key=value" param given on the command line."""
+    key, separator, param = value.partition("=")
+    if not separator or not key:
+        raise argparse.ArgumentTypeError(f"Invalid param '{value}', use key=value")
+    return key, param
+
+
+def build_parser():
+    """Build the parser of the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m fintoc", description="Fintoc Python SDK"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser(
+        "export", help="Export every instance of a resource to NDJSON or CSV"
+    )
+    export_parser.add_argument(
+        "resource",
+        help='Dotted name of the resource, like "v2.accounts.movements"',
+    )
+    export_parser.add_argument(
+        "-p",
+        "--param",
+        action="append",
+        default=[],
+        type=parse_param,
+        help="Param used to list the resource (or fill its path), as key=value",
+    )
+    export_parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help='File to write to (ending with ".gz" to compress it), or "-" for stdout',
+    )
+    export_parser.add_argument(
+        "-f",
+        "--format",
+        choices=EXPORT_FORMATS,
+        help="Format of the export, inferred from the output file by default",
+    )
+    export_parser.add_argument(
+        "--fields", help="Comma separated fields used as columns of CSV exports"
+    )
+    export_parser.add_argument(
+        "--api-key",
+        default=os.environ.get(API_KEY_VARIABLE),
+        help=f"API key, read from the {API_KEY_VARIABLE} variable by default",
+    )
+    return parser
+
+
+def run_export(args):
+    """Run the export command, returning the number of instances written."""
+    fintoc = Fintoc(args.api_key)
+    try:
+        manager = resolve_manager(fintoc, args.resource)
+        fields = args.fields.split(",") if args.fields else None
+        params = dict(args.param)
+        if args.output == "-":
+            return export(
+                manager,
+                sys.stdout,
+                format_=args.format or "ndjson",
+                fields=fields,
+                **params,
+            )
+        return export_to_file(
+            manager, args.output, format_=args.format, fields=fields, **params
+        )
+    finally:
+        fintoc.close()
+
+
+def main(argv=None):
+    """Run the command line interface with the :argv: arguments."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        parser.error(f"an API key is required, set {API_KEY_VARIABLE} or --api-key")
+    try:
+        count = run_export(args)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"Exported {count} instances of {args.resource}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
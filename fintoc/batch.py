@@ -0,0 +1,191 @@
+"""
+Module to hold the batch utilities, that run a function for many keys
+concurrently while collecting the error raised for each of them.
+"""
+
+import asyncio
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from fintoc.errors import ApiError, FintocError, RateLimitExceededError
+
+DEFAULT_CONCURRENCY = 8
+
+# Errors that get collected for each key instead of aborting the batch
+BATCH_ERRORS = (FintocError, RateLimitExceededError, httpx.TransportError)
+
+# Errors after which running the function again for the same key may succeed
+RETRYABLE_ERRORS = (ApiError, RateLimitExceededError, httpx.TransportError)
+
+# Namespace of the idempotency keys derived from the batch and data of each item
+IDEMPOTENCY_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://api.fintoc.com")
+
+# Statuses of the items of a batch
+SUCCEEDED = "succeeded"
+CREATED = "created"
+FAILED = "failed"
+RETRYABLE = "retryable"
+
+
+class BatchItem:
+
+    """
+    Represents the outcome of running a batch function for a :key:. Its
+    :status: is SUCCEEDED (or the success status of the batch) unless it
+    has an :error:, in which case it is RETRYABLE or FAILED.
+    """
+
+    __slots__ = ("key", "value", "error", "status")
+
+    def __init__(self, key, value=None, error=None, status=None):
+        self.key = key
+        self.value = value
+        self.error = error
+        if status is None:
+            status = SUCCEEDED if error is None else FAILED
+        self.status = status
+
+    @property
+    def ok(self):
+        """Whether the function succeeded for the key."""
+        return self.error is None
+
+    def __repr__(self):
+        outcome = f"value={self.value!r}" if self.ok else f"error={self.error!r}"
+        return f"BatchItem(key={self.key!r}, status={self.status!r}, {outcome})"
+
+
+class BatchResult:
+
+    """
+    Represents the outcome of a batch, holding a BatchItem for each key in
+    the order in which the keys were given.
+    """
+
+    def __init__(self, items):
+        self.items = list(items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __repr__(self):
+        return (
+            f"BatchResult(succeeded={len(self.succeeded)}, failed={len(self.failed)})"
+        )
+
+    @property
+    def values(self):
+        """The values of every item, which are None for the failed ones."""
+        return [item.value for item in self.items]
+
+    @property
+    def succeeded(self):
+        """The items whose function succeeded."""
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self):
+        """The items whose function raised an error."""
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def retryable(self):
+        """The failed items whose function may succeed if it runs again."""
+        return [item for item in self.items if item.status == RETRYABLE]
+
+    @property
+    def errors(self):
+        """A dictionary with the error raised for each failed key."""
+        return {item.key: item.error for item in self.items if not item.ok}
+
+    def raise_for_errors(self):
+        """Raise the error of the first failed item, if any."""
+        for item in self.items:
+            if not item.ok:
+                raise item.error
+
+
+def build_idempotency_key(batch_id, key, params):
+    """
+    Build a deterministic idempotency key for the request sent with
+    :params: for the item :key: of the batch :batch_id:. Running the same
+    batch again yields the same keys, while other batches (even with the
+    same items) get different ones.
+    """
+    canonical = json.dumps(
+        {"batch_id": batch_id, "key": key, "params": params},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return str(uuid.uuid5(IDEMPOTENCY_NAMESPACE, canonical))
+
+
+def is_retryable_error(error):
+    """Return whether running again the function that raised :error: may succeed."""
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+def _build_error_item(key, error):
+    return BatchItem(
+        key, error=error, status=RETRYABLE if is_retryable_error(error) else FAILED
+    )
+
+
+def _run_item(function, key, success_status):
+    try:
+        return BatchItem(key, value=function(key), status=success_status)
+    except BATCH_ERRORS as error:
+        return _build_error_item(key, error)
+
+
+def run_batch(
+    function, keys, concurrency=DEFAULT_CONCURRENCY, success_status=SUCCEEDED
+):
+    """
+    Call :function: with every key of :keys: using a pool of :concurrency:
+    threads, returning a BatchResult. The errors raised by the API are
+    collected for each key instead of aborting the batch. The items that
+    succeed get :success_status:.
+    """
+    keys = list(keys)
+    if concurrency < 1:
+        raise ValueError("The concurrency must be at least 1")
+    if concurrency == 1 or len(keys) <= 1:
+        return BatchResult(_run_item(function, key, success_status) for key in keys)
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(keys))) as executor:
+        return BatchResult(
+            executor.map(lambda key: _run_item(function, key, success_status), keys)
+        )
+
+
+async def run_batch_async(
+    function, keys, concurrency=DEFAULT_CONCURRENCY, success_status=SUCCEEDED
+):
+    """
+    Await :function: with every key of :keys:, running at most :concurrency:
+    calls at the same time, and return a BatchResult. The errors raised by
+    the API are collected for each key instead of aborting the batch. The
+    items that succeed get :success_status:.
+    """
+    if concurrency < 1:
+        raise ValueError("The concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_item(key):
+        async with semaphore:
+            try:
+                return BatchItem(key, value=await function(key), status=success_status)
+            except BATCH_ERRORS as error:
+                return _build_error_item(key, error)
+
+    return BatchResult(await asyncio.gather(*[run_item(key) for key in keys]))
@@ -0,0 +1,284 @@
+"""
+Module to hold the response cache of the SDK, that keeps the responses of
+GET requests for a time that can be configured for each family of
+endpoints, and the validator cache used to make conditional requests.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+import urllib.parse
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+
+from fintoc.stores import SQLiteStore
+from fintoc.webhook import WebhookSignature
+
+
+def _has_segment(path, segment):
+    return segment in path.strip("/").split("/")
+
+
+class CacheBackend(metaclass=ABCMeta):
+
+    """
+    Represents the storage of a response cache. Subclass it to share the
+    cache between processes (using Redis, for example).
+    """
+
+    @abstractmethod
+    def get(self, key):
+        """Return the value stored for :key:, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key, value, ttl, path):
+        """Store :value: for :key: during :ttl: seconds, as a response of :path:."""
+
+    @abstractmethod
+    def evict(self, segment):
+        """Remove the values stored for the paths that include the :segment:."""
+
+    @abstractmethod
+    def clear(self):
+        """Remove every stored value."""
+
+
+class MemoryCache(CacheBackend):
+
+    """
+    Represents an in-memory cache that keeps up to :max_entries: values,
+    evicting the least recently used ones first.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, _, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key, value, ttl, path):
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, path, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def evict(self, segment):
+        with self._lock:
+            for key in [
+                key
+                for key, (_, path, _) in self._entries.items()
+                if _has_segment(path, segment)
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(SQLiteStore, CacheBackend):
+
+    """
+    Represents a cache stored in the SQLite database at :path:, that can
+    be shared between processes. It keeps up to :max_entries: values (if
+    given), evicting the least recently used ones first.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS cache_entries (key TEXT PRIMARY KEY, "
+        "path TEXT, value TEXT, expires_at REAL, used_at REAL)"
+    )
+
+    def __init__(self, path, max_entries=None):
+        super().__init__(path)
+        self.max_entries = max_entries
+
+    def get(self, key):
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE cache_entries SET used_at = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl, path):
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?, ?, ?)",
+                (key, path, json.dumps(value), now + ttl, now),
+            )
+            self._connection.execute(
+                "DELETE FROM cache_entries WHERE expires_at <= ?", (now,)
+            )
+            if self.max_entries is not None:
+                self._connection.execute(
+                    "DELETE FROM cache_entries WHERE key NOT IN (SELECT key FROM "
+                    "cache_entries ORDER BY used_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+
+    def evict(self, segment):
+        with self._lock, self._connection:
+            paths = self._connection.execute(
+                "SELECT DISTINCT path FROM cache_entries WHERE instr(path, ?) > 0",
+                (segment,),
+            ).fetchall()
+            self._connection.executemany(
+                "DELETE FROM cache_entries WHERE path = ?",
+                [(path,) for (path,) in paths if _has_segment(path, segment)],
+            )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache_entries")
+
+
+class ResponseCache:
+
+    """
+    Caches the responses of GET requests. :ttls: maps path prefixes (like
+    "/v2/products") to the seconds their responses are kept, while the
+    responses of any other path are kept for :default_ttl: seconds (never,
+    by default). Values get stored in :backend:, defaulting to a
+    MemoryCache. Writes to a path evict the responses of the paths that
+    include it.
+    """
+
+    def __init__(self, ttls=None, default_ttl=0, backend=None):
+        self.ttls = sorted((ttls or {}).items(), key=lambda item: -len(item[0]))
+        self.default_ttl = default_ttl
+        self.backend = backend if backend is not None else MemoryCache()
+
+    def get_ttl(self, path):
+        """Return the seconds that the responses of :path: are kept."""
+        for prefix, ttl in self.ttls:
+            if path.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def build_key(url, api_key, api_version=None):
+        """
+        Build the key of the response of :url: for :api_key:, which does
+        not include the API key itself.
+        """
+        return hashlib.sha256(f"{api_key}\n{api_version}\n{url}".encode()).hexdigest()
+
+    def get(self, key):
+        """Return the response stored for :key:, or None if it is missing."""
+        return self.backend.get(key)
+
+    def set(self, key, value, path):
+        """Store the response :value: of :path: for :key:, if it gets cached."""
+        ttl = self.get_ttl(path)
+        if ttl > 0:
+            self.backend.set(key, value, ttl, path)
+        return value
+
+    def evict(self, resource_id):
+        """Remove every response of a path that includes :resource_id:."""
+        self.backend.evict(resource_id)
+
+    def evict_path(self, url):
+        """
+        Remove every response that includes any of the resources identified
+        in the path of :url:, like "cus_123" in "/v2/customers/cus_123".
+        """
+        segments = urllib.parse.urlparse(url).path.strip("/").split("/")
+        for resource_id in segments[2::2]:
+            self.evict(resource_id)
+
+    def evict_from_webhook(
+        self, payload, header, secret, tolerance=WebhookSignature.DEFAULT_TOLERANCE
+    ):
+        """
+        Verify the webhook event in :payload: using its Fintoc-Signature
+        :header: and the webhook :secret: (as WebhookSignature does), and
+        remove every response that includes the resource of the event.
+        Return the event.
+        """
+        WebhookSignature.verify_header(payload, header, secret, tolerance=tolerance)
+        event = json.loads(payload)
+        resource_id = (event.get("data") or {}).get("id")
+        if resource_id:
+            self.evict(resource_id)
+        return event
+
+    def clear(self):
+        """Remove every stored response."""
+        self.backend.clear()
+
+
+class ValidatorCache:
+
+    """
+    Remembers the validators (the ETag and Last-Modified headers) of the
+    responses to GET requests along with their data, so that requesting
+    them again can be conditional. It keeps up to :max_entries: responses,
+    evicting the least recently used ones first.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Return the (etag, last_modified, data) tuple remembered for :key:,
+        or None if there is none.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, headers, data):
+        """
+        Remember the validators in :headers: of the response :data: for
+        :key:, if the response has any.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            if etag is None and last_modified is None:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (etag, last_modified, copy.deepcopy(data))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every remembered response."""
+        with self._lock:
+            self._entries.clear()
@@ -2,22 +2,55 @@
 Module to house the Client object of the Fintoc Python SDK.
 """
 
+import asyncio
+import copy
+import functools
 import urllib
 import uuid
+import weakref
 from json.decoder import JSONDecodeError
 
 import httpx
 
+from fintoc.batch import run_batch, run_batch_async
+from fintoc.constants import DATETIME_MODE_NAIVE, DATETIME_MODES
+from fintoc.history import iterate_history, iterate_history_async
+from fintoc.journal import JournalEntry, is_settled
 from fintoc.jws import JWSSignature
-from fintoc.paginator import paginate
+from fintoc.paginator import (
+    paginate,
+    paginate_async,
+    paginate_pages,
+    paginate_pages_async,
+    prefetch_pages,
+    prefetch_pages_async,
+)
+from fintoc.retry import send_with_retries, send_with_retries_async
+from fintoc.shards import iterate_windows, iterate_windows_async
+from fintoc.single_flight import AsyncSingleFlight, SingleFlight
+from fintoc.utils import can_raise_fintoc_error, then
 
 
+async def _resolve(value):
+    """Return :value: from a coroutine."""
+    return value
+
+
+# pylint: disable=too-many-instance-attributes
 class Client:
     """Encapsulates the client behaviour and methods."""
 
     _client = httpx.Client()
+    # Runs batches of requests, concurrently on threads
+    batch_runner = staticmethod(run_batch)
+    # Coalesces identical concurrent requests made from threads
+    single_flight_class = SingleFlight
+    history_iterator = staticmethod(iterate_history)
+    # Lists the windows of a sharded list ahead, on threads
+    shard_iterator = staticmethod(iterate_windows)
 
-    def __init__(
+    # Every local is an option of the client, passed as a keyword argument
+    def __init__(  # pylint: disable=too-many-locals
         self,
         base_url,
         api_key,
@@ -25,14 +58,61 @@ class Client:
         user_agent,
         jws_private_key=None,
         params={},
+        http_client=None,
+        transport=None,
+        retry_policy=None,
+        rate_limiter=None,
+        raw=False,
+        datetime_mode=DATETIME_MODE_NAIVE,
+        lazy_attributes=False,
+        compact=False,
+        journal=None,
+        single_flight=None,
+        cache=None,
+        validators=None,
+        history=None,
+        page_concurrency=1,
     ):
+        if datetime_mode not in DATETIME_MODES:
+            raise ValueError(
+                f"Invalid datetime mode '{datetime_mode}', use one of {DATETIME_MODES}"
+            )
         self.base_url = base_url
         self.api_key = api_key
         self.user_agent = user_agent
         self.params = params
         self.api_version = api_version
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.raw = raw
+        self.datetime_mode = datetime_mode
+        self.lazy_attributes = lazy_attributes
+        self.compact = compact
+        self.journal = journal
+        self.single_flight = single_flight
+        self.cache = cache
+        self.validators = validators
+        self.history = history
+        self.page_concurrency = page_concurrency
         self.headers = self._get_static_headers()
         self.__jws = JWSSignature(jws_private_key) if jws_private_key else None
+        self._owns_http_client = http_client is None and transport is not None
+        if http_client is not None:
+            self._client = http_client
+        elif transport is not None:
+            self._client = self._build_http_client(transport)
+
+    @staticmethod
+    def _build_http_client(transport):
+        return transport.build_client()
+
+    def close(self):
+        """
+        Close the connection pool of the client, if it was built by the
+        client itself. Shared pools must be closed by their owner.
+        """
+        if self._owns_http_client:
+            self._client.close()
 
     def _get_static_headers(self):
         """Return the headers that do not change per request."""
@@ -86,30 +166,245 @@ class Client:
         json=None,
         files=None,
         idempotency_key=None,
+        prefetch=0,
+        not_modified=None,
+        history=False,
     ):
         """
         Uses the internal httpx client to make a simple or paginated request.
+        :prefetch: is the amount of pages fetched ahead on paginated requests.
+        If given, :not_modified: gets returned when a conditional GET finds
+        that the response did not change (instead of the remembered one),
+        and the request skips the response cache and the coalescing. If
+        :history:, the paginated resource never changes once it is old
+        enough, so its history can be served from the history store.
         """
-        url = (
-            path
-            if urllib.parse.urlparse(path).scheme
-            else f"{self.base_url}/{path.lstrip('/')}"
-        )
+        url = self.build_url(path)
         headers = self._get_base_headers(method, idempotency_key=idempotency_key)
         all_params = {**self.params, **params} if params else self.params
 
         if paginated:
-            return paginate(
-                self._client,
-                url,
-                params=all_params,
-                headers=headers,
-            )
+            return self._request_paginated(url, all_params, headers, prefetch, history)
 
         _request = self._build_request(
             method, url, all_params, headers, json, files=files
         )
-        response = self._client.send(_request)
+        return self._send_request(
+            _request, streamed=files is not None, not_modified=not_modified
+        )
+
+    def _request_paginated(self, url, params, headers, prefetch=0, history=False):
+        """
+        Return a generator with every instance of the paginated resource,
+        serving its history from the history store if :history:.
+        """
+        if history and self.history is not None:
+            elements = self._paginate_history(url, params, headers, prefetch)
+            if elements is not None:
+                return elements
+        return self._paginate(url, params=params, headers=headers, prefetch=prefetch)
+
+    def _send_request(self, request, streamed=False, not_modified=None):
+        """
+        Send the :request:, through the cache and the coalescing if it is a
+        GET, or recording it on the journal if it is a POST. :streamed:
+        requests (with a multipart body) are never retried nor recorded.
+        """
+        # Multipart bodies are streamed from the files, so they are never retried
+        retry_policy = None if streamed else self.retry_policy
+        method = request.method.lower()
+        if method == "get":
+            if not_modified is not None:
+                return self._send(request, retry_policy, not_modified=not_modified)
+            return self._send_get(request, retry_policy)
+        if self.cache is not None:
+            self.cache.evict_path(str(request.url))
+        entry = None
+        if self.journal is not None and method == "post" and not streamed:
+            entry = JournalEntry.from_request(request)
+        return self._send(request, retry_policy, entry, record=entry is not None)
+
+    def _send_get(self, request, retry_policy=None):
+        """
+        Send a GET request, answering it from the cache if possible and
+        sharing it with the identical requests in flight.
+        """
+        if self.cache is None:
+            return self._send_coalesced(request, retry_policy)
+        key = self.cache.build_key(str(request.url), self.api_key, self.api_version)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._resolved(cached)
+        return then(
+            self._send_coalesced(request, retry_policy),
+            lambda data: self.cache.set(key, data, request.url.path),
+        )
+
+    def _send_coalesced(self, request, retry_policy=None):
+        if self.single_flight is None:
+            return self._send(request, retry_policy)
+        key = (str(request.url), self.api_key, self.api_version)
+        return self.single_flight.do(key, lambda: self._send(request, retry_policy))
+
+    @staticmethod
+    def _resolved(value):
+        """Return :value: as the result of a request."""
+        return value
+
+    def replay_journal(self, concurrency=1):
+        """
+        Send again every request left pending on the journal (because the
+        process crashed before getting its response), using the same body
+        and idempotency key. Return a BatchResult with the response (or the
+        error raised) for each entry.
+        """
+        if self.journal is None:
+            raise ValueError("The client has no journal to replay")
+        return self.batch_runner(
+            self._replay_entry, self.journal.pending(), concurrency=concurrency
+        )
+
+    @can_raise_fintoc_error
+    def _replay_entry(self, entry):
+        if not entry.is_intact():
+            raise ValueError(f"The body of the journal entry {entry.id} is corrupted")
+        headers = self._get_base_headers(
+            entry.method, idempotency_key=entry.idempotency_key
+        )
+        request = self._build_request(
+            entry.method, entry.url, None, headers, entry.json
+        )
+        return self._send(request, self.retry_policy, entry)
+
+    def request_pages(self, path, params=None, prefetch=0):
+        """
+        Uses the internal httpx client to make a paginated request and
+        return a generator with each of its pages.
+        """
+        url = self.build_url(path)
+        headers = self._get_base_headers("get")
+        all_params = {**self.params, **params} if params else self.params
+        return self._paginate_pages(url, all_params, headers, prefetch=prefetch)
+
+    def build_url(self, path):
+        """Return the absolute URL of :path:."""
+        if urllib.parse.urlparse(path).scheme:
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def _paginate_pages(self, url, params, headers, prefetch=0):
+        pages = paginate_pages(
+            self._client,
+            url,
+            params=params,
+            headers=headers,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            page_concurrency=self.page_concurrency,
+        )
+        return prefetch_pages(pages, prefetch) if prefetch else pages
+
+    def _paginate_history(self, url, params, headers, prefetch=0):
+        """
+        Return a generator with every instance of the paginated resource,
+        serving its history from the history store, or None if the request
+        can not be split into days.
+        """
+        if self.history.plan(params) is None:
+            return None
+        scope = self.history.build_scope(url, params, self.api_key)
+        return self.history_iterator(
+            self.history,
+            scope,
+            params,
+            lambda params: self._paginate(url, params, headers, prefetch),
+        )
+
+    def _paginate(self, url, params, headers, prefetch=0):
+        return paginate(
+            self._client,
+            url,
+            params=params,
+            headers=headers,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            prefetch=prefetch,
+            page_concurrency=self.page_concurrency,
+        )
+
+    def _send(
+        self, request, retry_policy=None, entry=None, not_modified=None, record=False
+    ):
+        """
+        Send the :request:, completing its journal :entry: once it gets
+        answered. If :record:, the :entry: gets recorded right before the
+        request leaves, so a request stopped by the rate limiter is never
+        left pending.
+        """
+        remembered = self._add_validators(request)
+        response = self._send_with_retries(
+            request,
+            retry_policy,
+            functools.partial(self.journal.record, entry) if record else None,
+        )
+        return then(
+            response,
+            lambda response: self._receive(
+                request, response, entry, remembered, not_modified
+            ),
+        )
+
+    def _send_with_retries(self, request, retry_policy=None, before_send=None):
+        return send_with_retries(
+            self._client, request, retry_policy, self.rate_limiter, before_send
+        )
+
+    def _receive(self, request, response, entry, remembered, not_modified=None):
+        self._complete_entry(entry, response)
+        return self._parse_validated_response(
+            request, response, remembered, not_modified
+        )
+
+    def _add_validators(self, request):
+        """
+        Make the GET :request: conditional on the validators of its last
+        response, if they are remembered, returning the remembered entry.
+        """
+        if self.validators is None or request.method != "GET":
+            return None
+        remembered = self.validators.get(self._validator_key(request))
+        if remembered is not None:
+            etag, last_modified, _ = remembered
+            if etag is not None:
+                request.headers["If-None-Match"] = etag
+            if last_modified is not None:
+                request.headers["If-Modified-Since"] = last_modified
+        return remembered
+
+    def _parse_validated_response(
+        self, request, response, remembered, not_modified=None
+    ):
+        if self.validators is None or request.method != "GET":
+            return self._parse_response(response)
+        if response.status_code == 304 and remembered is not None:
+            if not_modified is not None:
+                return not_modified
+            return copy.deepcopy(remembered[2])
+        data = self._parse_response(response)
+        self.validators.set(self._validator_key(request), response.headers, data)
+        return data
+
+    def _validator_key(self, request):
+        return (str(request.url), self.api_key, self.api_version)
+
+    def _complete_entry(self, entry, response):
+        # Server errors (like those of a gateway) leave the outcome of the
+        # request unknown, so it stays pending to be replayed
+        if entry is not None and is_settled(response.status_code):
+            self.journal.complete(entry.id, response.status_code)
+
+    @staticmethod
+    def _parse_response(response):
         response.raise_for_status()
         try:
             return response.json()
@@ -127,10 +422,122 @@ class Client:
         Creates a new instance using the data of the current object,
         overwriting parts of it using the method parameters.
         """
-        return Client(
+        return self.__class__(
             base_url=base_url or self.base_url,
             api_key=api_key or self.api_key,
             api_version=self.api_version,
             user_agent=user_agent or self.user_agent,
             params={**self.params, **params} if params else self.params,
+            http_client=self._client,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            raw=self.raw,
+            datetime_mode=self.datetime_mode,
+            lazy_attributes=self.lazy_attributes,
+            compact=self.compact,
+            journal=self.journal,
+            single_flight=self.single_flight,
+            cache=self.cache,
+            validators=self.validators,
+            history=self.history,
+            page_concurrency=self.page_concurrency,
+        )
+
+
+class _LoopLocalClient:
+
+    """
+    Default asynchronous httpx client of an AsyncClient, that keeps its own
+    connection pool for each event loop that uses it, as the connections of
+    a pool can not be reused from another event loop.
+    """
+
+    def __init__(self):
+        self._clients = weakref.WeakKeyDictionary()
+
+    def _get(self):
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = httpx.AsyncClient()
+        return client
+
+    async def send(self, request, **kwargs):
+        """Send :request: using the pool of the running event loop."""
+        return await self._get().send(request, **kwargs)
+
+    async def aclose(self):
+        """Close the pool of the running event loop."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+class AsyncClient(Client):
+    """
+    Encapsulates the client behaviour and methods on top of an asynchronous
+    httpx client. Simple requests return coroutines and paginated requests
+    return asynchronous generators.
+    """
+
+    batch_runner = staticmethod(run_batch_async)
+    single_flight_class = AsyncSingleFlight
+    history_iterator = staticmethod(iterate_history_async)
+    shard_iterator = staticmethod(iterate_windows_async)
+    _client = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self._client is None:
+            # Each object gets its own default pool, built on each event loop
+            self._client = _LoopLocalClient()
+            self._owns_http_client = True
+
+    @staticmethod
+    def _build_http_client(transport):
+        return transport.build_async_client()
+
+    def close(self):
+        """
+        Return a coroutine that closes the connection pool of the client, if
+        it was built by the client itself. Shared pools must be closed by
+        their owner.
+        """
+        return self._close()
+
+    async def _close(self):
+        if self._owns_http_client:
+            await self._client.aclose()
+
+    def _paginate_pages(self, url, params, headers, prefetch=0):
+        pages = paginate_pages_async(
+            self._client,
+            url,
+            params=params,
+            headers=headers,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            page_concurrency=self.page_concurrency,
+        )
+        return prefetch_pages_async(pages, prefetch) if prefetch else pages
+
+    def _paginate(self, url, params, headers, prefetch=0):
+        return paginate_async(
+            self._client,
+            url,
+            params=params,
+            headers=headers,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            prefetch=prefetch,
+            page_concurrency=self.page_concurrency,
+        )
+
+    @staticmethod
+    def _resolved(value):
+        return _resolve(value)
+
+    def _send_with_retries(self, request, retry_policy=None, before_send=None):
+        return send_with_retries_async(
+            self._client, request, retry_policy, self.rate_limiter, before_send
         )
@@ -0,0 +1,186 @@
+"""
+Module to hold the column tables, that store the elements of a list in
+compact column buffers instead of building an object for each of them.
+"""
+
+import datetime
+import sys
+from array import array
+
+from fintoc.utils import collect, map_iterable, parse_iso_datetime, then
+
+# NumPy and PyArrow are optional, only needed to convert the column tables
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Kinds of columns: integers and datetimes (as microseconds since the epoch)
+# get stored in int64 arrays, categories in lists of interned strings and
+# strings in plain lists
+INTEGER_COLUMN = "integer"
+DATETIME_COLUMN = "datetime"
+CATEGORY_COLUMN = "category"
+STRING_COLUMN = "string"
+
+# Stored in datetime columns for missing or invalid datetimes. It matches the
+# value used by NumPy for "not a time"
+NULL_DATETIME = -(2**63)
+
+# Stored in integer columns for missing values, so they are not mistaken for
+# real zeros
+NULL_INTEGER = -(2**63)
+
+# Default columns used to list movements
+MOVEMENT_COLUMNS = {
+    "id": STRING_COLUMN,
+    "amount": INTEGER_COLUMN,
+    "currency": CATEGORY_COLUMN,
+    "type": CATEGORY_COLUMN,
+    "description": STRING_COLUMN,
+    "post_date": DATETIME_COLUMN,
+    "transaction_date": DATETIME_COLUMN,
+}
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def to_epoch_microseconds(value):
+    """
+    Transform an ISO datetime string into microseconds since the epoch,
+    returning NULL_DATETIME if it is not a valid datetime.
+    """
+    parsed = parse_iso_datetime(value) if isinstance(value, str) else None
+    if parsed is None:
+        return NULL_DATETIME
+    return (parsed - _EPOCH) // _MICROSECOND
+
+
+class ColumnTable:
+
+    """
+    Represents a table that stores each field of its :schema: (a dictionary
+    mapping the name of each column to its kind) in a compact buffer.
+    """
+
+    def __init__(self, schema):
+        self.schema = dict(schema)
+        self.columns = {
+            name: array("q") if kind in (INTEGER_COLUMN, DATETIME_COLUMN) else []
+            for name, kind in self.schema.items()
+        }
+        self._appenders = [
+            (name, kind, self.columns[name].append)
+            for name, kind in self.schema.items()
+        ]
+
+    def __len__(self):
+        return len(self.columns[next(iter(self.columns))]) if self.columns else 0
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __repr__(self):
+        return f"ColumnTable(columns={list(self.columns)}, rows={len(self)})"
+
+    def append(self, element):
+        """Append the fields of the :element: dictionary to the columns."""
+        for name, kind, append in self._appenders:
+            value = element.get(name)
+            if kind == INTEGER_COLUMN:
+                append(NULL_INTEGER if value is None else value)
+            elif kind == DATETIME_COLUMN:
+                append(to_epoch_microseconds(value))
+            elif kind == CATEGORY_COLUMN and isinstance(value, str):
+                append(sys.intern(value))
+            else:
+                append(value)
+
+    def extend(self, elements):
+        """Append every element of :elements: to the columns."""
+        for element in elements:
+            self.append(element)
+
+    def to_numpy(self):
+        """
+        Return a dictionary with a NumPy array for each column. Integer and
+        datetime columns share the memory of the table, and integer columns
+        are masked arrays whose missing values are masked.
+        """
+        if numpy is None:
+            raise ImportError("The numpy output requires NumPy (pip install numpy)")
+
+        arrays = {}
+        for name, kind in self.schema.items():
+            column = self.columns[name]
+            if kind == INTEGER_COLUMN:
+                arrays[name] = numpy.ma.masked_equal(
+                    numpy.frombuffer(column, dtype=numpy.int64),
+                    NULL_INTEGER,
+                    copy=False,
+                )
+            elif kind == DATETIME_COLUMN:
+                arrays[name] = numpy.frombuffer(column, dtype=numpy.int64).view(
+                    "datetime64[us]"
+                )
+            else:
+                arrays[name] = numpy.array(column, dtype=object)
+        return arrays
+
+    def to_arrow(self):
+        """
+        Return a PyArrow table with the columns. Category columns get
+        dictionary encoded.
+        """
+        if pyarrow is None:
+            raise ImportError("The arrow output requires PyArrow (pip install pyarrow)")
+
+        arrays = {}
+        for name, kind in self.schema.items():
+            column = self.columns[name]
+            if kind == INTEGER_COLUMN:
+                arrays[name] = pyarrow.array(
+                    _with_nulls(column, NULL_INTEGER), type=pyarrow.int64()
+                )
+            elif kind == DATETIME_COLUMN:
+                arrays[name] = pyarrow.array(
+                    _with_nulls(column, NULL_DATETIME),
+                    type=pyarrow.timestamp("us", tz="UTC"),
+                )
+            elif kind == CATEGORY_COLUMN:
+                arrays[name] = pyarrow.array(
+                    column, type=pyarrow.string()
+                ).dictionary_encode()
+            else:
+                arrays[name] = pyarrow.array(column, type=pyarrow.string())
+        return pyarrow.table(arrays)
+
+
+def _with_nulls(column, null):
+    return [None if value == null else value for value in column]
+
+
+def build_column_table(pages, schema, output=None):
+    """
+    Stream the elements of the raw :pages: into a ColumnTable with the
+    given :schema:. Pass "numpy" or "arrow" as :output: to transform the
+    table, which requires the corresponding package to be installed.
+    """
+    if output not in (None, "numpy", "arrow"):
+        raise ValueError(f"Invalid output '{output}', use 'numpy' or 'arrow'")
+    table = ColumnTable(schema)
+
+    def build_output(_):
+        if output == "numpy":
+            return table.to_numpy()
+        if output == "arrow":
+            return table.to_arrow()
+        return table
+
+    return then(collect(map_iterable(pages, table.extend)), build_output)
@@ -4,3 +4,10 @@ API_BASE_URL = "https://api.fintoc.com"
 
 LINK_HEADER_PATTERN = r'<(?P<url>.*)>;\s*rel="(?P<rel>.*)"'
 DATE_TIME_PATTERN = "%Y-%m-%dT%H:%M:%SZ"
+
+# Ways of objetizing the datetimes of the resources: as naive datetimes (in
+# UTC), as timezone-aware datetimes or keeping them as strings
+DATETIME_MODE_NAIVE = "naive"
+DATETIME_MODE_AWARE = "aware"
+DATETIME_MODE_STRING = "string"
+DATETIME_MODES = (DATETIME_MODE_NAIVE, DATETIME_MODE_AWARE, DATETIME_MODE_STRING)
@@ -2,8 +2,9 @@
 Core module to house the Fintoc object of the Fintoc Python SDK.
 """
 
-from fintoc.client import Client
-from fintoc.constants import API_BASE_URL
+from fintoc.cache import ValidatorCache
+from fintoc.client import AsyncClient, Client
+from fintoc.constants import API_BASE_URL, DATETIME_MODE_NAIVE
 from fintoc.managers import (
     AccountsManager,
     ChargesManager,
@@ -38,13 +39,80 @@ class Fintoc:
 
     """Encapsulates the core object's behaviour and methods."""
 
-    def __init__(self, api_key, api_version=None, jws_private_key=None):
-        self._client = Client(
+    client_class = Client
+
+    # Every local is an option of the object, passed as a keyword argument
+    def __init__(  # pylint: disable=too-many-locals
+        self,
+        api_key,
+        api_version=None,
+        jws_private_key=None,
+        transport=None,
+        http_client=None,
+        retry_policy=None,
+        rate_limiter=None,
+        raw=False,
+        datetime_mode=DATETIME_MODE_NAIVE,
+        lazy_attributes=False,
+        compact=False,
+        journal=None,
+        coalesce_requests=False,
+        cache=None,
+        conditional_requests=False,
+        history=None,
+        page_concurrency=1,
+    ):
+        """
+        :transport: can be a TransportConfig to give the object its own
+        connection pool, while :http_client: can be an httpx client to be
+        shared explicitly between objects. By default, every object shares
+        the default pool of the SDK (asynchronous objects build their own
+        default pool for each event loop). :retry_policy: can be a RetryPolicy to
+        retry failed requests and :rate_limiter: can be a RateLimiter (that
+        can be shared between objects) to pace the requests. If :raw:, the
+        methods return the decoded JSON of the API instead of resources.
+        :datetime_mode: specifies how datetimes get objetized: as naive
+        datetimes (in UTC), as timezone-aware datetimes or as strings.
+        :lazy_attributes: makes the resources keep the data returned by the
+        API and objetize each attribute only when it gets accessed.
+        :compact: makes the movements, transfers, payment intents and
+        accounts get built as compact records, which use less memory.
+        :journal: can be a Journal that durably records every POST request
+        before sending it, so that it can be replayed after a crash. If
+        :coalesce_requests:, identical GET requests made at the same time
+        share a single request, whose response gets copied for each caller.
+        :cache: can be a ResponseCache that keeps the responses of GET
+        requests (that can be shared between objects). If
+        :conditional_requests:, GET requests send the validators of their
+        last response, which gets reused when the server answers that it
+        did not change. :history: can be a HistoryStore that keeps on disk
+        the movements, account statements, tax returns and invoices older
+        than its settlement window, which never change. When the API
+        exposes numbered pages, up to :page_concurrency: pages of a list
+        get fetched at the same time.
+        """
+        self._client = self.client_class(
             base_url=f"{API_BASE_URL}",
             api_key=api_key,
             api_version=api_version,
             user_agent=f"fintoc-python/{__version__}",
             jws_private_key=jws_private_key,
+            http_client=http_client,
+            transport=transport,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            raw=raw,
+            datetime_mode=datetime_mode,
+            lazy_attributes=lazy_attributes,
+            compact=compact,
+            journal=journal,
+            single_flight=(
+                self.client_class.single_flight_class() if coalesce_requests else None
+            ),
+            cache=cache,
+            validators=ValidatorCache() if conditional_requests else None,
+            history=history,
+            page_concurrency=page_concurrency,
         )
         self.charges = ChargesManager("/v1/charges", self._client)
         self.checkout_sessions = CheckoutSessionsManager(
@@ -73,6 +141,28 @@ class Fintoc:
 
         self.v2 = _FintocV2(self._client)
 
+    def replay_journal(self, concurrency=1):
+        """
+        Send again every request left pending on the journal of the object,
+        with the same body and idempotency key.
+        """
+        return self._client.replay_journal(concurrency=concurrency)
+
+    def close(self):
+        """Close the connection pool of the object, if it owns one."""
+        return self._client.close()
+
+
+class AsyncFintoc(Fintoc):
+
+    """
+    Encapsulates the core object's behaviour and methods, using an
+    asynchronous client. Every manager method returns an awaitable,
+    except for :list:, which returns an asynchronous generator.
+    """
+
+    client_class = AsyncClient
+
 
 class _FintocV2:
     def __init__(self, client):
@@ -45,3 +45,7 @@ class InvalidRequestError(FintocError):
 
 class WebhookSignatureError(Exception):
     """Exception raised for webhook signature validation errors."""
+
+
+class RateLimitExceededError(Exception):
+    """Exception raised when the client-side rate limiter has no tokens left."""
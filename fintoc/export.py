@@ -0,0 +1,137 @@
+"""
+Module to hold the exporters, that stream every instance listed by a
+manager into NDJSON or CSV files without objetizing them.
+"""
+
+import csv
+import gzip
+import io
+import json
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+# Extensions used to infer the export format from the name of a file
+_FORMAT_EXTENSIONS = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+}
+
+# Size of the buffer used when writing to files
+_BUFFER_SIZE = 1024 * 1024
+
+
+def resolve_manager(fintoc, resource):
+    """
+    Return the manager of :fintoc: named by the dotted :resource:, like
+    "payment_intents" or "v2.accounts.movements".
+    """
+    manager = fintoc
+    for name in resource.split("."):
+        if name.startswith("_") or not hasattr(manager, name):
+            raise ValueError(f"Unknown resource '{resource}'")
+        manager = getattr(manager, name)
+    if not hasattr(manager, "list"):
+        raise ValueError(f"Resource '{resource}' can not be listed")
+    return manager
+
+
+def infer_format(path):
+    """
+    Infer the export format from the extension of :path:, ignoring a
+    trailing ".gz". Return None if the extension is unknown.
+    """
+    path = path.lower()
+    if path.endswith(".gz"):
+        path = path[:-3]
+    for extension, format_ in _FORMAT_EXTENSIONS.items():
+        if path.endswith(extension):
+            return format_
+    return None
+
+
+def write_ndjson(elements, stream):
+    """
+    Write every element of :elements: to the text :stream: as a line of
+    JSON. Return the number of elements written.
+    """
+    count = 0
+    dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+    for element in elements:
+        stream.write(dumps(element))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(elements, stream, fields=None):
+    """
+    Write every element of :elements: to the text :stream: as a row of a
+    CSV file with a header. The columns are :fields:, defaulting to the
+    fields of the first element. Nested objects get encoded as JSON.
+    Return the number of elements written.
+    """
+    count = 0
+    writer = None
+    for element in elements:
+        if writer is None:
+            writer = csv.DictWriter(
+                stream, fieldnames=fields or list(element), extrasaction="ignore"
+            )
+            writer.writeheader()
+        writer.writerow(
+            {
+                key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                for key, value in element.items()
+            }
+        )
+        count += 1
+    return count
+
+
+def export(manager, stream, format_="ndjson", fields=None, **kwargs):
+    """
+    List every instance of the resource handled by :manager: and write it
+    to the text :stream:, as NDJSON or CSV. :fields: specifies the columns
+    of CSV exports, and :kwargs: are used to list the resource (including
+    the placeholders of the path of the manager). Return the number of
+    instances written.
+    """
+    if format_ not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid format '{format_}', use one of {EXPORT_FORMATS}")
+    elements = manager.list(raw=True, **kwargs)
+    if format_ == "csv":
+        return write_csv(elements, stream, fields=fields)
+    return write_ndjson(elements, stream)
+
+
+def open_export_file(path, compress=None):
+    """
+    Open the file at :path: to write an export, using a large buffer. The
+    file gets compressed with gzip when :compress: (defaulting to whether
+    the path ends with ".gz").
+    """
+    if compress is None:
+        compress = path.lower().endswith(".gz")
+    if compress:
+        return io.TextIOWrapper(
+            io.BufferedWriter(gzip.open(path, "wb"), buffer_size=_BUFFER_SIZE),
+            encoding="utf-8",
+            newline="",
+        )
+    return open(  # pylint: disable=consider-using-with
+        path, "w", encoding="utf-8", newline="", buffering=_BUFFER_SIZE
+    )
+
+
+def export_to_file(manager, path, format_=None, fields=None, compress=None, **kwargs):
+    """
+    Export every instance of the resource handled by :manager: to the file
+    at :path:. The format gets inferred from the extension of the file
+    unless :format_: is given, and the file gets compressed with gzip if
+    its name ends with ".gz" or :compress:. Return the number of instances
+    written.
+    """
+    format_ = format_ or infer_format(path) or "ndjson"
+    with open_export_file(path, compress=compress) as stream:
+        return export(manager, stream, format_=format_, fields=fields, **kwargs)
@@ -0,0 +1,113 @@
+"""
+Module to hold the movement feeds, that merge the movement streams of
+many accounts into a single chronological stream without loading them
+into memory.
+"""
+
+import heapq
+
+from fintoc.utils import parse_iso_datetime
+
+
+class _Reversed:
+
+    """Wraps a key to reverse its order, so a min-heap pops the greatest first."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+def get_date_key(date_field):
+    """
+    Return a function that gets the :date_field: of a movement (either a
+    resource or its decoded JSON). Datetime strings get parsed, as their
+    fractions of a second can have different precisions. Movements without
+    a date compare as older than every other one.
+    """
+
+    def key(element):
+        value = (
+            element.get(date_field)
+            if isinstance(element, dict)
+            else getattr(element, date_field, None)
+        )
+        if isinstance(value, str):
+            parsed = parse_iso_datetime(value)
+            if parsed is not None:
+                value = parsed
+        return (value is not None, value)
+
+    return key
+
+
+def merge_streams(streams, key, reverse=False):
+    """
+    Merge the :streams: (each one sorted by :key:, in descending order if
+    :reverse:) into a single sorted generator, holding a single element of
+    each stream at a time. Elements with the same key keep the order of
+    their streams.
+    """
+    return heapq.merge(*streams, key=key, reverse=reverse)
+
+
+async def _iterate(stream):
+    """
+    Wrap the asynchronous :stream: into an asynchronous generator, whose
+    elements can be awaited one at a time with asend.
+    """
+    async for element in stream:
+        yield element
+
+
+async def merge_streams_async(streams, key, reverse=False):
+    """
+    Merge the asynchronous :streams: into a single sorted asynchronous
+    generator, as merge_streams does.
+    """
+    wrap = _Reversed if reverse else (lambda value: value)
+    iterators = [_iterate(stream) for stream in streams]
+    heap = []
+    for index, iterator in enumerate(iterators):
+        try:
+            element = await iterator.asend(None)
+        except StopAsyncIteration:
+            continue
+        heap.append((wrap(key(element)), index, element))
+    heapq.heapify(heap)
+    while heap:
+        _, index, element = heap[0]
+        yield element
+        try:
+            following = await iterators[index].asend(None)
+        except StopAsyncIteration:
+            heapq.heappop(heap)
+            continue
+        heapq.heapreplace(heap, (wrap(key(following)), index, following))
+
+
+def merge_movements(sources, date_field="post_date", prefetch=0, **kwargs):
+    """
+    List the movements of every source lazily and merge them into a single
+    stream from the newest to the oldest (the order of the API), keeping
+    about one page of each source in memory (plus :prefetch: pages fetched
+    ahead). Each source can be a movements manager (like account.movements
+    in v1) or a (manager, params) pair (like (client.v2.accounts.movements,
+    {"account_id": "acc_123"}) in v2). :date_field: is the field used to
+    order the movements, and :kwargs: are used to list every source.
+    """
+    streams = []
+    for source in sources:
+        manager, params = source if isinstance(source, tuple) else (source, {})
+        streams.append(manager.list(prefetch=prefetch, **kwargs, **params))
+    key = get_date_key(date_field)
+    if any(hasattr(stream, "__aiter__") for stream in streams):
+        return merge_streams_async(streams, key, reverse=True)
+    return merge_streams(streams, key, reverse=True)
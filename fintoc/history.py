@@ -0,0 +1,180 @@
+"""
+Module to hold the history store, that keeps on disk the instances of the
+resources that never change once they are old enough (like the movements
+before the settlement window), so that listing them again only requests
+the newest ones from the API.
+"""
+
+import datetime
+import hashlib
+import json
+
+from fintoc.stores import SQLiteStore
+
+DEFAULT_SETTLEMENT_DAYS = 30
+
+
+def parse_date(value):
+    """
+    Return :value: (a date or a "YYYY-MM-DD" string) as a date, or None
+    if it is not a plain date (datetimes can not be split into days).
+    """
+    if isinstance(value, datetime.datetime):
+        return None
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, str) and len(value) == 10:
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def split_months(since, until):
+    """
+    Split the days between :since: and :until: (both included) into month
+    windows, returning (since, until) pairs from the newest to the oldest.
+    """
+    windows = []
+    start = since
+    while start <= until:
+        next_month = (start.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+        end = min(until, next_month - datetime.timedelta(days=1))
+        windows.append((start, end))
+        start = next_month
+    return windows[::-1]
+
+
+class HistoryStore(SQLiteStore):
+
+    """
+    Represents a store of immutable history in the SQLite database at
+    :path:, that can be shared between processes. The instances listed for
+    the months that ended before the day :settlement_days: ago are stored
+    in month windows, keyed by the URL and the parameters of the request,
+    and served from disk afterwards.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS history_windows (scope TEXT, "
+        "since TEXT, until TEXT, elements TEXT, stored_at TEXT, "
+        "PRIMARY KEY (scope, since, until))"
+    )
+
+    def __init__(self, path, settlement_days=DEFAULT_SETTLEMENT_DAYS):
+        super().__init__(path)
+        self.settlement_days = settlement_days
+
+    def cutoff(self):
+        """Return the first day whose instances may still change."""
+        today = datetime.datetime.utcnow().date()
+        return today - datetime.timedelta(days=self.settlement_days)
+
+    @staticmethod
+    def build_scope(url, params, api_key):
+        """
+        Build the key shared by the windows of a request to :url: with
+        :params: (ignoring the dates) for :api_key:, which does not include
+        the API key nor the parameters themselves.
+        """
+        params = {
+            key: value for key, value in params.items() if key not in ("since", "until")
+        }
+        canonical = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(f"{api_key}\n{url}\n{canonical}".encode()).hexdigest()
+
+    def plan(self, params):
+        """
+        Split the request with :params: into the parameters of the request
+        of the newest days (or None if there are none) and the month windows
+        of immutable history. Return None if the request can not be split,
+        because it has no plain dates.
+        """
+        since = parse_date(params.get("since"))
+        until = params.get("until")
+        if since is None or (until is not None and parse_date(until) is None):
+            return None
+        until = parse_date(until)
+        # Only the months that ended before the cutoff get stored, so that
+        # the windows keep their dates from one day to the next
+        month = self.cutoff().replace(day=1)
+        recent_params = None
+        if until is None or until >= month:
+            recent_params = {**params, "since": max(since, month).isoformat()}
+        last_day = month - datetime.timedelta(days=1)
+        if until is not None:
+            last_day = min(last_day, until)
+        return recent_params, split_months(since, last_day)
+
+    def get(self, scope, since, until):
+        """Return the instances stored for the window, or None if it is missing."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT elements FROM history_windows "
+                "WHERE scope = ? AND since = ? AND until = ?",
+                (scope, since.isoformat(), until.isoformat()),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def set(self, scope, since, until, elements):
+        """Store the :elements: listed for the window."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO history_windows VALUES (?, ?, ?, ?, ?)",
+                (
+                    scope,
+                    since.isoformat(),
+                    until.isoformat(),
+                    json.dumps(elements, separators=(",", ":")),
+                    datetime.datetime.utcnow().isoformat(),
+                ),
+            )
+
+    def clear(self):
+        """Remove every stored window."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM history_windows")
+
+
+def _window_params(params, since, until):
+    return {**params, "since": since.isoformat(), "until": until.isoformat()}
+
+
+def iterate_history(store, scope, params, fetch):
+    """
+    Return a generator with every instance listed by the request with
+    :params:, getting the days that may still change using :fetch: (that
+    receives the params and returns an iterable) and the month windows of
+    history from :store:, fetching (and storing) the missing ones.
+    """
+    recent_params, windows = store.plan(params)
+    if recent_params is not None:
+        yield from fetch(recent_params)
+    for since, until in windows:
+        elements = store.get(scope, since, until)
+        if elements is None:
+            elements = list(fetch(_window_params(params, since, until)))
+            store.set(scope, since, until, elements)
+        yield from elements
+
+
+async def iterate_history_async(store, scope, params, fetch):
+    """
+    Return an asynchronous generator with every instance listed by the
+    request with :params:, as iterate_history does for a :fetch: that
+    returns an asynchronous iterable.
+    """
+    recent_params, windows = store.plan(params)
+    if recent_params is not None:
+        async for element in fetch(recent_params):
+            yield element
+    for since, until in windows:
+        elements = store.get(scope, since, until)
+        if elements is None:
+            elements = [
+                element async for element in fetch(_window_params(params, since, until))
+            ]
+            store.set(scope, since, until, elements)
+        for element in elements:
+            yield element
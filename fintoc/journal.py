@@ -0,0 +1,213 @@
+"""
+Module to hold the request journals, that durably record every POST
+request before sending it, so that the requests interrupted by a crash
+can be replayed with the same idempotency key.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import threading
+import uuid
+from abc import ABCMeta, abstractmethod
+
+from fintoc.stores import SQLiteStore
+
+
+def hash_body(body):
+    """Return the SHA-256 hex digest of the :body: string."""
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def is_settled(status_code):
+    """
+    Return whether a response with :status_code: settles the outcome of a
+    request: a success, or a client error other than 429 (Too Many
+    Requests). Server errors leave it unknown and 429s ask to send the
+    request again, so their requests must be replayed.
+    """
+    if status_code == 429:
+        return False
+    return 200 <= status_code < 300 or 400 <= status_code < 500
+
+
+class JournalEntry:
+
+    """Represents a request recorded in a journal."""
+
+    __slots__ = (
+        "id",
+        "method",
+        "url",
+        "body",
+        "body_hash",
+        "idempotency_key",
+        "created_at",
+    )
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, id_, method, url, body, body_hash, idempotency_key, created_at):
+        self.id = id_
+        self.method = method
+        self.url = url
+        self.body = body
+        self.body_hash = body_hash
+        self.idempotency_key = idempotency_key
+        self.created_at = created_at
+
+    @classmethod
+    def from_request(cls, request):
+        """Build an entry for the httpx :request:."""
+        body = request.content.decode("utf-8")
+        return cls(
+            id_=uuid.uuid4().hex,
+            method=request.method,
+            url=str(request.url),
+            body=body,
+            body_hash=hash_body(body),
+            idempotency_key=request.headers.get("Idempotency-Key"),
+            created_at=datetime.datetime.utcnow().isoformat(),
+        )
+
+    @property
+    def json(self):
+        """The decoded JSON body of the request."""
+        return json.loads(self.body) if self.body else None
+
+    def is_intact(self):
+        """Whether the body of the entry still matches its hash."""
+        return hash_body(self.body) == self.body_hash
+
+    def to_dict(self):
+        """Return the entry as a dictionary."""
+        return {
+            "id": self.id,
+            "method": self.method,
+            "url": self.url,
+            "body": self.body,
+            "body_hash": self.body_hash,
+            "idempotency_key": self.idempotency_key,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build an entry from a dictionary returned by :to_dict:."""
+        data = dict(data)
+        return cls(id_=data.pop("id"), **data)
+
+    def __repr__(self):
+        return f"JournalEntry(id={self.id!r}, method={self.method!r}, url={self.url!r})"
+
+
+class Journal(metaclass=ABCMeta):
+
+    """
+    Represents a journal. Entries get recorded right before their request
+    is sent and completed once a response settles its outcome, so the
+    pending entries are the requests whose outcome is unknown.
+    """
+
+    @abstractmethod
+    def record(self, entry):
+        """Durably record the :entry: as pending."""
+
+    @abstractmethod
+    def complete(self, entry_id, status_code):
+        """Mark the entry :entry_id: as completed with :status_code:."""
+
+    @abstractmethod
+    def pending(self):
+        """Return the pending entries, in the order in which they were recorded."""
+
+    def close(self):
+        """Release the resources held by the journal."""
+
+
+class SQLiteJournal(SQLiteStore, Journal):
+
+    """Represents a journal stored in the SQLite database at :path:."""
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS journal_entries ("
+        "id TEXT PRIMARY KEY, method TEXT, url TEXT, body TEXT, "
+        "body_hash TEXT, idempotency_key TEXT, created_at TEXT, "
+        "status_code INTEGER, completed_at TEXT)"
+    )
+
+    def record(self, entry):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO journal_entries (id, method, url, body, body_hash, "
+                "idempotency_key, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.id,
+                    entry.method,
+                    entry.url,
+                    entry.body,
+                    entry.body_hash,
+                    entry.idempotency_key,
+                    entry.created_at,
+                ),
+            )
+
+    def complete(self, entry_id, status_code):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE journal_entries SET status_code = ?, completed_at = ? "
+                "WHERE id = ?",
+                (status_code, datetime.datetime.utcnow().isoformat(), entry_id),
+            )
+
+    def pending(self):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, method, url, body, body_hash, idempotency_key, "
+                "created_at FROM journal_entries WHERE completed_at IS NULL "
+                "ORDER BY rowid"
+            ).fetchall()
+        return [JournalEntry(*row) for row in rows]
+
+
+class FileJournal(Journal):
+
+    """
+    Represents a journal stored in the append-only file at :path:, with
+    a line of JSON for each event. Every event gets flushed to disk before
+    returning.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _append(self, event):
+        line = json.dumps(event, separators=(",", ":")) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def record(self, entry):
+        self._append({"event": "record", **entry.to_dict()})
+
+    def complete(self, entry_id, status_code):
+        self._append({"event": "complete", "id": entry_id, "status_code": status_code})
+
+    def pending(self):
+        if not os.path.exists(self.path):
+            return []
+        entries = {}
+        with self._lock, open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash while it was being written
+                    continue
+                if event.pop("event") == "record":
+                    entries[event["id"]] = JournalEntry.from_dict(event)
+                else:
+                    entries.pop(event["id"], None)
+        return list(entries.values())
@@ -9,3 +9,4 @@ class InvoicesManager(ManagerMixin):
 
     resource = "invoice"
     methods = ["list"]
+    immutable_history = True
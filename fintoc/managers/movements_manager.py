@@ -1,11 +1,8 @@
 """Module to hold the movements manager."""
 
-from fintoc.mixins import ManagerMixin
+from fintoc.mixins import MovementsMixin
 
 
-class MovementsManager(ManagerMixin):
+class MovementsManager(MovementsMixin):
 
     """Represents a movements manager."""
-
-    resource = "movement"
-    methods = ["list", "get"]
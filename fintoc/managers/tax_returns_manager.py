@@ -9,3 +9,4 @@ class TaxReturnsManager(ManagerMixin):
 
     resource = "tax_return"
     methods = ["list", "get"]
+    immutable_history = True
@@ -9,3 +9,4 @@ class AccountStatementsManager(ManagerMixin):
 
     resource = "account_statement"
     methods = ["list"]
+    immutable_history = True
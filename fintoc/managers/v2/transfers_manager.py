@@ -1,5 +1,8 @@
 """Module to hold the transfers manager."""
 
+from collections.abc import Mapping
+
+from fintoc.batch import CREATED, DEFAULT_CONCURRENCY, build_idempotency_key
 from fintoc.mixins import ManagerMixin
 
 
@@ -7,7 +10,45 @@ class TransfersManager(ManagerMixin):
     """Represents a transfers manager."""
 
     resource = "transfer"
-    methods = ["list", "get", "create", "return_"]
+    methods = ["list", "get", "create", "return_", "create_many"]
+
+    def _create_many(
+        self,
+        items,
+        batch_id=None,
+        concurrency=DEFAULT_CONCURRENCY,
+        idempotency_key_fn=None,
+        **kwargs,
+    ):
+        """
+        Create a transfer for each dictionary of :items: (a list, or a
+        mapping of keys to dictionaries), sending at most :concurrency: of
+        them at the same time. Each transfer uses the idempotency key
+        returned by :idempotency_key_fn: for its params or, by default, one
+        derived from :batch_id:, the key of its item and its params, so
+        running a batch again never duplicates the transfers already
+        created. The result is a BatchResult with the transfer (or the
+        error raised) for the key (or index) of each item, whose status is
+        created, failed or retryable. :kwargs: are passed to every :create:
+        call.
+        """
+        if batch_id is None and idempotency_key_fn is None:
+            raise ValueError(
+                "Creating many transfers requires a batch_id or an idempotency_key_fn"
+            )
+        items = dict(items) if isinstance(items, Mapping) else dict(enumerate(items))
+
+        def create(key):
+            params = {**kwargs, **items[key]}
+            if idempotency_key_fn is not None:
+                idempotency_key = idempotency_key_fn(params)
+            else:
+                idempotency_key = build_idempotency_key(batch_id, key, params)
+            return self._create(idempotency_key=idempotency_key, **params)
+
+        return self._client.batch_runner(
+            create, list(items), concurrency=concurrency, success_status=CREATED
+        )
 
     def _return_(self, **kwargs):
         """Return a transfer."""
@@ -1,4 +1,6 @@
 """Init file for the mixins module of the SDK."""
 
 from .manager_mixin import ManagerMixin
+from .movements_mixin import MovementsMixin
+from .record_mixin import RecordContext, RecordMixin
 from .resource_mixin import ResourceMixin
@@ -1,22 +1,39 @@
 """Module to hold the mixin for the managers."""
 
+import functools
 from abc import ABCMeta, abstractmethod
 
+from fintoc.batch import DEFAULT_CONCURRENCY
+from fintoc.records import get_record_class
 from fintoc.resource_handlers import (
     resource_create,
     resource_delete,
     resource_get,
     resource_list,
+    resource_list_pages,
     resource_update,
     resource_upload,
 )
-from fintoc.utils import can_raise_fintoc_error, deprecate, get_resource_class
+from fintoc.utils import (
+    build_objetizer,
+    can_raise_fintoc_error,
+    deprecate,
+    get_resource_class,
+    then,
+)
 
 
 class ManagerMixin(metaclass=ABCMeta):  # pylint: disable=no-self-use
 
     """Represents the mixin for the managers."""
 
+    # Methods that are available whenever the manager has another method
+    derived_methods = {"all": "list", "list_pages": "list", "get_many": "get"}
+
+    # Whether the instances never change once they are old enough, so that
+    # listing them can be served from the history store of the client
+    immutable_history = False
+
     def __init__(self, path, client):
         self._path = path
         self._client = client
@@ -27,8 +44,8 @@ class ManagerMixin(metaclass=ABCMeta):  # pylint: disable=no-self-use
 
     def __getattr__(self, attr):
         if attr not in self.__class__.methods:
-            if attr == "all" and "list" in self.__class__.methods:
-                return getattr(self, "_all")
+            if self.derived_methods.get(attr) in self.__class__.methods:
+                return getattr(self, f"_{attr}")
             raise AttributeError(
                 f"{self.__class__.__name__} has no attribute '{attr.lstrip('_')}'"
             )
@@ -54,12 +71,15 @@ class ManagerMixin(metaclass=ABCMeta):  # pylint: disable=no-self-use
         """
 
     @can_raise_fintoc_error
-    def _list(self, **kwargs):
+    def _list(self, raw=None, compact=None, **kwargs):
         """
         List all instances of the resource being handled by the manager.
+        Pass :raw: to get the decoded JSON of each instance instead, or
+        :compact: to get compact records.
         :kwargs: can be used to filter the results, using the API parameters.
         """
-        klass = get_resource_class(self.__class__.resource)
+        raw = self._is_raw(raw)
+        klass = self._get_resource_class(compact)
         objects = resource_list(
             client=self._client,
             path=self._build_path(**kwargs),
@@ -67,8 +87,32 @@ class ManagerMixin(metaclass=ABCMeta):  # pylint: disable=no-self-use
             handlers=self._handlers,
             methods=self.__class__.methods,
             params=kwargs,
+            raw=raw,
+            history=self.__class__.immutable_history,
+        )
+        if raw:
+            return objects
+        return then(objects, functools.partial(self.post_list_handler, **kwargs))
+
+    @can_raise_fintoc_error
+    def _list_pages(self, raw=None, compact=None, **kwargs):
+        """
+        List all instances of the resource being handled by the manager,
+        returning a generator with each page returned by the API. Pass
+        :raw: to get the elements of each page without objetizing them,
+        or :compact: to get them as compact records.
+        :kwargs: can be used to filter the results, using the API parameters.
+        """
+        klass = self._get_resource_class(compact)
+        return resource_list_pages(
+            client=self._client,
+            path=self._build_path(**kwargs),
+            klass=klass,
+            handlers=self._handlers,
+            methods=self.__class__.methods,
+            params=kwargs,
+            raw=self._is_raw(raw),
         )
-        return self.post_list_handler(objects, **kwargs)
 
     @deprecate(
         "all() is deprecated and will be removed in a future version. Use "
@@ -82,12 +126,14 @@ class ManagerMixin(metaclass=ABCMeta):  # pylint: disable=no-self-use
         return self._list(**kwargs)
 
     @can_raise_fintoc_error
-    def _get(self, identifier, **kwargs):
+    def _get(self, identifier, raw=None, compact=None, **kwargs):
         """
         Return an instance of the resource being handled by the manager,
-        identified by :identifier:.
+        identified by :identifier:. Pass :raw: to get the decoded JSON of
+        the instance instead, or :compact: to get a compact record.
         """
-        klass = get_resource_class(self.__class__.resource)
+        raw = self._is_raw(raw)
+        klass = self._get_resource_class(compact)
         object_ = resource_get(
             client=self._client,
             path=self._build_path(**kwargs),
@@ -96,15 +142,37 @@ class ManagerMixin(metaclass=ABCMeta):  # pylint: disable=no-self-use
             handlers=self._handlers,
             methods=self.__class__.methods,
             params=kwargs,
+            raw=raw,
+        )
+        if raw:
+            return object_
+        return then(
+            object_,
+            lambda object_: self.post_get_handler(object_, identifier, **kwargs),
+        )
+
+    def _get_many(self, identifiers, concurrency=DEFAULT_CONCURRENCY, **kwargs):
+        """
+        Return the instances of the resource identified by :identifiers:,
+        fetching at most :concurrency: of them at the same time. The result
+        is a BatchResult with the instance (or the error raised) for each
+        identifier, in the order in which they were given. :kwargs: are
+        passed to every :get: call.
+        """
+        return self._client.batch_runner(
+            functools.partial(self._get, **kwargs),
+            identifiers,
+            concurrency=concurrency,
         )
-        return self.post_get_handler(object_, identifier, **kwargs)
 
     @can_raise_fintoc_error
-    def _create(self, idempotency_key=None, path_=None, **kwargs):
+    def _create(self, idempotency_key=None, path_=None, raw=None, **kwargs):
         """
         Create an instance of the resource being handled by the manager.
-        Data is passed using :kwargs:, as specified by the API.
+        Data is passed using :kwargs:, as specified by the API. Pass :raw:
+        to get the decoded JSON of the instance created instead.
         """
+        raw = self._is_raw(raw)
         klass = get_resource_class(self.__class__.resource)
         path = path_ if path_ else self._build_path(**kwargs)
         object_ = resource_create(
@@ -115,8 +183,11 @@ class ManagerMixin(metaclass=ABCMeta):  # pylint: disable=no-self-use
             methods=self.__class__.methods,
             params=kwargs,
             idempotency_key=idempotency_key,
+            raw=raw,
         )
-        return self.post_create_handler(object_, **kwargs)
+        if raw:
+            return object_
+        return then(object_, functools.partial(self.post_create_handler, **kwargs))
 
     @can_raise_fintoc_error
     def _upload(self, path, files):
@@ -148,7 +219,10 @@ class ManagerMixin(metaclass=ABCMeta):  # pylint: disable=no-self-use
             params=kwargs,
             custom_path=custom_path,
         )
-        return self.post_update_handler(object_, identifier, **kwargs)
+        return then(
+            object_,
+            lambda object_: self.post_update_handler(object_, identifier, **kwargs),
+        )
 
     @can_raise_fintoc_error
     def _delete(self, identifier, **kwargs):
@@ -156,13 +230,43 @@ class ManagerMixin(metaclass=ABCMeta):  # pylint: disable=no-self-use
         Delete an instance of the resource being handled by the manager,
         identified by :identifier:.
         """
-        resource_delete(
+        response = resource_delete(
             client=self._client,
             path=self._build_path(**kwargs),
             id_=identifier,
             params=kwargs,
         )
-        return self.post_delete_handler(identifier, **kwargs)
+        return then(response, lambda _: self.post_delete_handler(identifier, **kwargs))
+
+    def _is_raw(self, raw):
+        """Return whether to skip objetization, defaulting to the client mode."""
+        return self._client.raw if raw is None else raw
+
+    def _get_resource_class(self, compact=None):
+        """
+        Return the class used to objetize the resource, which is its compact
+        record when :compact: (defaulting to the client mode) and the
+        resource has one.
+        """
+        resource = self.__class__.resource
+        if self._client.compact if compact is None else compact:
+            record_class = get_record_class(resource)
+            if record_class is not None:
+                return record_class
+        return get_resource_class(resource)
+
+    def _objetizer(self, compact=None, **kwargs):
+        """
+        Return a function that objetizes the decoded JSON of the instances
+        of the resource, as listing them with :kwargs: would.
+        """
+        return build_objetizer(
+            self._get_resource_class(compact),
+            self._client,
+            handlers=self._handlers,
+            methods=self.__class__.methods,
+            path=self._build_path(**kwargs),
+        )
 
     def _build_path(self, **kwargs):
         """
@@ -0,0 +1,37 @@
+"""Module to hold the mixin for the movements managers."""
+
+from fintoc.columns import MOVEMENT_COLUMNS, build_column_table
+from fintoc.mixins.manager_mixin import ManagerMixin
+from fintoc.shards import list_shards
+
+
+class MovementsMixin(ManagerMixin):
+
+    """Represents the mixin for the movements managers."""
+
+    resource = "movement"
+    methods = ["list", "get", "list_columns"]
+    immutable_history = True
+
+    def _list(self, raw=None, compact=None, shards=None, concurrency=None, **kwargs):
+        """
+        List all the movements. Pass :shards: to split the interval between
+        "since" and "until" (defaulting to now) into that many windows,
+        which get paginated using up to :concurrency: connections at the
+        same time and merged back in order.
+        """
+        if shards is None:
+            return super()._list(raw=raw, compact=compact, **kwargs)
+        return list_shards(
+            self, shards, concurrency=concurrency, raw=raw, compact=compact, **kwargs
+        )
+
+    def _list_columns(self, columns=None, output=None, **kwargs):
+        """
+        List all the movements into a ColumnTable, that stores each field of
+        :columns: (defaulting to MOVEMENT_COLUMNS) in a compact buffer,
+        without building an object for each movement. Pass "numpy" or
+        "arrow" as :output: to get NumPy arrays or a PyArrow table instead.
+        """
+        pages = self._list_pages(raw=True, **kwargs)
+        return build_column_table(pages, columns or MOVEMENT_COLUMNS, output)
@@ -0,0 +1,138 @@
+"""Module to hold the mixin for the compact records."""
+
+from fintoc.mixins.resource_mixin import ResourceMethodsMixin, ResourceMixin, has_method
+from fintoc.utils import serialize
+
+
+class RecordContext:
+
+    """
+    Holds the client, handlers, methods and path shared by every record
+    built from the same request, so that each record only keeps a
+    reference to it.
+    """
+
+    __slots__ = ("client", "handlers", "methods", "path")
+
+    def __init__(self, client, handlers, methods, path):
+        self.client = client
+        self.handlers = handlers
+        self.methods = methods
+        self.path = path
+
+
+class RecordMixin(ResourceMethodsMixin):
+
+    """
+    Represents the mixin for the compact records. Records behave like the
+    resources of their :resource_class:, but keep the fields of their
+    schema in slots instead of a dictionary. Fields outside of the schema
+    are kept in a separate dictionary.
+    """
+
+    __slots__ = ("_context", "_extra")
+
+    resource_class = ResourceMixin
+    resource_identifier = "id"
+    fields = frozenset()
+
+    def __init__(self, client, handlers, methods, path, **kwargs):
+        self._set_fields(RecordContext(client, handlers, methods, path), kwargs)
+
+    @classmethod
+    def objetizer(cls, client, handlers, methods, path):
+        """
+        Return a function that builds records from decoded JSON, sharing a
+        single context between every record it builds.
+        """
+        context = RecordContext(client, handlers, methods, path)
+
+        def build(data):
+            record = cls.__new__(cls)
+            record._set_fields(context, data)  # pylint: disable=protected-access
+            return record
+
+        return build
+
+    def _set_fields(self, context, data):
+        self._context = context
+        self._extra = None
+        fields = self.__class__.fields
+        for key, value in data.items():
+            value = self._objetize_attribute(key, value)
+            if key in fields:
+                setattr(self, key, value)
+            else:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
+
+    @classmethod
+    def get_field_resource(cls, key, is_list=False):
+        """Return the name of the resource held by the field :key:."""
+        return cls.resource_class.get_field_resource(key, is_list=is_list)
+
+    @property
+    def _client(self):
+        return self._context.client
+
+    @property
+    def _handlers(self):
+        return self._context.handlers
+
+    @property
+    def _methods(self):
+        return self._context.methods
+
+    @property
+    def _path(self):
+        return self._context.path
+
+    def __getattr__(self, attr):
+        if attr in ("_context", "_extra"):
+            raise AttributeError(attr)
+        if self._extra is not None and attr in self._extra:
+            return self._extra[attr]
+        if not has_method(self._methods, attr):
+            raise AttributeError(
+                f"{self.__class__.__name__} has no attribute '{attr.lstrip('_')}'"
+            )
+        return getattr(self, f"_{attr}")
+
+    def _items(self):
+        """Return the (field, value) pairs held by the record."""
+        items = []
+        for key in self.__class__.__slots__:
+            try:
+                items.append((key, getattr(self, key)))
+            except AttributeError:
+                pass
+        if self._extra is not None:
+            items.extend(self._extra.items())
+        return items
+
+    def serialize(self):
+        """Serialize the record."""
+        return {
+            key: (
+                [serialize(x) for x in value]
+                if isinstance(value, list)
+                else serialize(value)
+            )
+            for key, value in self._items()
+        }
+
+    def _post_update(self, object_, id_, **kwargs):
+        object_ = self._handlers.get("update")(object_, id_, **kwargs)
+        return self._replace_attributes(object_)
+
+    def _replace_attributes(self, object_):
+        """Replace the fields of the record with those of :object_:."""
+        for key in self.__class__.__slots__:
+            try:
+                setattr(self, key, getattr(object_, key))
+            except AttributeError:
+                if hasattr(self, key):
+                    delattr(self, key)
+        self._extra = object_._extra  # pylint: disable=protected-access
+        return self
@@ -2,17 +2,121 @@
 
 from abc import ABCMeta
 
+from fintoc.constants import DATETIME_MODE_NAIVE
 from fintoc.resource_handlers import resource_delete, resource_update
 from fintoc.utils import (
     can_raise_fintoc_error,
     get_resource_class,
     objetize,
+    objetize_string,
     serialize,
     singularize,
+    then,
 )
 
+# Caches the name of the resource held by each field of each resource class,
+# keyed by the class, the name of the field and whether it holds a list.
+_FIELD_RESOURCES = {}
 
-class ResourceMixin(metaclass=ABCMeta):
+# Methods of the resources that are available when their manager has the
+# method they rely on
+DERIVED_METHODS = {"refresh": "get"}
+
+
+def has_method(methods, attr):
+    """Return whether a resource with :methods: has the method :attr:."""
+    return attr in methods or DERIVED_METHODS.get(attr, attr) in methods
+
+
+class ResourceMethodsMixin:
+
+    """
+    Represents the methods shared by the resources and the compact records,
+    that get their client, handlers, methods and path from the subclasses.
+    """
+
+    __slots__ = ()
+
+    def _objetize_attribute(self, key, value):
+        """Objetize the :value: of the attribute :key: of the resource."""
+        client = self._client
+        datetime_mode = getattr(client, "datetime_mode", DATETIME_MODE_NAIVE)
+        if isinstance(value, dict):
+            klass = get_resource_class(self.get_field_resource(key), value)
+            return objetize(klass, client, value)
+        if isinstance(value, list):
+            element = {} if not value else value[0]
+            if isinstance(element, str):
+                return [objetize_string(x, datetime_mode) for x in value]
+            klass = get_resource_class(
+                self.get_field_resource(key, is_list=True), value=element
+            )
+            return [objetize(klass, client, x) for x in value]
+        if isinstance(value, str):
+            return objetize_string(value, datetime_mode)
+        return value
+
+    @can_raise_fintoc_error
+    def _update(self, path_=None, **kwargs):
+        """Update the resource."""
+        id_ = getattr(self, self.__class__.resource_identifier)
+        custom_path = path_ if path_ else None
+        object_ = resource_update(
+            client=self._client,
+            path=self._path,
+            id_=id_,
+            klass=self.__class__,
+            handlers=self._handlers,
+            methods=self._methods,
+            params=kwargs,
+            custom_path=custom_path,
+        )
+        return then(object_, lambda object_: self._post_update(object_, id_, **kwargs))
+
+    @can_raise_fintoc_error
+    def _refresh(self):
+        """
+        Fetch the resource again, updating it in place. If the client makes
+        conditional requests and the resource did not change, it gets
+        returned untouched, without parsing nor objetizing its data.
+        """
+        if self._path is None:
+            raise ValueError(
+                f"{self.__class__.__name__} can not be refreshed, as it was not "
+                "fetched from its own endpoint"
+            )
+        id_ = getattr(self, self.__class__.resource_identifier)
+        data = self._client.request(f"{self._path}/{id_}", not_modified=self)
+        return then(data, self._post_refresh)
+
+    def _post_refresh(self, data):
+        if data is self:
+            return self
+        object_ = objetize(
+            self.__class__,
+            self._client,
+            data,
+            handlers=self._handlers,
+            methods=self._methods,
+            path=self._path,
+        )
+        return self._replace_attributes(object_)
+
+    @can_raise_fintoc_error
+    def _delete(self, **kwargs):
+        identifier = getattr(self, self.__class__.resource_identifier)
+        response = resource_delete(
+            client=self._client,
+            path=self._path,
+            id_=self.id,
+            params=kwargs,
+        )
+        return then(
+            response, lambda _: self._handlers.get("delete")(identifier, **kwargs)
+        )
+
+
+class ResourceMixin(ResourceMethodsMixin, metaclass=ABCMeta):
 
     """Represents the mixin for the resources."""
 
@@ -25,67 +129,78 @@ class ResourceMixin(metaclass=ABCMeta):
         self._methods = methods
         self._path = path
         self._attributes = []
+        self._raw = None
+        lazy = getattr(client, "lazy_attributes", False)
+        if lazy:
+            # Keep the raw data and only objetize each attribute when it gets
+            # accessed, except for those that would shadow class attributes
+            self._raw = kwargs
 
         for key, value in kwargs.items():
-            try:
-                resource = self.__class__.mappings.get(key, key)
-                if isinstance(value, list):
-                    resource = singularize(resource)
-                    element = {} if not value else value[0]
-                    klass = get_resource_class(resource, value=element)
-                    setattr(self, key, [objetize(klass, client, x) for x in value])
-                else:
-                    klass = get_resource_class(resource, value=value)
-                    setattr(self, key, objetize(klass, client, value))
+            if lazy and not hasattr(self.__class__, key):
                 self._attributes.append(key)
-            except NameError:  # pragma: no cover
-                pass
+                continue
+            try:
+                setattr(self, key, self._objetize_attribute(key, value))
+            except NameError:
+                # The attribute corresponds to a manager of the resource
+                continue
+            self._attributes.append(key)
+
+    @classmethod
+    def get_field_resource(cls, key, is_list=False):
+        """
+        Return the name of the resource held by the field :key:, using the
+        mappings of the class. The result gets cached for every class.
+        """
+        cache_key = (cls, key, is_list)
+        resource = _FIELD_RESOURCES.get(cache_key)
+        if resource is None:
+            resource = cls.mappings.get(key, key)
+            if is_list:
+                resource = singularize(resource)
+            _FIELD_RESOURCES[cache_key] = resource
+        return resource
 
     def __getattr__(self, attr):
-        if attr not in self._methods:
+        raw = self.__dict__.get("_raw")
+        if raw is not None and attr in raw:
+            value = self._objetize_attribute(attr, raw[attr])
+            self.__dict__[attr] = value
+            return value
+        if not has_method(self._methods, attr):
             raise AttributeError(
                 f"{self.__class__.__name__} has no attribute '{attr.lstrip('_')}'"
             )
         return getattr(self, f"_{attr}")
 
     def serialize(self):
-        """Serialize the resource."""
+        """
+        Serialize the resource. The attributes that have not been accessed
+        yet on lazy resources get returned untouched.
+        """
         serialized = {}
         for key in self._attributes:
+            if key not in self.__dict__:
+                serialized[key] = self._raw[key]
+                continue
             element = (
                 [serialize(x) for x in self.__dict__[key]]
                 if isinstance(self.__dict__[key], list)
                 else serialize(self.__dict__[key])
             )
-            serialized = {**serialized, key: element}
+            serialized[key] = element
         return serialized
 
-    @can_raise_fintoc_error
-    def _update(self, path_=None, **kwargs):
-        """Update the resource."""
-        id_ = getattr(self, self.__class__.resource_identifier)
-        custom_path = path_ if path_ else None
-        object_ = resource_update(
-            client=self._client,
-            path=self._path,
-            id_=id_,
-            klass=self.__class__,
-            handlers=self._handlers,
-            methods=self._methods,
-            params=kwargs,
-            custom_path=custom_path,
-        )
+    def _post_update(self, object_, id_, **kwargs):
         object_ = self._handlers.get("update")(object_, id_, **kwargs)
+        return self._replace_attributes(object_)
+
+    def _replace_attributes(self, object_):
+        """Replace the attributes of the resource with those of :object_:."""
+        if self._raw is not None:
+            # Drop the attributes objetized from the outdated raw data
+            for key in self._attributes:
+                self.__dict__.pop(key, None)
         self.__dict__.update(object_.__dict__)
         return self
-
-    @can_raise_fintoc_error
-    def _delete(self, **kwargs):
-        identifier = getattr(self, self.__class__.resource_identifier)
-        resource_delete(
-            client=self._client,
-            path=self._path,
-            id_=self.id,
-            params=kwargs,
-        )
-        return self._handlers.get("delete")(identifier, **kwargs)
@@ -1,11 +1,26 @@
 """Module to hold every utility used for pagination purposes."""
 
+import asyncio
+import base64
+import collections
+import itertools
+import json
+import queue
 import re
+import threading
+import urllib
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 
 import httpx
 
 from fintoc.constants import LINK_HEADER_PATTERN
+from fintoc.retry import send_with_retries, send_with_retries_async
+
+_PAGE = "page"
+_DONE = "done"
+_ERROR = "error"
+_PREFETCH_POLL_INTERVAL = 0.1
 
 
 def paginate(
@@ -13,41 +28,448 @@ def paginate(
     url: str,
     params: dict[str, str] = {},
     headers: dict[str, str] = {},
+    retry_policy=None,
+    rate_limiter=None,
+    prefetch=0,
+    page_concurrency=1,
 ):
     """
     Fetch a paginated resource and return a generator with all of
-    its instances.
+    its instances. If :prefetch: is set, up to that many pages get
+    fetched ahead on a background thread while the current one is
+    being consumed. :page_concurrency: is the amount of pages fetched at
+    the same time when the API exposes numbered pages.
     """
-    response = request(client, url, params=params, headers=headers)
-    elements = response["elements"]
-    for element in elements:
-        yield element
-    while response.get("next"):
-        response = request(client, response.get("next"), headers=headers)
-        elements = response["elements"]
-        for element in elements:
+    pages = paginate_pages(
+        client,
+        url,
+        params=params,
+        headers=headers,
+        retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
+        page_concurrency=page_concurrency,
+    )
+    if prefetch:
+        pages = prefetch_pages(pages, prefetch)
+    for page in pages:
+        yield from page["elements"]
+
+
+async def paginate_async(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, str] = {},
+    headers: dict[str, str] = {},
+    retry_policy=None,
+    rate_limiter=None,
+    prefetch=0,
+    page_concurrency=1,
+):
+    """
+    Fetch a paginated resource and return an asynchronous generator
+    with all of its instances. If :prefetch: is set, up to that many
+    pages get fetched ahead on a background task. :page_concurrency: is
+    the amount of pages fetched at the same time when the API exposes
+    numbered pages.
+    """
+    pages = paginate_pages_async(
+        client,
+        url,
+        params=params,
+        headers=headers,
+        retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
+        page_concurrency=page_concurrency,
+    )
+    if prefetch:
+        pages = prefetch_pages_async(pages, prefetch)
+    async for page in pages:
+        for element in page["elements"]:
             yield element
 
 
+class Page:
+
+    """
+    Represents a page of a paginated resource, holding its elements, the
+    URL of the next page and the metadata of the response.
+    """
+
+    def __init__(self, elements, next_url=None, links=None, headers=None):
+        self.elements = elements
+        self.next = next_url
+        self.links = links or {}
+        self.headers = headers or {}
+
+    def __iter__(self):
+        return iter(self.elements)
+
+    def __len__(self):
+        return len(self.elements)
+
+    @property
+    def cursor(self):
+        """
+        Return an opaque and serializable cursor that can be used to resume
+        the pagination on the next page, even on another process, or None
+        if this is the last page.
+        """
+        return encode_cursor(self.next) if self.next else None
+
+    def __repr__(self):
+        return f"<Page elements={len(self.elements)} next={self.next!r}>"
+
+
+def encode_cursor(url: str):
+    """Return the opaque pagination cursor that points to :url:."""
+    payload = json.dumps({"next": url}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, base_url: str):
+    """
+    Return the URL that the pagination :cursor: points to. Raise a
+    ValueError if the cursor is malformed or if it points outside of
+    :base_url:, so that credentials never get sent elsewhere.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        url = payload["next"]
+    except (ValueError, TypeError, KeyError, AttributeError):
+        raise ValueError("Invalid pagination cursor") from None
+    parsed_url = urllib.parse.urlparse(url)
+    parsed_base_url = urllib.parse.urlparse(base_url)
+    if (parsed_url.scheme, parsed_url.netloc, parsed_url.path) != (
+        parsed_base_url.scheme,
+        parsed_base_url.netloc,
+        parsed_base_url.path,
+    ):
+        raise ValueError("The pagination cursor belongs to another resource")
+    return url
+
+
+def paginate_pages(
+    client: httpx.Client,
+    url: str,
+    params: dict[str, str] = {},
+    headers: dict[str, str] = {},
+    retry_policy=None,
+    rate_limiter=None,
+    page_concurrency=1,
+):
+    """
+    Fetch a paginated resource and return a generator with each of its
+    pages. Every page is retried on its own as specified by
+    :retry_policy:, so a failure never restarts the iteration, and takes
+    a token from :rate_limiter: before being requested. If the API exposes
+    numbered pages up to the last one, up to :page_concurrency: pages get
+    fetched at the same time (still yielded in order). Otherwise, the
+    pages get followed one at a time.
+    """
+    response = request(
+        client,
+        url,
+        params=params,
+        headers=headers,
+        retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
+    )
+    yield response
+    page_urls = get_page_urls(response["links"]) if page_concurrency > 1 else None
+    if page_urls:
+        yield from fetch_pages(
+            client,
+            page_urls,
+            page_concurrency,
+            headers=headers,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
+        return
+    while response.get("next"):
+        response = request(
+            client,
+            response.get("next"),
+            headers=headers,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
+        yield response
+
+
+async def paginate_pages_async(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, str] = {},
+    headers: dict[str, str] = {},
+    retry_policy=None,
+    rate_limiter=None,
+    page_concurrency=1,
+):
+    """
+    Fetch a paginated resource and return an asynchronous generator
+    with each of its pages, fetching up to :page_concurrency: numbered
+    pages at the same time as paginate_pages does.
+    """
+    response = await request_async(
+        client,
+        url,
+        params=params,
+        headers=headers,
+        retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
+    )
+    yield response
+    page_urls = get_page_urls(response["links"]) if page_concurrency > 1 else None
+    if page_urls:
+        async for page in fetch_pages_async(
+            client,
+            page_urls,
+            page_concurrency,
+            headers=headers,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        ):
+            yield page
+        return
+    while response.get("next"):
+        response = await request_async(
+            client,
+            response.get("next"),
+            headers=headers,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
+        yield response
+
+
+def get_page_urls(links):
+    """
+    Return the URLs of every page from the "next" one to the "last" one of
+    the parsed Link header :links:, when both of them only differ in a
+    numbered page parameter. Return None if the pages are not numbered.
+    """
+    if not links or "next" not in links or "last" not in links:
+        return None
+    next_url = urllib.parse.urlsplit(links["next"])
+    last_url = urllib.parse.urlsplit(links["last"])
+    next_query = urllib.parse.parse_qsl(next_url.query, keep_blank_values=True)
+    last_query = urllib.parse.parse_qsl(last_url.query, keep_blank_values=True)
+    if next_url[:3] != last_url[:3] or [key for key, _ in next_query] != [
+        key for key, _ in last_query
+    ]:
+        return None
+    differences = [
+        index
+        for index, ((_, next_value), (_, last_value)) in enumerate(
+            zip(next_query, last_query)
+        )
+        if next_value != last_value
+    ]
+    if len(differences) != 1:
+        return None
+    index = differences[0]
+    first, last = next_query[index][1], last_query[index][1]
+    if not (first.isdigit() and last.isdigit()) or int(last) < int(first):
+        return None
+
+    def build_url(page):
+        query = list(next_query)
+        query[index] = (query[index][0], str(page))
+        return urllib.parse.urlunsplit(
+            next_url._replace(query=urllib.parse.urlencode(query))
+        )
+
+    return [build_url(page) for page in range(int(first), int(last) + 1)]
+
+
+def fetch_pages(
+    client: httpx.Client,
+    urls: list[str],
+    concurrency: int,
+    headers: dict[str, str] = {},
+    retry_policy=None,
+    rate_limiter=None,
+):
+    """
+    Fetch the pages at :urls: using a pool of :concurrency: threads and
+    return a generator with each of them, in order. At most :concurrency:
+    pages are requested ahead of the one being consumed.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+        def fetch(url):
+            return executor.submit(
+                request, client, url, {}, headers, retry_policy, rate_limiter
+            )
+
+        pending = collections.deque()
+        urls = iter(urls)
+        try:
+            for url in itertools.islice(urls, concurrency):
+                pending.append(fetch(url))
+            while pending:
+                page = pending.popleft().result()
+                for url in itertools.islice(urls, 1):
+                    pending.append(fetch(url))
+                yield page
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def fetch_pages_async(
+    client: httpx.AsyncClient,
+    urls: list[str],
+    concurrency: int,
+    headers: dict[str, str] = {},
+    retry_policy=None,
+    rate_limiter=None,
+):
+    """
+    Fetch the pages at :urls: running up to :concurrency: requests at the
+    same time and return an asynchronous generator with each of them, in
+    order.
+    """
+
+    def fetch(url):
+        return asyncio.ensure_future(
+            request_async(client, url, {}, headers, retry_policy, rate_limiter)
+        )
+
+    pending = collections.deque()
+    urls = iter(urls)
+    try:
+        for url in itertools.islice(urls, concurrency):
+            pending.append(fetch(url))
+        while pending:
+            page = await pending.popleft()
+            for url in itertools.islice(urls, 1):
+                pending.append(fetch(url))
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def prefetch_pages(pages, size):
+    """
+    Consume the :pages: generator on a background thread, keeping at
+    most :size: pages buffered ahead of the consumer. Errors raised while
+    fetching get re-raised in order, after the pages fetched before them.
+    """
+    buffer = queue.Queue(maxsize=size)
+    stopped = threading.Event()
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=_PREFETCH_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for page in pages:
+                if not put((_PAGE, page)):
+                    return
+            put((_DONE, None))
+        except Exception as exc:  # pylint: disable=broad-except
+            put((_ERROR, exc))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, item = buffer.get()
+            if kind is _DONE:
+                return
+            if kind is _ERROR:
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+
+async def prefetch_pages_async(pages, size):
+    """
+    Consume the :pages: asynchronous generator on a background task,
+    keeping at most :size: pages buffered ahead of the consumer.
+    """
+    buffer = asyncio.Queue(maxsize=size)
+
+    async def produce():
+        try:
+            async for page in pages:
+                await buffer.put((_PAGE, page))
+            await buffer.put((_DONE, None))
+        except Exception as exc:  # pylint: disable=broad-except
+            await buffer.put((_ERROR, exc))
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            kind, item = await buffer.get()
+            if kind is _DONE:
+                return
+            if kind is _ERROR:
+                raise item
+            yield item
+    finally:
+        task.cancel()
+
+
 def request(
     client: httpx.Client,
     url: str,
     params: dict[str, str] = {},
     headers: dict[str, str] = {},
+    retry_policy=None,
+    rate_limiter=None,
 ):
     """
     Fetch a page of a resource and return its elements and the next
     page of the resource.
     """
     _request = httpx.Request("get", url, params=params, headers=headers)
-    response = client.send(_request)
+    response = send_with_retries(client, _request, retry_policy, rate_limiter)
+    return parse_page(response)
+
+
+async def request_async(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, str] = {},
+    headers: dict[str, str] = {},
+    retry_policy=None,
+    rate_limiter=None,
+):
+    """
+    Asynchronously fetch a page of a resource and return its elements
+    and the next page of the resource.
+    """
+    _request = httpx.Request("get", url, params=params, headers=headers)
+    response = await send_with_retries_async(
+        client, _request, retry_policy, rate_limiter
+    )
+    return parse_page(response)
+
+
+def parse_page(response: httpx.Response):
+    """
+    Receive the response of a page request and return its elements
+    and the next page of the resource.
+    """
     response.raise_for_status()
-    headers = parse_link_headers(response.headers.get("link"))
-    next_ = headers and headers.get("next")
+    links = parse_link_headers(response.headers.get("link")) or {}
     elements = response.json()
     return {
-        "next": next_,
+        "next": links.get("next"),
         "elements": elements,
+        "links": links,
+        "headers": dict(response.headers),
     }
 
 
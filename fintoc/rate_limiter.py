@@ -0,0 +1,167 @@
+"""Module to hold the client-side rate limiter of the SDK."""
+
+import asyncio
+import threading
+import time
+
+from fintoc.errors import RateLimitExceededError
+
+
+class TokenBucket:
+
+    """
+    Thread-safe token bucket that refills :rate: tokens per second up to
+    :capacity: tokens.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Take :tokens: from the bucket if they are available and return 0.
+        Otherwise, return the seconds left until they become available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens=1, blocking=True, timeout=None):
+        """
+        Take :tokens: from the bucket, waiting for them if :blocking:.
+        Return whether the tokens were taken.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.reserve(tokens)
+            if not wait:
+                return True
+            if not blocking or _exceeds(deadline, wait):
+                return False
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens=1, blocking=True, timeout=None):
+        """Asynchronous version of :acquire:."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.reserve(tokens)
+            if not wait:
+                return True
+            if not blocking or _exceeds(deadline, wait):
+                return False
+            await asyncio.sleep(wait)
+
+
+class RateLimitRule:
+
+    """
+    Represents a family of endpoints with its own bucket, identified by a
+    path prefix and, optionally, by the methods it applies to.
+    """
+
+    def __init__(self, path, rate, capacity=None, methods=None):
+        self.path = path
+        self.rate = rate
+        self.capacity = capacity
+        self.methods = frozenset(method.lower() for method in methods or ())
+
+    def matches(self, method, path):
+        """Return whether a request with :method: to :path: uses this rule."""
+        if self.methods and method.lower() not in self.methods:
+            return False
+        return path.startswith(self.path)
+
+
+class RateLimiter:
+
+    """
+    Client-side rate limiter. Every API key gets its own buckets: one for
+    each rule and a default one for the requests that match no rule. The
+    same limiter can be shared between threads and Fintoc objects.
+    """
+
+    def __init__(self, rate, capacity=None, rules=(), blocking=True, timeout=None):
+        self.rate = rate
+        self.capacity = capacity
+        self.rules = list(rules)
+        self.blocking = blocking
+        self.timeout = timeout
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def get_bucket(self, api_key, method, path):
+        """Return the bucket used by a request with :method: to :path:."""
+        index = next(
+            (i for i, rule in enumerate(self.rules) if rule.matches(method, path)),
+            None,
+        )
+        key = (api_key, index)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._build_bucket(index)
+                    self._buckets[key] = bucket
+        return bucket
+
+    def _build_bucket(self, rule_index):
+        if rule_index is None:
+            return TokenBucket(self.rate, self.capacity)
+        rule = self.rules[rule_index]
+        return TokenBucket(rule.rate, rule.capacity)
+
+    def acquire(self, api_key, method, path, blocking=None, timeout=None):
+        """
+        Take a token for a request with :method: to :path:. Return whether
+        it was taken. :blocking: and :timeout: default to the limiter ones.
+        """
+        bucket = self.get_bucket(api_key, method, path)
+        return bucket.acquire(
+            blocking=self.blocking if blocking is None else blocking,
+            timeout=self.timeout if timeout is None else timeout,
+        )
+
+    async def acquire_async(self, api_key, method, path, blocking=None, timeout=None):
+        """Asynchronous version of :acquire:."""
+        bucket = self.get_bucket(api_key, method, path)
+        return await bucket.acquire_async(
+            blocking=self.blocking if blocking is None else blocking,
+            timeout=self.timeout if timeout is None else timeout,
+        )
+
+    def acquire_request(self, request):
+        """Take a token for an httpx :request: or raise an error."""
+        if not self.acquire(*self._describe(request)):
+            raise RateLimitExceededError(
+                f"Rate limit exceeded for {request.method} {request.url.path}"
+            )
+
+    async def acquire_request_async(self, request):
+        """Asynchronous version of :acquire_request:."""
+        if not await self.acquire_async(*self._describe(request)):
+            raise RateLimitExceededError(
+                f"Rate limit exceeded for {request.method} {request.url.path}"
+            )
+
+    @staticmethod
+    def _describe(request):
+        return (
+            request.headers.get("authorization"),
+            request.method,
+            request.url.path,
+        )
+
+
+def _exceeds(deadline, wait):
+    return deadline is not None and time.monotonic() + wait > deadline
@@ -0,0 +1,156 @@
+"""
+Module to hold the compact records, slot-based versions of the resources
+that get built in large amounts.
+"""
+
+from fintoc.mixins.record_mixin import RecordMixin
+from fintoc.utils import get_resource_class
+
+# The fields kept in slots by the record of each resource, covering the
+# fields returned by both versions of the API. Any other field gets kept
+# in a dictionary
+RECORD_FIELDS = {
+    "movement": (
+        "id",
+        "object",
+        "amount",
+        "currency",
+        "description",
+        "post_date",
+        "transaction_date",
+        "type",
+        "pending",
+        "reference_id",
+        "recipient_account",
+        "sender_account",
+        "comment",
+        "direction",
+        "status",
+        "mode",
+        "account_id",
+        "counterparty",
+        "metadata",
+        "transfer_id",
+        "created_at",
+    ),
+    "transfer": (
+        "id",
+        "object",
+        "amount",
+        "currency",
+        "direction",
+        "status",
+        "mode",
+        "account_id",
+        "account_number",
+        "post_date",
+        "transaction_date",
+        "comment",
+        "reference_id",
+        "receipt_url",
+        "tracking_key",
+        "return_reason",
+        "counterparty",
+        "metadata",
+        "created_at",
+    ),
+    "payment_intent": (
+        "id",
+        "object",
+        "amount",
+        "currency",
+        "status",
+        "mode",
+        "widget_token",
+        "reference_id",
+        "transaction_date",
+        "recipient_account",
+        "sender_account",
+        "payment_type",
+        "customer_email",
+        "error_reason",
+        "metadata",
+        "created_at",
+    ),
+    "account": (
+        "id",
+        "object",
+        "name",
+        "official_name",
+        "number",
+        "holder_id",
+        "holder_name",
+        "type",
+        "currency",
+        "balance",
+        "refreshed_at",
+        "mode",
+        "description",
+        "available_balance",
+        "status",
+        "is_root",
+        "root_account_number",
+        "root_account_number_id",
+        "entity",
+        "created_at",
+    ),
+}
+
+# Caches the record class built for each resource
+_RECORD_CLASSES = {}
+
+
+class AccountRecordMixin(RecordMixin):
+
+    """Represents the mixin for the compact Account records."""
+
+    __slots__ = ()
+
+    @property
+    def movements(self):
+        """Proxies the movements manager."""
+        # pylint: disable=import-outside-toplevel
+        from fintoc.managers import MovementsManager
+
+        return MovementsManager(f"/v1/accounts/{self.id}/movements", self._client)
+
+
+# The base class of the record of each resource, to keep the properties of
+# their resource class
+RECORD_BASES = {
+    "account": AccountRecordMixin,
+}
+
+
+def build_record_class(resource_class, fields, base=RecordMixin):
+    """
+    Build a record class for :resource_class:, that keeps every field of
+    :fields: in a slot, on top of :base:.
+    """
+    return type(
+        f"{resource_class.__name__}Record",
+        (base,),
+        {
+            "__slots__": tuple(fields),
+            "__doc__": f"Represents a compact {resource_class.__name__} record.",
+            "resource_class": resource_class,
+            "resource_identifier": resource_class.resource_identifier,
+            "fields": frozenset(fields),
+        },
+    )
+
+
+def get_record_class(resource):
+    """
+    Return the record class of the snake-cased :resource:, or None if the
+    resource has no record.
+    """
+    record_class = _RECORD_CLASSES.get(resource)
+    if record_class is None and resource in RECORD_FIELDS:
+        record_class = build_record_class(
+            get_resource_class(resource),
+            RECORD_FIELDS[resource],
+            RECORD_BASES.get(resource, RecordMixin),
+        )
+        _RECORD_CLASSES[resource] = record_class
+    return record_class
@@ -1,74 +1,145 @@
 """Module for the methods that handle te resources."""
 
-from fintoc.utils import objetize, objetize_generator
+import inspect
 
+from fintoc.paginator import Page, decode_cursor
+from fintoc.utils import (
+    build_objetizer,
+    collect,
+    map_iterable,
+    objetize,
+    objetize_async_generator,
+    objetize_generator,
+    then,
+)
 
-def resource_list(client, path, klass, handlers, methods, params):
-    """List all the instances of a resource."""
+
+def resource_list(
+    client, path, klass, handlers, methods, params, raw=False, history=False
+):
+    """
+    List all the instances of a resource. If :raw:, the decoded JSON of
+    each instance is returned without objetizing it. If :history:, the
+    instances never change once they are old enough, so they can be served
+    from the history store of the client.
+    """
     lazy = params.pop("lazy", True)
-    data = client.request(path, paginated=True, params=params)
+    prefetch = params.pop("prefetch", 0)
+    url, params = resolve_cursor(client, path, params)
+    data = client.request(
+        url, paginated=True, params=params, prefetch=prefetch, history=history
+    )
+    if raw:
+        return data if lazy else collect(data)
+    generator_objetizer = (
+        objetize_async_generator if inspect.isasyncgen(data) else objetize_generator
+    )
+    objects = generator_objetizer(
+        data,
+        klass,
+        client,
+        handlers=handlers,
+        methods=methods,
+        path=path,
+    )
     if lazy:
-        return objetize_generator(
-            data,
-            klass,
-            client,
-            handlers=handlers,
-            methods=methods,
-            path=path,
-        )
-    return [
-        objetize(
+        return objects
+    return collect(objects)
+
+
+def resource_list_pages(client, path, klass, handlers, methods, params, raw=False):
+    """
+    List all the instances of a resource, grouped in the pages returned
+    by the API. Elements are objetized one page at a time, unless :raw:.
+    """
+    prefetch = params.pop("prefetch", 0)
+    url, params = resolve_cursor(client, path, params)
+    pages = client.request_pages(url, params=params, prefetch=prefetch)
+
+    objetizer = build_objetizer(
+        klass, client, handlers=handlers, methods=methods, path=path
+    )
+
+    def build_page(page):
+        elements = page["elements"]
+        if not raw:
+            elements = [objetizer(element) for element in elements]
+        return Page(elements, page["next"], page["links"], page["headers"])
+
+    return map_iterable(pages, build_page)
+
+
+def resolve_cursor(client, path, params):
+    """
+    Return the URL and params used to list a resource. If the :cursor:
+    param is set, the pagination resumes on the page it points to, whose
+    URL already includes the filters used to build it.
+    """
+    cursor = params.pop("cursor", None)
+    if cursor is None:
+        return path, params
+    return decode_cursor(cursor, client.build_url(path)), {}
+
+
+def resource_get(client, path, id_, klass, handlers, methods, params, raw=False):
+    """
+    Fetch a specific instance of a resource. If :raw:, its decoded JSON is
+    returned without objetizing it.
+    """
+    data = client.request(f"{path}/{id_}", method="get", params=params)
+    if raw:
+        return data
+    return then(
+        data,
+        lambda data: objetize(
             klass,
             client,
-            element,
+            data,
             handlers=handlers,
             methods=methods,
             path=path,
-        )
-        for element in data
-    ]
-
-
-def resource_get(client, path, id_, klass, handlers, methods, params):
-    """Fetch a specific instance of a resource."""
-    data = client.request(f"{path}/{id_}", method="get", params=params)
-    return objetize(
-        klass,
-        client,
-        data,
-        handlers=handlers,
-        methods=methods,
-        path=path,
+        ),
     )
 
 
 def resource_create(
-    client, path, klass, handlers, methods, params, idempotency_key=None
+    client, path, klass, handlers, methods, params, idempotency_key=None, raw=False
 ):
-    """Create a new instance of a resource."""
+    """
+    Create a new instance of a resource. If :raw:, its decoded JSON is
+    returned without objetizing it.
+    """
     data = client.request(
         path, method="post", json=params, idempotency_key=idempotency_key
     )
-    return objetize(
-        klass,
-        client,
+    if raw:
+        return data
+    return then(
         data,
-        handlers=handlers,
-        methods=methods,
-        path=path,
+        lambda data: objetize(
+            klass,
+            client,
+            data,
+            handlers=handlers,
+            methods=methods,
+            path=path,
+        ),
     )
 
 
 def resource_upload(client, path, klass, handlers, methods, files):
     """Upload files to a resource endpoint through a multipart PUT request."""
     data = client.request(path, method="put", files=files)
-    return objetize(
-        klass,
-        client,
+    return then(
         data,
-        handlers=handlers,
-        methods=methods,
-        path=path,
+        lambda data: objetize(
+            klass,
+            client,
+            data,
+            handlers=handlers,
+            methods=methods,
+            path=path,
+        ),
     )
 
 
@@ -78,13 +149,16 @@ def resource_update(
     """Update a specific instance of a resource."""
     update_path = custom_path if custom_path else f"{path}/{id_}"
     data = client.request(update_path, method="patch", json=params)
-    return objetize(
-        klass,
-        client,
+    return then(
         data,
-        handlers,
-        methods,
-        path,
+        lambda data: objetize(
+            klass,
+            client,
+            data,
+            handlers,
+            methods,
+            path,
+        ),
     )
 
 
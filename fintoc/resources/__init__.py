@@ -1,5 +1,8 @@
 """Init file for the resources module of the SDK."""
 
+from fintoc.mixins import ResourceMixin
+from fintoc.utils import register_resource_classes
+
 from .account import Account
 from .balance import Balance
 from .charge import Charge
@@ -40,3 +43,13 @@ from .v2.subscription import Subscription as SubscriptionV2
 from .v2.subscription_item import SubscriptionItem
 from .v2.transfer import Transfer
 from .webhook_endpoint import WebhookEndpoint
+
+register_resource_classes(
+    {
+        name: klass
+        for name, klass in dict(globals()).items()
+        if isinstance(klass, type)
+        and issubclass(klass, ResourceMixin)
+        and klass is not ResourceMixin
+    }
+)
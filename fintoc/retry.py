@@ -0,0 +1,160 @@
+"""Module to hold the retry policy used when sending requests."""
+
+import asyncio
+import email.utils
+import random
+import time
+
+import httpx
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+# pylint: disable=too-many-instance-attributes
+class RetryPolicy:
+
+    """
+    Encapsulates the rules used to decide whether a failed request should be
+    retried and how long to wait before doing it.
+
+    The wait uses exponential backoff with full jitter, unless the response
+    includes a Retry-After header, whose wait gets capped at
+    :max_retry_after: seconds. :method_statuses: can be used to override
+    the retryable statuses of specific methods (an empty collection disables
+    retries for that method). Retried requests are sent again untouched, so
+    POST requests keep their original Idempotency-Key.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff_factor=0.5,
+        max_backoff=20.0,
+        retry_statuses=DEFAULT_RETRY_STATUSES,
+        method_statuses=None,
+        retry_on_connection_errors=True,
+        respect_retry_after=True,
+        max_retry_after=60.0,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.method_statuses = {
+            method.lower(): frozenset(statuses)
+            for method, statuses in (method_statuses or {}).items()
+        }
+        self.retry_on_connection_errors = retry_on_connection_errors
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def get_statuses(self, method):
+        """Return the retryable statuses for :method:."""
+        return self.method_statuses.get(method.lower(), self.retry_statuses)
+
+    def get_retry_delay(self, method, attempt, response=None):
+        """
+        Return the seconds to wait before retrying a request with :method:
+        that failed on its :attempt: (starting at 1), either with :response:
+        or with a connection error (when :response: is None). Return None if
+        the request must not be retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if response is None:
+            if not self.retry_on_connection_errors or not self.get_statuses(method):
+                return None
+            return self.get_backoff(attempt)
+        if response.status_code not in self.get_statuses(method):
+            return None
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        return self.get_backoff(attempt)
+
+    def get_backoff(self, attempt):
+        """Return an exponential backoff with full jitter for :attempt:."""
+        ceiling = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+def parse_retry_after(value):
+    """
+    Parse the value of a Retry-After header, which can either be a number
+    of seconds or an HTTP date, and return the seconds to wait.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def send_with_retries(
+    client, request, retry_policy=None, rate_limiter=None, before_send=None
+):
+    """
+    Send :request: using the httpx :client:, retrying it as specified by
+    :retry_policy:. Every attempt takes a token from :rate_limiter: first.
+    :before_send: gets called once the token of the first attempt is taken,
+    right before sending it. Return the last response received.
+    """
+    attempt = 1
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire_request(request)
+        if before_send is not None and attempt == 1:
+            before_send()
+        if retry_policy is None:
+            return client.send(request)
+        try:
+            response = client.send(request)
+        except httpx.TransportError:
+            delay = retry_policy.get_retry_delay(request.method, attempt)
+            if delay is None:
+                raise
+        else:
+            delay = retry_policy.get_retry_delay(request.method, attempt, response)
+            if delay is None:
+                return response
+        time.sleep(delay)
+        attempt += 1
+
+
+async def send_with_retries_async(
+    client, request, retry_policy=None, rate_limiter=None, before_send=None
+):
+    """
+    Send :request: using the asynchronous httpx :client:, retrying it as
+    specified by :retry_policy:. Every attempt takes a token from
+    :rate_limiter: first. :before_send: gets called once the token of the
+    first attempt is taken, right before sending it. Return the last
+    response received.
+    """
+    attempt = 1
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.acquire_request_async(request)
+        if before_send is not None and attempt == 1:
+            before_send()
+        if retry_policy is None:
+            return await client.send(request)
+        try:
+            response = await client.send(request)
+        except httpx.TransportError:
+            delay = retry_policy.get_retry_delay(request.method, attempt)
+            if delay is None:
+                raise
+        else:
+            delay = retry_policy.get_retry_delay(request.method, attempt, response)
+            if delay is None:
+                return response
+        await asyncio.sleep(delay)
+        attempt += 1
@@ -0,0 +1,230 @@
+"""
+Module to hold the sharded listing, that splits the interval of a list
+request into windows that get paginated concurrently and streamed back in
+order.
+"""
+
+import asyncio
+import datetime
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from fintoc.constants import DATE_TIME_PATTERN
+from fintoc.utils import collect, map_iterable, parse_iso_datetime
+
+
+def parse_bound(value):
+    """
+    Return the "since" or "until" :value: (a date, a datetime or one of
+    them as a string) as a date or a naive datetime in UTC. Raise a
+    ValueError if it is neither.
+    """
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return value
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, str):
+        if len(value) == 10:
+            return datetime.date.fromisoformat(value)
+        parsed = parse_iso_datetime(value)
+        if parsed is not None:
+            return parsed
+    raise ValueError(f"Invalid date or datetime '{value}'")
+
+
+def split_interval(since, until, shards):
+    """
+    Split the interval between :since: and :until: (both included, and
+    both dates or both datetimes) into up to :shards: windows of about the
+    same length. Return (since, until) pairs of strings, from the newest
+    window to the oldest. Windows of dates do not overlap, while windows of
+    datetimes share their bounds.
+    """
+    if shards < 1:
+        raise ValueError("The shards must be at least 1")
+    if isinstance(since, datetime.datetime) != isinstance(until, datetime.datetime):
+        raise ValueError("Both since and until must be dates or datetimes")
+    if until < since:
+        raise ValueError("The until bound must not be before the since bound")
+    if not isinstance(since, datetime.datetime):
+        days = (until - since).days + 1
+        shards = min(shards, days)
+        bounds = [
+            since + datetime.timedelta(days=days * i // shards)
+            for i in range(shards + 1)
+        ]
+        windows = [
+            (
+                bounds[i].isoformat(),
+                (bounds[i + 1] - datetime.timedelta(days=1)).isoformat(),
+            )
+            for i in range(shards)
+        ]
+    else:
+        step = (until - since) / shards
+        bounds = [
+            (since + step * i).strftime(DATE_TIME_PATTERN) for i in range(shards + 1)
+        ]
+        windows = list(dict.fromkeys(zip(bounds, bounds[1:])))
+    return windows[::-1]
+
+
+def iterate_windows(list_window, windows, concurrency):
+    """
+    Return a generator with the result of calling :list_window: with each
+    of :windows:, in order. Up to :concurrency: windows get listed ahead on
+    threads while the previous ones are being consumed.
+    """
+    windows = iter(windows)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque(
+        executor.submit(list_window, window)
+        for window in itertools.islice(windows, concurrency)
+    )
+    try:
+        while pending:
+            elements = pending.popleft().result()
+            for window in itertools.islice(windows, 1):
+                pending.append(executor.submit(list_window, window))
+            yield elements
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def iterate_windows_async(list_window, windows, concurrency):
+    """
+    Return an asynchronous generator with the result of awaiting
+    :list_window: with each of :windows:, in order, listing up to
+    :concurrency: windows ahead on tasks.
+    """
+    windows = iter(windows)
+    pending = deque(
+        asyncio.ensure_future(list_window(window))
+        for window in itertools.islice(windows, concurrency)
+    )
+    try:
+        while pending:
+            elements = await pending.popleft()
+            for window in itertools.islice(windows, 1):
+                pending.append(asyncio.ensure_future(list_window(window)))
+            yield elements
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _falls_on(value, bound):
+    try:
+        return value is not None and parse_bound(value) == bound
+    except ValueError:
+        return False
+
+
+def _merge_window(elements, repeated, on_bound, bound, date_field):
+    """
+    Yield the :elements: of a window whose id is not :repeated:, adding to
+    :on_bound: the id of those whose :date_field: falls on its :bound:.
+    """
+    for element in elements:
+        if element["id"] in repeated:
+            continue
+        if bound is not None and _falls_on(element.get(date_field), bound):
+            on_bound.add(element["id"])
+        yield element
+
+
+def merge_windows(windows, shared_bounds=None, date_field="post_date"):
+    """
+    Chain the elements of each list of :windows: (from the newest to the
+    oldest). :shared_bounds: holds, for each window, the bound it shares
+    with the next one (or None), so that the elements on that bound only
+    get returned once.
+    """
+    repeated = set()
+    for index, elements in enumerate(windows):
+        bound = shared_bounds[index] if shared_bounds else None
+        on_bound = set()
+        yield from _merge_window(elements, repeated, on_bound, bound, date_field)
+        repeated = on_bound
+
+
+async def merge_windows_async(windows, shared_bounds=None, date_field="post_date"):
+    """Chain the elements of the asynchronous :windows: as merge_windows does."""
+    repeated = set()
+    index = 0
+    async for elements in windows:
+        bound = shared_bounds[index] if shared_bounds else None
+        on_bound = set()
+        for element in _merge_window(elements, repeated, on_bound, bound, date_field):
+            yield element
+        repeated = on_bound
+        index += 1
+
+
+def _split_bounds(since, until, shards):
+    """
+    Split the interval between the :since: and :until: (defaulting to now)
+    strings into :shards: windows. Return the windows, from the newest to
+    the oldest, with the bound each of them shares with the next one (only
+    for windows of datetimes, otherwise None).
+    """
+    start = parse_bound(since)
+    if until is not None:
+        end = parse_bound(until)
+    elif isinstance(start, datetime.datetime):
+        end = datetime.datetime.utcnow().replace(microsecond=0)
+    else:
+        end = datetime.datetime.utcnow().date()
+    windows = split_interval(start, end, shards)
+    shared_bounds = None
+    if isinstance(start, datetime.datetime):
+        shared_bounds = [parse_bound(window[0]) for window in windows[:-1]] + [None]
+    # The outer windows keep the original bounds, so that the newest one
+    # includes the instances created while listing when there is no "until"
+    windows[0] = (windows[0][0], until)
+    windows[-1] = (since, windows[-1][1])
+    return windows, shared_bounds
+
+
+# pylint: disable=protected-access
+def list_shards(
+    manager,
+    shards,
+    concurrency=None,
+    raw=None,
+    compact=None,
+    date_field="post_date",
+    **kwargs,
+):
+    """
+    List every instance handled by :manager: between the "since" and
+    "until" (defaulting to now) of :kwargs:, splitting the interval into
+    :shards: windows that get paginated using up to :concurrency: (that
+    defaults to :shards:) connections at the same time. The instances get
+    returned in the order of the API, from the newest window to the oldest,
+    as soon as their window is listed, holding at most :concurrency:
+    windows in memory. :date_field: is the field compared with the bounds
+    shared by windows of datetimes, whose instances only get returned once.
+    """
+    if kwargs.get("since") is None:
+        raise ValueError("Listing in shards requires a since bound")
+    lazy = kwargs.pop("lazy", True)
+    windows, shared_bounds = _split_bounds(kwargs["since"], kwargs.get("until"), shards)
+
+    def list_window(window):
+        params = {**kwargs, "since": window[0], "until": window[1]}
+        if params["until"] is None:
+            del params["until"]
+        return manager._list(raw=True, lazy=False, **params)
+
+    results = manager._client.shard_iterator(
+        list_window, windows, concurrency or len(windows)
+    )
+    merge = merge_windows_async if hasattr(results, "__aiter__") else merge_windows
+    elements = merge(results, shared_bounds, date_field)
+    if not manager._is_raw(raw):
+        elements = map_iterable(elements, manager._objetizer(compact, **kwargs))
+    return elements if lazy else collect(elements)
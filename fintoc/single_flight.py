@@ -0,0 +1,96 @@
+"""
+Module to hold the single flights, that coalesce identical concurrent
+calls into a single one whose result gets shared by every caller.
+"""
+
+import asyncio
+import copy
+import threading
+
+
+class _Call:
+
+    """Represents a call in flight, with the amount of callers waiting for it."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self, done=None):
+        self.done = done
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+
+    """
+    Coalesces concurrent calls with the same key: while a call is in flight,
+    every other call with its key waits for it and gets a deep copy of its
+    result (or raises its error) instead of running again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function):
+        """
+        Return the result of calling :function:, sharing it with every
+        concurrent call with the same :key:.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call(threading.Event())
+            else:
+                call.waiters += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return copy.deepcopy(call.result) if call.waiters else call.result
+
+
+class AsyncSingleFlight:
+
+    """
+    Coalesces concurrent awaitable calls with the same key, as SingleFlight
+    does for the calls made from threads.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, function):
+        """
+        Return the awaited result of calling :function:, sharing it with
+        every concurrent call with the same :key:.
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            call.waiters += 1
+            await asyncio.shield(call.done)
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        call = self._calls[key] = _Call(asyncio.get_running_loop().create_future())
+        try:
+            call.result = await function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            del self._calls[key]
+            call.done.set_result(None)
+        return copy.deepcopy(call.result) if call.waiters else call.result
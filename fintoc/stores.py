@@ -0,0 +1,27 @@
+"""Module to hold the base of the stores kept in SQLite databases."""
+
+import sqlite3
+import threading
+
+
+class SQLiteStore:
+
+    """
+    Represents a store kept in the SQLite database at :path:, whose
+    connection gets shared between threads. Subclasses define the :schema:
+    statement that creates their table if it does not exist.
+    """
+
+    schema = None
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(self.schema)
+
+    def close(self):
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
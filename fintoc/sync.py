@@ -0,0 +1,243 @@
+"""
+Module to hold the movement sync engine, that lists only the movements
+of each account posted since the last sync, using a persisted watermark.
+"""
+
+import datetime
+import json
+from abc import ABCMeta, abstractmethod
+
+from fintoc.constants import DATE_TIME_PATTERN
+from fintoc.stores import SQLiteStore
+from fintoc.utils import parse_iso_datetime, then
+
+
+class Watermark:
+
+    """
+    Represents the high-water mark of the movements of an account: the
+    latest :date: seen (as returned by the API) and the :ids: of the
+    movements seen since :date: minus the overlap of the sync, which get
+    skipped when they are listed again.
+    """
+
+    __slots__ = ("date", "ids")
+
+    def __init__(self, date, ids=()):
+        self.date = date
+        self.ids = frozenset(ids)
+
+    def to_dict(self):
+        """Return the watermark as a dictionary."""
+        return {"date": self.date, "ids": sorted(self.ids)}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a watermark from a dictionary returned by :to_dict:."""
+        return cls(data["date"], data["ids"])
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Watermark)
+            and self.date == other.date
+            and self.ids == other.ids
+        )
+
+    def __repr__(self):
+        return f"Watermark(date={self.date!r}, ids={len(self.ids)})"
+
+
+class WatermarkStore(metaclass=ABCMeta):
+
+    """Represents the storage of the watermark of each account."""
+
+    @abstractmethod
+    def get(self, key):
+        """Return the watermark stored for :key:, or None if there is none."""
+
+    @abstractmethod
+    def set(self, key, watermark):
+        """Store the :watermark: for :key:."""
+
+    @abstractmethod
+    def delete(self, key):
+        """Remove the watermark stored for :key:, so the next sync starts over."""
+
+
+class MemoryWatermarkStore(WatermarkStore):
+
+    """Represents a watermark store that lives in memory."""
+
+    def __init__(self):
+        self._watermarks = {}
+
+    def get(self, key):
+        return self._watermarks.get(key)
+
+    def set(self, key, watermark):
+        self._watermarks[key] = watermark
+
+    def delete(self, key):
+        self._watermarks.pop(key, None)
+
+
+class SQLiteWatermarkStore(SQLiteStore, WatermarkStore):
+
+    """Represents a watermark store in the SQLite database at :path:."""
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS watermarks (key TEXT PRIMARY KEY, "
+        "watermark TEXT, updated_at TEXT)"
+    )
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT watermark FROM watermarks WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else Watermark.from_dict(json.loads(row[0]))
+
+    def set(self, key, watermark):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)",
+                (
+                    key,
+                    json.dumps(watermark.to_dict()),
+                    datetime.datetime.utcnow().isoformat(),
+                ),
+            )
+
+    def delete(self, key):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM watermarks WHERE key = ?", (key,))
+
+
+class SyncBatch:
+
+    """
+    Represents the new :movements: of the account :key: listed by a sync,
+    along with the :watermark: to store once they are processed.
+    """
+
+    __slots__ = ("key", "movements", "watermark")
+
+    def __init__(self, key, movements, watermark):
+        self.key = key
+        self.movements = movements
+        self.watermark = watermark
+
+    def __iter__(self):
+        return iter(self.movements)
+
+    def __len__(self):
+        return len(self.movements)
+
+    def __repr__(self):
+        return f"SyncBatch(key={self.key!r}, movements={len(self.movements)})"
+
+
+class MovementSync:
+
+    """
+    Lists the new movements of each account incrementally, keeping their
+    watermark in :store: (defaulting to a MemoryWatermarkStore). Each sync
+    lists the movements posted since the watermark minus :overlap: (a
+    timedelta, to catch the movements posted late), skipping the ones that
+    were already seen. :date_field: is the field of the movements compared
+    with the watermark, which must be the one filtered by "since".
+    """
+
+    def __init__(self, store=None, overlap=None, date_field="post_date"):
+        self.store = store if store is not None else MemoryWatermarkStore()
+        self.overlap = overlap or datetime.timedelta(0)
+        self.date_field = date_field
+
+    def run(self, movements, account_id, commit=False, raw=None, **kwargs):
+        """
+        List the movements of the account :account_id: posted since its
+        watermark, using the :movements: manager of the account (v1) or of
+        the accounts (v2). :kwargs: are used to list the movements, and
+        must include the "since" of the first sync of the account. Return a
+        SyncBatch with the new movements, whose watermark gets stored when
+        calling :commit: once they are processed (or right away, if
+        :commit:).
+        """
+        watermark = self.store.get(account_id)
+        params = dict(kwargs)
+        if watermark is not None:
+            params["since"] = self._get_since(watermark)
+        elif params.get("since") is None:
+            raise ValueError(
+                f"The first sync of '{account_id}' needs a 'since' to start from, "
+                "instead of listing its whole history"
+            )
+        if "{account_id}" in movements._path:  # pylint: disable=protected-access
+            params["account_id"] = account_id
+        elements = movements.list(raw=True, lazy=False, **params)
+        return then(
+            elements,
+            lambda elements: self._build_batch(
+                movements, account_id, watermark, elements, commit, raw, params
+            ),
+        )
+
+    def commit(self, batch):
+        """Store the watermark of the :batch:, once its movements are processed."""
+        if batch.watermark is not None:
+            self.store.set(batch.key, batch.watermark)
+
+    def reset(self, account_id):
+        """Forget the watermark of :account_id:, so the next sync starts over."""
+        self.store.delete(account_id)
+
+    def _get_since(self, watermark):
+        date = parse_iso_datetime(watermark.date)
+        if date is None:
+            return watermark.date
+        return (date - self.overlap).strftime(DATE_TIME_PATTERN)
+
+    # pylint: disable=too-many-arguments
+    def _build_batch(self, movements, key, watermark, elements, commit, raw, params):
+        seen = set(watermark.ids) if watermark is not None else set()
+        new_elements = []
+        for element in elements:
+            if element["id"] in seen:
+                continue
+            seen.add(element["id"])
+            new_elements.append(element)
+        batch = SyncBatch(
+            key,
+            new_elements,
+            self._build_watermark(watermark, new_elements),
+        )
+        if commit:
+            self.commit(batch)
+        # pylint: disable=protected-access
+        if not movements._is_raw(raw):
+            objetizer = movements._objetizer(**params)
+            batch.movements = [objetizer(element) for element in new_elements]
+        return batch
+
+    def _build_watermark(self, watermark, elements):
+        """
+        Return the watermark after seeing the :elements:, keeping the ids
+        of the movements within the overlap of the latest date.
+        """
+        dated = [
+            (element[self.date_field], element["id"])
+            for element in elements
+            if element.get(self.date_field)
+        ]
+        if watermark is not None:
+            dated.extend((watermark.date, id_) for id_ in watermark.ids)
+        if not dated:
+            return watermark
+        parsed = [(parse_iso_datetime(date), date, id_) for date, id_ in dated]
+        if any(date is None for date, _, _ in parsed):
+            # Dates in an unknown format can only be compared as strings
+            latest = max(date for date, _ in dated)
+            return Watermark(latest, (id_ for date, id_ in dated if date == latest))
+        latest_date, latest, _ = max(parsed, key=lambda item: item[0])
+        threshold = latest_date - self.overlap
+        return Watermark(latest, (id_ for date, _, id_ in parsed if date >= threshold))
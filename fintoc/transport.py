@@ -0,0 +1,74 @@
+"""Module to hold the configuration of the HTTP transport of the SDK."""
+
+import httpx
+
+
+# pylint: disable=too-many-instance-attributes
+class TransportConfig:
+
+    """
+    Encapsulates the connection pool, keep-alive and timeout configuration
+    used to build the httpx client of a Fintoc object. Defaults mirror the
+    ones used by httpx.
+    """
+
+    def __init__(
+        self,
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=5.0,
+        timeout=5.0,
+        connect_timeout=None,
+        read_timeout=None,
+        write_timeout=None,
+        pool_timeout=None,
+        http2=False,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.write_timeout = write_timeout
+        self.pool_timeout = pool_timeout
+        self.http2 = http2
+
+    def build_limits(self):
+        """Return the httpx limits of the connection pool."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def build_timeout(self):
+        """
+        Return the httpx timeout configuration. Every specific timeout that
+        is not set falls back to :timeout:.
+        """
+        return httpx.Timeout(
+            self.timeout,
+            connect=self._or_default(self.connect_timeout),
+            read=self._or_default(self.read_timeout),
+            write=self._or_default(self.write_timeout),
+            pool=self._or_default(self.pool_timeout),
+        )
+
+    def build_client(self):
+        """
+        Return a new httpx client with its own connection pool. Using HTTP/2
+        requires the optional h2 package (``pip install httpx[http2]``).
+        """
+        return httpx.Client(
+            limits=self.build_limits(), timeout=self.build_timeout(), http2=self.http2
+        )
+
+    def build_async_client(self):
+        """Return a new asynchronous httpx client with its own connection pool."""
+        return httpx.AsyncClient(
+            limits=self.build_limits(), timeout=self.build_timeout(), http2=self.http2
+        )
+
+    def _or_default(self, timeout):
+        return self.timeout if timeout is None else timeout
@@ -2,13 +2,24 @@
 
 import datetime
 import functools
+import inspect
+import re
 import warnings
 from importlib import import_module
 
 import httpx
 
-from fintoc.constants import DATE_TIME_PATTERN
-from fintoc.errors import FintocError
+from fintoc.constants import (
+    DATE_TIME_PATTERN,
+    DATETIME_MODE_AWARE,
+    DATETIME_MODE_NAIVE,
+    DATETIME_MODE_STRING,
+)
+from fintoc.errors import ApiError, FintocError
+
+# Maps the snake-cased name of every resource to its class. It gets populated
+# when fintoc.resources is imported, and caches the names resolved afterwards.
+RESOURCE_CLASSES = {}
 
 
 def snake_to_pascal(snake_string):
@@ -16,6 +27,11 @@ def snake_to_pascal(snake_string):
     return "".join(word.title() for word in snake_string.split("_"))
 
 
+def pascal_to_snake(pascal_string):
+    """Return the pascal-cased string as snake case."""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", pascal_string).lower()
+
+
 def singularize(string):
     """Remove the last 's' from a string if exists."""
     return string.rstrip("s")
@@ -26,17 +42,37 @@ def is_iso_datetime(string):
     Try to parse a string as an ISO date. If it succeeds, return True.
     Otherwise, return False.
     """
+    return parse_iso_datetime(string) is not None
+
+
+def parse_iso_datetime(string, aware=False):
+    """
+    Parse an ISO datetime string, in the "YYYY-MM-DDTHH:MM:SS[.ffffff]Z"
+    format used by the API, and return it as a datetime (in UTC, when
+    :aware:). Return None if the string is not a valid datetime. The shape
+    of the string gets checked before parsing it, so most strings that are
+    not datetimes get discarded without trying to parse them.
+    """
+    length = len(string)
+    if length < 20 or length > 27 or length == 21 or string[-1] != "Z":
+        return None
+    # The separators of the date and the time sit at fixed positions
+    if string[4] + string[7] + string[10] + string[13] + string[16] != "--T::":
+        return None
+    fraction = string[20:-1]
+    if fraction and (
+        string[19] != "." or not (fraction.isascii() and fraction.isdigit())
+    ):
+        return None
     try:
-        datetime.datetime.strptime(string, DATE_TIME_PATTERN)
-        return True
-    except ValueError:
-        pass
-    try:
-        datetime.datetime.strptime(string, "%Y-%m-%dT%H:%M:%S.%fZ")
-        return True
+        parsed = datetime.datetime.fromisoformat(string[:19])
     except ValueError:
-        pass
-    return False
+        return None
+    if fraction:
+        parsed = parsed.replace(microsecond=int(fraction.ljust(6, "0")))
+    if aware:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
 
 
 def get_resource_class(snake_resource_name, value={}):
@@ -45,16 +81,36 @@ def get_resource_class(snake_resource_name, value={}):
     name (in snake case) and its value.
     """
     if isinstance(value, dict):
-        module = import_module("fintoc.resources")
-        try:
-            return getattr(module, snake_to_pascal(snake_resource_name))
-        except AttributeError:
-            return getattr(module, "GenericFintocResource")
+        klass = RESOURCE_CLASSES.get(snake_resource_name)
+        if klass is None:
+            klass = _resolve_resource_class(snake_resource_name)
+        return klass
     if isinstance(value, str) and is_iso_datetime(value):
         return objetize_datetime
     return type(value)
 
 
+def _resolve_resource_class(snake_resource_name):
+    module = import_module("fintoc.resources")
+    klass = getattr(
+        module,
+        snake_to_pascal(snake_resource_name),
+        getattr(module, "GenericFintocResource"),
+    )
+    RESOURCE_CLASSES[snake_resource_name] = klass
+    return klass
+
+
+def register_resource_classes(classes):
+    """
+    Add the resource :classes: to the registry, where :classes: maps the
+    pascal-cased name of each resource to its class.
+    """
+    RESOURCE_CLASSES.update(
+        {pascal_to_snake(name): klass for name, klass in classes.items()}
+    )
+
+
 def get_error_class(snake_error_name):
     """
     Given an error name (in snake case), return the appropriate
@@ -67,20 +123,93 @@ def get_error_class(snake_error_name):
 def can_raise_fintoc_error(function):
     """
     Decorator that catches HTTPStatusError exceptions and raises custom
-    Fintoc errors instead.
+    Fintoc errors instead. Works both for plain results and for the
+    coroutines returned when using an asynchronous client.
     """
 
     def wrapper(*args, **kwargs):
         try:
-            return function(*args, **kwargs)
+            result = function(*args, **kwargs)
         except httpx.HTTPStatusError as exc:
-            error_data = exc.response.json()
-            error = get_error_class(error_data["error"]["type"])
-            raise error(error_data["error"]) from None
+            raise build_fintoc_error(exc) from None
+        if inspect.isawaitable(result):
+            return _await_raising_fintoc_error(result)
+        return result
 
     return wrapper
 
 
+async def _await_raising_fintoc_error(awaitable):
+    try:
+        return await awaitable
+    except httpx.HTTPStatusError as exc:
+        raise build_fintoc_error(exc) from None
+
+
+def build_fintoc_error(exc):
+    """
+    Build the custom Fintoc error that corresponds to an HTTPStatusError.
+    Responses without an error in their body (like the HTML pages of a
+    gateway) build an ApiError on server errors, or a FintocError.
+    """
+    response = exc.response
+    try:
+        error_data = response.json()["error"]
+        error = get_error_class(error_data["type"])
+    except (ValueError, KeyError, TypeError):
+        server_error = response.status_code >= 500
+        error_data = {
+            "type": "api_error" if server_error else "http_error",
+            "message": f"{response.status_code} {response.reason_phrase}",
+        }
+        error = ApiError if server_error else FintocError
+    return error(error_data)
+
+
+def then(result, callback):
+    """
+    Apply :callback: to :result:. If :result: is awaitable (because it
+    comes from an asynchronous client), return a coroutine that applies
+    :callback: once :result: gets resolved instead.
+    """
+    if inspect.isawaitable(result):
+        return _await_then(result, callback)
+    return callback(result)
+
+
+async def _await_then(awaitable, callback):
+    return callback(await awaitable)
+
+
+def collect(iterable):
+    """
+    Return a list with every element of :iterable:. If :iterable: is an
+    asynchronous iterable, return a coroutine that resolves to the list.
+    """
+    if hasattr(iterable, "__aiter__"):
+        return _collect_async(iterable)
+    return list(iterable)
+
+
+async def _collect_async(iterable):
+    return [element async for element in iterable]
+
+
+def map_iterable(iterable, function):
+    """
+    Return a generator that applies :function: to every element of
+    :iterable:, which can be either synchronous or asynchronous.
+    """
+    if hasattr(iterable, "__aiter__"):
+        return _map_async_iterable(iterable, function)
+    return (function(element) for element in iterable)
+
+
+async def _map_async_iterable(iterable, function):
+    async for element in iterable:
+        yield function(element)
+
+
 def serialize(object_):
     """Serializes an object."""
     if callable(getattr(object_, "serialize", None)):
@@ -90,12 +219,26 @@ def serialize(object_):
     return object_
 
 
-def objetize_datetime(string):
-    """Objetizes a datetime string without checking for correctness."""
-    try:
-        return datetime.datetime.strptime(string, DATE_TIME_PATTERN)
-    except ValueError:
-        return datetime.datetime.strptime(string, "%Y-%m-%dT%H:%M:%S.%fZ")
+def objetize_datetime(string, aware=False):
+    """
+    Objetizes a datetime string, raising a ValueError if it is not a
+    valid datetime.
+    """
+    parsed = parse_iso_datetime(string, aware=aware)
+    if parsed is None:
+        raise ValueError(f"'{string}' is not a valid datetime")
+    return parsed
+
+
+def objetize_string(string, datetime_mode=DATETIME_MODE_NAIVE):
+    """
+    Objetizes a string, that becomes a datetime if it represents one,
+    as specified by :datetime_mode:.
+    """
+    if datetime_mode == DATETIME_MODE_STRING:
+        return string
+    parsed = parse_iso_datetime(string, aware=datetime_mode == DATETIME_MODE_AWARE)
+    return string if parsed is None else parsed
 
 
 def objetize(klass, client, data, handlers={}, methods=[], path=None):
@@ -107,13 +250,39 @@ def objetize(klass, client, data, handlers={}, methods=[], path=None):
     return klass(client, handlers, methods, path, **data)
 
 
+def build_objetizer(klass, client, handlers={}, methods=[], path=None):
+    """
+    Return a function that transforms dictionaries into objects with class
+    :klass:. Classes with an :objetizer: (like the compact records) share
+    data between every object built by the same function.
+    """
+    objetizer = getattr(klass, "objetizer", None)
+    if objetizer is None:
+        return lambda data: objetize(klass, client, data, handlers, methods, path)
+    build = objetizer(client, handlers, methods, path)
+    return lambda data: None if data is None else build(data)
+
+
 def objetize_generator(generator, klass, client, handlers={}, methods=[], path=None):
     """
     Transform a generator of dictionaries into a generator of
     objects with class :klass:.
     """
+    objetizer = build_objetizer(klass, client, handlers, methods, path)
     for element in generator:
-        yield objetize(klass, client, element, handlers, methods, path)
+        yield objetizer(element)
+
+
+async def objetize_async_generator(
+    generator, klass, client, handlers={}, methods=[], path=None
+):
+    """
+    Transform an asynchronous generator of dictionaries into an
+    asynchronous generator of objects with class :klass:.
+    """
+    objetizer = build_objetizer(klass, client, handlers, methods, path)
+    async for element in generator:
+        yield objetizer(element)
 
 
 def deprecate(message=None):
@@ -4,6 +4,9 @@ by PyTest.
 """
 
 import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from json.decoder import JSONDecodeError
 
 import httpx
@@ -32,99 +35,102 @@ def patch_http_error(monkeypatch):
     monkeypatch.setattr(httpx, "HTTPError", MockHTTPError)
 
 
-@pytest.fixture
-def patch_http_client(monkeypatch):
-    class MockResponse:
-        def __init__(self, method, base_url, url, params, json, headers):
-            self._base_url = base_url
-            self._params = params
-            page = None
-            if method == "get" and url[-1] == "s":
-                page = int(self._params.pop("page", 1))
-            self._page = page
-            self._method = method
-            self._url = url
-            self._json = json
-            self._headers = headers
-
-            # Extract the ID from the URL if it's a specific resource request
-            self._id = None
-            if "/" in url and not url.endswith("s"):
-                self._id = url.split("/")[-1]
-
-        @property
-        def headers(self):
-            resp_headers = dict(self._headers)
-            if self._page is not None and self._page < 10:
-                params = "&".join([*self.formatted_params, f"page={self._page + 1}"])
-                url = self._url.lstrip("/")
-                resp_headers["link"] = (
-                    f"<{self._base_url}/{url}?{params}>; " 'rel="next"'
-                )
-            return resp_headers
-
-        @property
-        def formatted_params(self):
-            return [f"{k}={v}" for k, v in self._params.items()]
-
-        def raise_for_status(self):
-            pass
+class MockResponse:
+    def __init__(self, method, base_url, url, params, json, headers):
+        self._base_url = base_url
+        self._params = params
+        page = None
+        if method == "get" and url[-1] == "s":
+            page = int(self._params.pop("page", 1))
+        self._page = page
+        self._method = method
+        self._url = url
+        self._json = json
+        self._headers = headers
+
+        # Extract the ID from the URL if it's a specific resource request
+        self._id = None
+        if "/" in url and not url.endswith("s"):
+            self._id = url.split("/")[-1]
+
+    @property
+    def headers(self):
+        resp_headers = dict(self._headers)
+        if self._page is not None and self._page < 10:
+            params = "&".join([*self.formatted_params, f"page={self._page + 1}"])
+            url = self._url.lstrip("/")
+            resp_headers["link"] = f"<{self._base_url}/{url}?{params}>; " 'rel="next"'
+        return resp_headers
+
+    @property
+    def formatted_params(self):
+        return [f"{k}={v}" for k, v in self._params.items()]
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        if self._method == "delete":
+            raise JSONDecodeError("Expecting value", "doc", 0)
+        if self._method == "get" and self._url[-1] == "s":
+            return [
+                {
+                    "id": "idx",
+                    "method": self._method,
+                    "url": self._url,
+                    "params": self._params,
+                    "json": self._json,
+                    "page": self._page,
+                    "headers": self.headers,
+                }
+                for _ in range(10)
+            ]
+        return {
+            # Use the ID from the URL if available, otherwise use "idx"
+            "id": self._id if self._id else "idx",
+            "method": self._method,
+            "url": self._url,
+            "params": self._params,
+            "json": self._json,
+            "headers": self.headers,
+        }
+
+
+def build_mock_response(base_url, request: httpx.Request):
+    query_string = request.url.query.decode("utf-8")
+    query = query_string.split("&") if query_string else []
+    inner_params = {y[0]: y[1] for y in (x.split("=") for x in query)}
+    complete_params = {
+        **inner_params,
+        **({} if request.url.params is None else request.url.params),
+    }
+    usable_url = request.url.path
+    # Materialize the (possibly streaming, e.g. multipart) request body,
+    # mirroring what the real httpx transport does before sending.
+    request.read()
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        # Multipart bodies are not utf-8/JSON-parseable; surface the raw
+        # body length so tests can assert the upload was sent.
+        body = {"multipart": True, "content_length": len(request.content)}
+    else:
+        raw_body = request.content.decode("utf-8")
+        body = json.loads(raw_body) if raw_body else None
+    return MockResponse(
+        request.method.lower(),
+        base_url,
+        usable_url.lstrip("/"),
+        complete_params,
+        body,
+        request.headers,
+    )
 
-        def json(self):
-            if self._method == "delete":
-                raise JSONDecodeError("Expecting value", "doc", 0)
-            if self._method == "get" and self._url[-1] == "s":
-                return [
-                    {
-                        "id": "idx",
-                        "method": self._method,
-                        "url": self._url,
-                        "params": self._params,
-                        "json": self._json,
-                        "page": self._page,
-                        "headers": self.headers,
-                    }
-                    for _ in range(10)
-                ]
-            return {
-                # Use the ID from the URL if available, otherwise use "idx"
-                "id": self._id if self._id else "idx",
-                "method": self._method,
-                "url": self._url,
-                "params": self._params,
-                "json": self._json,
-                "headers": self.headers,
-            }
 
+@pytest.fixture
+def patch_http_client(monkeypatch):
     class MockClient(httpx.Client):
         def send(self, request: httpx.Request, **_kwargs):
-            query_string = request.url.query.decode("utf-8")
-            query = query_string.split("&") if query_string else []
-            inner_params = {y[0]: y[1] for y in (x.split("=") for x in query)}
-            complete_params = {
-                **inner_params,
-                **({} if request.url.params is None else request.url.params),
-            }
-            usable_url = request.url.path
-            # Materialize the (possibly streaming, e.g. multipart) request body,
-            # mirroring what the real httpx transport does before sending.
-            request.read()
-            content_type = request.headers.get("content-type", "")
-            if content_type.startswith("multipart/form-data"):
-                # Multipart bodies are not utf-8/JSON-parseable; surface the raw
-                # body length so tests can assert the upload was sent.
-                body = {"multipart": True, "content_length": len(request.content)}
-            else:
-                raw_body = request.content.decode("utf-8")
-                body = json.loads(raw_body) if raw_body else None
-            return MockResponse(
-                request.method.lower(),
-                self.base_url,
-                usable_url.lstrip("/"),
-                complete_params,
-                body,
-                request.headers,
-            )
+            return build_mock_response(self.base_url, request)
 
     monkeypatch.setattr(httpx, "Client", MockClient)
 
@@ -132,3 +138,116 @@ def patch_http_client(monkeypatch):
 
     mock_client = MockClient()
     monkeypatch.setattr(Client, "_client", mock_client)
+
+
+@pytest.fixture
+def mock_http_client():
+    """
+    Return a function that builds an httpx client (an asynchronous one if
+    :asynchronous:) whose requests get answered by :handler:.
+    """
+
+    def build(handler, asynchronous=False, **kwargs):
+        http_client_class = httpx.AsyncClient if asynchronous else httpx.Client
+        return http_client_class(transport=httpx.MockTransport(handler), **kwargs)
+
+    return build
+
+
+@pytest.fixture
+def mock_client(mock_http_client):
+    """
+    Return a function that builds a client of :client_class: whose requests
+    get answered by :handler:. :kwargs: are passed to the client.
+    """
+    from fintoc.client import AsyncClient, Client
+
+    def build(handler, client_class=Client, **kwargs):
+        asynchronous = issubclass(client_class, AsyncClient)
+        return client_class(
+            "https://test.com",
+            "super_secret_api_key",
+            None,
+            "fintoc-python/test",
+            http_client=mock_http_client(handler, asynchronous=asynchronous),
+            **kwargs,
+        )
+
+    return build
+
+
+@pytest.fixture
+def movements_handler():
+    """
+    Return a function that builds a handler that answers with the
+    :movements: whose post_date is between the "since" and "until" params
+    of the request, after :delay: seconds. Every request gets appended to
+    :requests:.
+    """
+
+    def build(movements, requests, delay=0):
+        def handler(request):
+            requests.append(request)
+            time.sleep(delay)
+            since = request.url.params.get("since", "")
+            until = request.url.params.get("until", "9999")
+            return httpx.Response(
+                200,
+                json=[
+                    movement
+                    for movement in movements
+                    if since <= movement["post_date"] <= until
+                ],
+            )
+
+        return handler
+
+    return build
+
+
+@pytest.fixture
+def patch_async_http_client(monkeypatch):
+    class MockAsyncClient(httpx.AsyncClient):
+        async def send(self, request: httpx.Request, **_kwargs):
+            return build_mock_response(self.base_url, request)
+
+    # The default pools of the asynchronous clients get built on first use
+    monkeypatch.setattr(httpx, "AsyncClient", MockAsyncClient)
+
+
+class LocalHandler(BaseHTTPRequestHandler):
+    """
+    Answers each request with the (status, body) routed to its path by the
+    server. Bodies that are not strings get encoded as JSON.
+    """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.server.requests.append(self.path)
+        status, body = self.server.routes.get(self.path.split("?")[0], (404, {}))
+        if isinstance(body, str):
+            content, content_type = body.encode("utf-8"), "text/html"
+        else:
+            content, content_type = json.dumps(body).encode("utf-8"), "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Run a real HTTP server on localhost, whose URL is server.url."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LocalHandler)
+    server.requests = []
+    server.routes = {}
+    host, port = server.server_address
+    server.url = f"http://{host}:{port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,46 @@
+import pytest
+
+from fintoc.client import Client
+from fintoc.columns import INTEGER_COLUMN, STRING_COLUMN, ColumnTable
+from fintoc.managers import MovementsManager
+from fintoc.managers.v2.movements_manager import MovementsManager as MovementsManagerV2
+
+
+class TestMovementsManagerListColumns:
+    @pytest.fixture(autouse=True)
+    def patch_http_client(self, patch_http_client):
+        pass
+
+    def setup_method(self):
+        self.base_url = "https://test.com"
+        self.api_key = "super_secret_api_key"
+        self.api_version = None
+        self.user_agent = "fintoc-python/test"
+        self.client = Client(
+            self.base_url,
+            self.api_key,
+            self.api_version,
+            self.user_agent,
+        )
+        self.columns = {"id": STRING_COLUMN, "page": INTEGER_COLUMN}
+
+    @pytest.mark.parametrize(
+        "manager_class, path",
+        [
+            (MovementsManager, "/v1/accounts/acc_123/movements"),
+            (MovementsManagerV2, "/v2/accounts/{account_id}/movements"),
+        ],
+    )
+    def test_list_columns(self, manager_class, path):
+        manager = manager_class(path, self.client)
+        table = manager.list_columns(columns=self.columns, account_id="acc_123")
+        assert isinstance(table, ColumnTable)
+        assert len(table) == 100
+        assert set(table["id"]) == {"idx"}
+        assert sorted(set(table["page"])) == list(range(1, 11))
+
+    def test_default_columns(self):
+        manager = MovementsManager("/v1/accounts/acc_123/movements", self.client)
+        table = manager.list_columns()
+        assert "amount" in table.columns
+        assert len(table) == 100
@@ -1,9 +1,11 @@
 from types import GeneratorType
 
+import httpx
 import pytest
 
 from fintoc.client import Client
 from fintoc.mixins import ManagerMixin, ResourceMixin
+from fintoc.paginator import Page
 
 
 class InvalidMethodsMockManager(ManagerMixin):
@@ -122,6 +124,98 @@ class TestManagerMixinMethods:
         for object_ in objects:
             assert isinstance(object_, ResourceMixin)
 
+    def test_list_prefetch_method(self):
+        objects = self.manager.list(prefetch=2)
+        assert isinstance(objects, GeneratorType)
+        objects = list(objects)
+        assert len(objects) == 100
+        for object_ in objects:
+            assert isinstance(object_, ResourceMixin)
+            assert "prefetch" not in object_.params.serialize()
+
+    def test_list_pages_method(self):
+        pages = self.manager.list_pages()
+        assert isinstance(pages, GeneratorType)
+        pages = list(pages)
+        assert len(pages) == 10
+        for page in pages:
+            assert isinstance(page, Page)
+            assert len(page) == 10
+            for object_ in page:
+                assert isinstance(object_, ResourceMixin)
+        assert all(page.next is not None for page in pages[:-1])
+        assert pages[-1].next is None
+
+    def test_list_pages_raw_method(self):
+        page = next(self.manager.list_pages(raw=True, prefetch=1))
+        assert isinstance(page, Page)
+        for element in page.elements:
+            assert isinstance(element, dict)
+            assert "raw" not in element["params"]
+
+    def test_list_resumes_from_cursor(self):
+        # The patched httpx client builds absolute next URLs from its base URL
+        self.client = Client(
+            self.base_url,
+            self.api_key,
+            self.api_version,
+            self.user_agent,
+            http_client=httpx.Client(base_url=self.base_url),
+        )
+        self.manager = EmptyMockManager(self.path, self.client)
+        pages = self.manager.list_pages(first_param="filter")
+        first_page = next(pages)
+        cursor = first_page.cursor
+        assert isinstance(cursor, str)
+
+        objects = list(self.manager.list(cursor=cursor))
+        assert len(objects) == 90
+        assert objects[0].page == 2
+        assert objects[0].params.first_param == "filter"
+
+        resumed_pages = list(self.manager.list_pages(cursor=cursor))
+        assert len(resumed_pages) == 9
+        assert resumed_pages[-1].cursor is None
+
+    def test_list_with_invalid_cursor(self):
+        with pytest.raises(ValueError):
+            list(self.manager.list(cursor="not a cursor"))
+
+    def test_list_raw_method(self):
+        objects = self.manager.list(raw=True)
+        assert isinstance(objects, GeneratorType)
+        for object_ in objects:
+            assert isinstance(object_, dict)
+            assert "raw" not in object_["params"]
+
+        objects = self.manager.list(raw=True, lazy=False)
+        assert isinstance(objects, list)
+        assert len(objects) == 100
+        assert all(isinstance(object_, dict) for object_ in objects)
+
+    def test_get_raw_method(self):
+        object_ = self.manager.get("my_id", raw=True)
+        assert isinstance(object_, dict)
+        assert object_["url"] == "resources/my_id"
+        assert "raw" not in object_["params"]
+
+    def test_create_raw_method(self):
+        object_ = self.manager.create(raw=True, amount=1000)
+        assert isinstance(object_, dict)
+        assert object_["json"] == {"amount": 1000}
+
+    def test_client_raw_mode(self):
+        self.client.raw = True
+        assert isinstance(self.manager.get("my_id"), dict)
+        assert isinstance(next(self.manager.list()), dict)
+        assert isinstance(next(self.manager.list_pages()).elements[0], dict)
+        assert isinstance(self.manager.get("my_id", raw=False), ResourceMixin)
+
+    def test_list_pages_requires_list_method(self):
+        manager = IncompleteMockManager(self.path, self.client)
+        with pytest.raises(AttributeError):
+            manager.list_pages()
+
     def test_all_still_works_for_backwards_compatibility(self):
         objects = self.manager.all()
         assert isinstance(objects, GeneratorType)
@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 
 from fintoc.client import Client
@@ -80,6 +82,11 @@ class TestResourceMixinCreation:
         for sub_resource in resource.resources:
             assert isinstance(sub_resource, GenericFintocResource)
 
+    def test_field_resources(self):
+        assert ComplexMockResource.get_field_resource("resource") == "link"
+        assert ComplexMockResource.get_field_resource("links", is_list=True) == "link"
+        assert EmptyMockResource.get_field_resource("resource") == "resource"
+
     def test_update_delete_methods_access(self):
         methods = ["delete"]
         data = {
@@ -101,6 +108,49 @@ class TestResourceMixinCreation:
 
         resource.delete()
 
+    def test_datetime_modes(self):
+        data = {
+            "id": "id0",
+            "created_at": "2021-08-13T13:40:40Z",
+            "dates": ["2021-08-13T13:40:40Z", "2021-08-14T13:40:40.811Z"],
+        }
+        resource = EmptyMockResource(self.client, self.handlers, [], self.path, **data)
+        assert resource.created_at == datetime.datetime(2021, 8, 13, 13, 40, 40)
+        assert resource.dates[1].microsecond == 811000
+
+        client = Client(
+            self.base_url,
+            self.api_key,
+            self.api_version,
+            self.user_agent,
+            datetime_mode="aware",
+        )
+        resource = EmptyMockResource(client, self.handlers, [], self.path, **data)
+        assert resource.created_at.tzinfo == datetime.timezone.utc
+        assert all(date.tzinfo == datetime.timezone.utc for date in resource.dates)
+
+        client = Client(
+            self.base_url,
+            self.api_key,
+            self.api_version,
+            self.user_agent,
+            datetime_mode="string",
+        )
+        resource = EmptyMockResource(client, self.handlers, [], self.path, **data)
+        assert resource.created_at == data["created_at"]
+        assert resource.dates == data["dates"]
+        assert resource.serialize() == data
+
+    def test_invalid_datetime_mode(self):
+        with pytest.raises(ValueError):
+            Client(
+                self.base_url,
+                self.api_key,
+                self.api_version,
+                self.user_agent,
+                datetime_mode="local",
+            )
+
 
 class TestMixinSerializeMethod:
     @pytest.fixture(autouse=True)
@@ -284,3 +334,87 @@ class TestMixinUpdateAndDeleteMethods:
         captured = capsys.readouterr().out
         assert "update" in captured
         assert resource.url == custom_path.lstrip("/")
+
+
+class TestLazyResourceMixin:
+    @pytest.fixture(autouse=True)
+    def patch_http_client(self, patch_http_client):
+        pass
+
+    def setup_method(self):
+        self.base_url = "https://test.com"
+        self.api_key = "super_secret_api_key"
+        self.api_version = None
+        self.user_agent = "fintoc-python/test"
+        self.client = Client(
+            self.base_url,
+            self.api_key,
+            self.api_version,
+            self.user_agent,
+            lazy_attributes=True,
+        )
+        self.path = "/resources"
+        self.handlers = {
+            "update": lambda object_, identifier: print("Calling update...") or object_,
+            "delete": lambda identifier: print("Calling delete...") or identifier,
+        }
+        self.data = {
+            "id": "id0",
+            "identifier": "identifier0",
+            "created_at": "2021-08-13T13:40:40.811Z",
+            "resources": [
+                {"id": "id1", "identifier": "identifier1"},
+                {"id": "id2", "identifier": "identifier2"},
+            ],
+            "resource": {"id": "id3", "identifier": "identifier3"},
+        }
+
+    def test_attributes_get_objetized_on_access(self):
+        resource = ComplexMockResource(
+            self.client, self.handlers, [], self.path, **self.data
+        )
+        assert "resource" not in resource.__dict__
+        assert isinstance(resource.resource, Link)
+        assert resource.resource is resource.resource
+        assert "resource" in resource.__dict__
+        assert "resources" not in resource.__dict__
+        assert isinstance(resource.resources[0], GenericFintocResource)
+        assert resource.created_at == datetime.datetime(2021, 8, 13, 13, 40, 40, 811000)
+
+    def test_missing_attribute(self):
+        resource = ComplexMockResource(
+            self.client, self.handlers, [], self.path, **self.data
+        )
+        with pytest.raises(AttributeError):
+            resource.missing
+
+    def test_untouched_serialization(self):
+        resource = ComplexMockResource(
+            self.client, self.handlers, [], self.path, **self.data
+        )
+        assert resource.serialize() == self.data
+        assert resource.resources[0].id == "id1"
+        assert resource.serialize() == self.data
+
+    def test_mutated_serialization(self):
+        resource = ComplexMockResource(
+            self.client, self.handlers, [], self.path, **self.data
+        )
+        resource.identifier = "identifier4"
+        resource.resource.id = "id4"
+        serialized = resource.serialize()
+        assert serialized["identifier"] == "identifier4"
+        assert serialized["resource"]["id"] == "id4"
+        assert serialized["resources"] == self.data["resources"]
+
+    def test_update_method(self, capsys):
+        resource = EmptyMockResource(
+            self.client, self.handlers, ["update"], self.path, **self.data
+        )
+        assert resource.id == "id0"
+        resource.update()
+
+        captured = capsys.readouterr().out
+        assert "update" in captured
+        assert self.data["id"] in resource.url
+        assert resource.method == "patch"
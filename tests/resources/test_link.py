@@ -104,3 +104,23 @@ class TestLinkResource:
         assert link.refresh_intents is not None
         assert isinstance(link.refresh_intents, ManagerMixin)
         assert isinstance(link._Link__refresh_intents_manager, ManagerMixin)
+
+    @pytest.mark.parametrize("lazy_attributes", [False, True])
+    def test_link_with_accounts(self, lazy_attributes):
+        client = Client(
+            self.base_url,
+            self.api_key,
+            self.api_version,
+            self.user_agent,
+            lazy_attributes=lazy_attributes,
+        )
+        data = {
+            "id": "link_1",
+            "holder_type": "individual",
+            "accounts": [{"id": "acc_1", "object": "account"}],
+        }
+        link = Link(client, self.handlers, [], self.path, **data)
+
+        assert link.id == "link_1"
+        assert isinstance(link.accounts, ManagerMixin)
+        assert link.serialize() == {"id": "link_1", "holder_type": "individual"}
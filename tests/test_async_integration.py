@@ -0,0 +1,130 @@
+"""Integration tests for the AsyncFintoc core object."""
+
+import asyncio
+from types import AsyncGeneratorType
+
+import pytest
+
+from fintoc.core import AsyncFintoc
+from fintoc.resources import Link
+
+
+class TestAsyncFintocIntegration:
+    """Test class to verify AsyncFintoc integration with managers."""
+
+    @pytest.fixture(autouse=True)
+    def patch_async_http_client(self, patch_async_http_client):
+        """Use the mock asynchronous HTTP client from conftest.py."""
+        pass
+
+    def setup_method(self):
+        """Set up the test environment."""
+        self.api_key = "test_api_key"
+        self.fintoc = AsyncFintoc(self.api_key)
+
+    def test_links_list(self):
+        """Test that fintoc.links.list() returns an async generator."""
+        links = self.fintoc.links.list()
+        assert isinstance(links, AsyncGeneratorType)
+
+        async def consume():
+            return [link async for link in links]
+
+        links = asyncio.run(consume())
+        assert len(links) == 100
+        for link in links:
+            assert isinstance(link, Link)
+            assert link.url == "v1/links"
+
+    def test_links_list_pages(self):
+        """Test that fintoc.links.list_pages() returns an async generator."""
+
+        async def consume():
+            return [page async for page in self.fintoc.links.list_pages()]
+
+        pages = asyncio.run(consume())
+        assert len(pages) == 10
+        for page in pages:
+            assert len(page.elements) == 10
+            assert isinstance(page.elements[0], Link)
+
+    def test_links_list_not_lazy(self):
+        """Test that fintoc.links.list(lazy=False) resolves to a list."""
+        links = asyncio.run(self.fintoc.links.list(lazy=False))
+
+        assert isinstance(links, list)
+        assert len(links) == 100
+
+    def test_links_get(self):
+        """Test that fintoc.links.get() runs the post get handler."""
+        link_token = "test_link_token"
+
+        link = asyncio.run(self.fintoc.links.get(link_token))
+
+        assert link.method == "get"
+        assert link.url == f"v1/links/{link_token}"
+        assert link._link_token == link_token  # pylint: disable=protected-access
+
+    def test_link_accounts_list(self):
+        """Test that nested managers use the asynchronous client."""
+        link_token = "test_link_token"
+
+        async def fetch_accounts():
+            link = await self.fintoc.links.get(link_token)
+            return [account async for account in link.accounts.list()]
+
+        accounts = asyncio.run(fetch_accounts())
+        assert len(accounts) > 0
+        for account in accounts:
+            assert account.url == "v1/accounts"
+            assert account.params.link_token == link_token
+
+    def test_links_update(self):
+        """Test that fintoc.links.update() calls the correct URL."""
+        link_token = "test_link_token"
+
+        link = asyncio.run(self.fintoc.links.update(link_token, active=False))
+
+        assert link.method == "patch"
+        assert link.url == f"v1/links/{link_token}"
+        assert link.json.active is False
+
+    def test_links_delete(self):
+        """Test that fintoc.links.delete() returns the identifier."""
+        link_id = "test_link_id"
+
+        result = asyncio.run(self.fintoc.links.delete(link_id))
+
+        assert result == link_id
+
+    def test_v2_transfers_create(self):
+        """Test that fintoc.v2.transfers.create() calls the correct URL."""
+        transfer = asyncio.run(
+            self.fintoc.v2.transfers.create(
+                amount=1000, currency="mxn", idempotency_key="1234"
+            )
+        )
+
+        assert transfer.method == "post"
+        assert transfer.url == "v2/transfers"
+        assert transfer.json.amount == 1000
+        assert getattr(transfer.headers, "idempotency-key") == "1234"
+
+    def test_v2_transfers_return(self):
+        """Test that custom actions are awaitable."""
+        transfer = asyncio.run(self.fintoc.v2.transfers.return_(transfer_id="tr_1"))
+
+        assert transfer.method == "post"
+        assert transfer.url == "v2/transfers/return"
+
+    def test_resource_update(self):
+        """Test that resource methods are awaitable."""
+
+        async def update_endpoint():
+            endpoint = await self.fintoc.webhook_endpoints.get("we_1")
+            return await endpoint.update(disabled=True)
+
+        endpoint = asyncio.run(update_endpoint())
+
+        assert endpoint.method == "patch"
+        assert endpoint.url == "v1/webhook_endpoints/we_1"
@@ -0,0 +1,243 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from fintoc.batch import (
+    BatchItem,
+    BatchResult,
+    build_idempotency_key,
+    run_batch,
+    run_batch_async,
+)
+from fintoc.client import AsyncClient, Client
+from fintoc.errors import ApiError, InvalidRequestError
+from fintoc.managers import PaymentIntentsManager
+from fintoc.managers.v2 import TransfersManager
+
+
+def get_or_fail(key):
+    if key % 3 == 0:
+        raise ApiError({"type": "api_error", "message": f"Failed {key}"})
+    return key * 10
+
+
+async def get_or_fail_async(key):
+    await asyncio.sleep(0)
+    return get_or_fail(key)
+
+
+def get_or_missing(request):
+    """Answer with the requested instance, failing for the 'missing' identifier."""
+    if request.url.path.endswith("/missing"):
+        error = {"type": "invalid_request_error", "message": "Not found"}
+        return httpx.Response(404, json={"error": error})
+    return httpx.Response(200, json={"id": request.url.path.split("/")[-1]})
+
+
+class TestBatchResult:
+    def setup_method(self):
+        self.error = ApiError({"type": "api_error", "message": "Failed"})
+        self.result = BatchResult(
+            [BatchItem("a", value=1), BatchItem("b", error=self.error)]
+        )
+
+    def test_result_items(self):
+        assert len(self.result) == 2
+        assert self.result[0].ok
+        assert self.result.values == [1, None]
+        assert [item.key for item in self.result.succeeded] == ["a"]
+        assert [item.key for item in self.result.failed] == ["b"]
+        assert self.result.errors == {"b": self.error}
+
+    def test_raise_for_errors(self):
+        with pytest.raises(ApiError):
+            self.result.raise_for_errors()
+        BatchResult([BatchItem("a", value=1)]).raise_for_errors()
+
+
+class TestRunBatch:
+    def test_results_keep_order(self):
+        result = run_batch(get_or_fail, range(1, 10), concurrency=4)
+        assert [item.key for item in result] == list(range(1, 10))
+        assert result[0].value == 10
+        assert set(result.errors) == {3, 6, 9}
+
+    def test_sequential_batch(self):
+        result = run_batch(get_or_fail, [1, 2, 3], concurrency=1)
+        assert result.values == [10, 20, None]
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            run_batch(get_or_fail, [1], concurrency=0)
+
+    def test_unexpected_errors_abort_the_batch(self):
+        with pytest.raises(ZeroDivisionError):
+            run_batch(lambda key: 1 / key, [1, 0], concurrency=2)
+
+    def test_async_results_keep_order(self):
+        result = asyncio.run(
+            run_batch_async(get_or_fail_async, range(1, 10), concurrency=2)
+        )
+        assert [item.key for item in result] == list(range(1, 10))
+        assert set(result.errors) == {3, 6, 9}
+
+
+class TestManagerGetMany:
+    def test_get_many(self, mock_client):
+        client = mock_client(get_or_missing)
+        manager = PaymentIntentsManager("/v1/payment_intents", client)
+        result = manager.get_many(["pi_1", "missing", "pi_2"], concurrency=2)
+        assert [item.key for item in result] == ["pi_1", "missing", "pi_2"]
+        assert result[0].value.id == "pi_1"
+        assert result[2].value.id == "pi_2"
+        assert isinstance(result.errors["missing"], InvalidRequestError)
+
+    def test_get_many_collects_gateway_errors(self, local_server):
+        local_server.routes["/v1/payment_intents/pi_1"] = (200, {"id": "pi_1"})
+        local_server.routes["/v1/payment_intents/pi_2"] = (200, {"id": "pi_2"})
+        local_server.routes["/v1/payment_intents/bad"] = (502, "<html>Bad</html>")
+        client = Client(local_server.url, "super_secret_api_key", None, "test")
+        manager = PaymentIntentsManager("/v1/payment_intents", client)
+        result = manager.get_many(["pi_1", "missing", "bad", "pi_2"], concurrency=2)
+        assert len(result) == 4
+        assert result[3].value.id == "pi_2"
+        assert isinstance(result.errors["bad"], ApiError)
+        assert [item.key for item in result.retryable] == ["bad"]
+        assert [item.key for item in result.failed] == ["missing", "bad"]
+
+    def test_get_many_raw(self, mock_client):
+        client = mock_client(get_or_missing)
+        manager = PaymentIntentsManager("/v1/payment_intents", client)
+        result = manager.get_many(["pi_1"], raw=True)
+        assert result.values == [{"id": "pi_1"}]
+
+    def test_async_get_many(self, mock_client):
+        async def get_many():
+            client = mock_client(get_or_missing, client_class=AsyncClient)
+            manager = PaymentIntentsManager("/v1/payment_intents", client)
+            return await manager.get_many(["pi_1", "missing"], concurrency=2)
+
+        result = asyncio.run(get_many())
+        assert result[0].value.id == "pi_1"
+        assert isinstance(result.errors["missing"], InvalidRequestError)
+
+
+def build_transfers_handler(requests):
+    """
+    Build a handler that creates transfers, failing for the comments
+    "invalid" (with a 400) and "unavailable" (with a 503).
+    """
+
+    def handler(request):
+        requests.append(request)
+        data = json.loads(request.content)
+        if data["comment"] in ("invalid", "unavailable"):
+            invalid = data["comment"] == "invalid"
+            error_type = "invalid_request_error" if invalid else "api_error"
+            status = 400 if invalid else 503
+            return httpx.Response(status, json={"error": {"type": error_type}})
+        return httpx.Response(201, json={"id": f"tr_{data['comment']}", **data})
+
+    return handler
+
+
+class TestBuildIdempotencyKey:
+    def test_deterministic_keys(self):
+        params = {"amount": 1, "comment": "a"}
+        key = build_idempotency_key("batch_1", 0, params)
+        assert key == build_idempotency_key("batch_1", 0, {"comment": "a", "amount": 1})
+        assert key != build_idempotency_key("batch_1", 1, params)
+        assert key != build_idempotency_key("batch_1", 0, {**params, "account": "b"})
+
+    def test_separate_batches_of_identical_items_get_different_keys(self):
+        params = {"amount": 1, "comment": "payroll"}
+        assert build_idempotency_key("batch_1", 0, params) != build_idempotency_key(
+            "batch_2", 0, params
+        )
+
+
+class TestTransfersCreateMany:
+    def setup_method(self):
+        self.items = [
+            {"amount": 1000, "currency": "clp", "comment": "first"},
+            {"amount": 2000, "currency": "clp", "comment": "invalid"},
+            {"amount": 3000, "currency": "clp", "comment": "unavailable"},
+        ]
+
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_client):
+        self.mock_client = mock_client
+
+    def build_manager(self, requests, client_class=Client):
+        client = self.mock_client(
+            build_transfers_handler(requests), client_class=client_class
+        )
+        return TransfersManager("/v2/transfers", client)
+
+    def test_create_many(self):
+        requests = []
+        manager = self.build_manager(requests)
+        result = manager.create_many(
+            self.items, batch_id="batch_1", concurrency=2, account_id="acc_1"
+        )
+
+        assert [item.key for item in result] == [0, 1, 2]
+        assert [item.status for item in result] == ["created", "failed", "retryable"]
+        assert result[0].value.id == "tr_first"
+        assert result[0].value.account_id == "acc_1"
+        assert [item.key for item in result.retryable] == [2]
+
+        keys = {
+            json.loads(request.content)["comment"]: request.headers["idempotency-key"]
+            for request in requests
+        }
+        requests.clear()
+        retry = {item.key: self.items[item.key] for item in result.retryable}
+        manager.create_many(retry, batch_id="batch_1", account_id="acc_1")
+        assert requests[0].headers["idempotency-key"] == keys["unavailable"]
+
+    def test_separate_batches_of_identical_items_get_different_keys(self):
+        requests = []
+        manager = self.build_manager(requests)
+        items = [{"amount": 1000, "currency": "clp", "comment": "payroll"}] * 2
+        manager.create_many(items, batch_id="payroll_january")
+        manager.create_many(items, batch_id="payroll_february")
+        keys = [request.headers["idempotency-key"] for request in requests]
+        assert len(set(keys)) == 4
+
+    def test_kwargs_are_part_of_the_keys(self):
+        requests = []
+        manager = self.build_manager(requests)
+        manager.create_many(self.items[:1], batch_id="batch_1", account_id="acc_1")
+        manager.create_many(self.items[:1], batch_id="batch_1", account_id="acc_2")
+        assert len({request.headers["idempotency-key"] for request in requests}) == 2
+
+    def test_custom_keys(self):
+        requests = []
+        manager = self.build_manager(requests)
+        manager.create_many(
+            self.items[:1],
+            idempotency_key_fn=lambda params: f"{params['account_id']}_1",
+            account_id="acc_1",
+        )
+        assert requests[0].headers["idempotency-key"] == "acc_1_1"
+
+    def test_create_many_requires_batch_id(self):
+        manager = self.build_manager([])
+        with pytest.raises(ValueError):
+            manager.create_many(self.items)
+
+    def test_async_create_many(self):
+        requests = []
+
+        async def create_many():
+            manager = self.build_manager(requests, client_class=AsyncClient)
+            return await manager.create_many(
+                self.items, batch_id="batch_1", concurrency=2
+            )
+
+        result = asyncio.run(create_many())
+        assert [item.status for item in result] == ["created", "failed", "retryable"]
+        assert len({request.headers["idempotency-key"] for request in requests}) == 3
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from fintoc.cache import MemoryCache, ResponseCache, SQLiteCache
+from fintoc.client import AsyncClient
+from fintoc.core import Fintoc
+from fintoc.errors import WebhookSignatureError
+from fintoc.webhook import WebhookSignature
+
+
+def build_handler(requests):
+    """Build a handler that stores each request."""
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={"id": request.url.path.split("/")[-1], "count": len(requests)},
+        )
+
+    return handler
+
+
+class TestMemoryCache:
+    def test_set_and_get(self):
+        cache = MemoryCache()
+        value = {"nested": {"value": 1}}
+        cache.set("key", value, 10, "/v1/links/link_1")
+        value["nested"]["value"] = 2
+        assert cache.get("key") == {"nested": {"value": 1}}
+        assert cache.get("missing") is None
+
+    def test_expired_values_are_missing(self):
+        cache = MemoryCache()
+        cache.set("key", {"value": 1}, 0.01, "/v1/links/link_1")
+        time.sleep(0.02)
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_values_get_evicted(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("first", 1, 10, "/first")
+        cache.set("second", 2, 10, "/second")
+        cache.get("first")
+        cache.set("third", 3, 10, "/third")
+        assert cache.get("first") == 1
+        assert cache.get("second") is None
+        assert cache.get("third") == 3
+
+    def test_evict_by_segment(self):
+        cache = MemoryCache()
+        cache.set("link", 1, 10, "/v1/links/link_1")
+        cache.set("movement", 2, 10, "/v1/accounts/acc_1/movements/mov_1")
+        cache.set("other", 3, 10, "/v1/links/link_10")
+        cache.evict("link_1")
+        assert cache.get("link") is None
+        assert cache.get("movement") == 2
+        assert cache.get("other") == 3
+
+
+class TestSQLiteCache:
+    def test_set_get_and_evict(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("link", {"id": "link_1"}, 10, "/v1/links/link_1")
+        cache.set("other", {"id": "link_10"}, 10, "/v1/links/link_10")
+        assert cache.get("link") == {"id": "link_1"}
+        cache.evict("link_1")
+        assert cache.get("link") is None
+        assert cache.get("other") == {"id": "link_10"}
+        cache.close()
+
+    def test_values_are_shared_between_connections(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        SQLiteCache(path).set("key", [1, 2], 10, "/path")
+        assert SQLiteCache(path).get("key") == [1, 2]
+
+    def test_expired_and_least_recently_used_values(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=1)
+        cache.set("expired", 1, -1, "/expired")
+        assert cache.get("expired") is None
+        cache.set("first", 1, 10, "/first")
+        cache.set("second", 2, 10, "/second")
+        assert cache.get("first") is None
+        assert cache.get("second") == 2
+
+
+class TestResponseCache:
+    def test_ttl_of_the_longest_prefix(self):
+        cache = ResponseCache(ttls={"/v1": 5, "/v1/links": 60}, default_ttl=1)
+        assert cache.get_ttl("/v1/links/link_1") == 60
+        assert cache.get_ttl("/v1/accounts/acc_1") == 5
+        assert cache.get_ttl("/v2/products") == 1
+
+    def test_responses_without_ttl_are_not_stored(self):
+        cache = ResponseCache(ttls={"/v1/links": 60})
+        cache.set("key", {"id": "acc_1"}, "/v1/accounts/acc_1")
+        assert cache.get("key") is None
+
+    def test_keys_do_not_include_the_api_key(self):
+        key = ResponseCache.build_key("https://test.com/v1/links", "sk_secret")
+        assert "sk_secret" not in key
+        assert key != ResponseCache.build_key("https://test.com/v1/links", "sk_other")
+
+    def test_evict_path(self):
+        cache = ResponseCache(default_ttl=60)
+        cache.set("customer", {"id": "cus_1"}, "/v2/customers/cus_1")
+        cache.set("other", {"id": "cus_2"}, "/v2/customers/cus_2")
+        cache.evict_path("https://test.com/v2/customers/cus_1/archive")
+        assert cache.get("customer") is None
+        assert cache.get("other") == {"id": "cus_2"}
+
+    def test_evict_from_webhook(self):
+        cache = ResponseCache(default_ttl=60)
+        cache.set("intent", {"id": "pi_1"}, "/v1/payment_intents/pi_1")
+        payload = json.dumps(
+            {"type": "payment_intent.succeeded", "data": {"id": "pi_1"}}
+        )
+        timestamp = int(time.time())
+        signature = WebhookSignature._compute_signature(payload, timestamp, "secret")
+        header = f"t={timestamp},v1={signature}"
+
+        with pytest.raises(WebhookSignatureError):
+            cache.evict_from_webhook(payload, header, "wrong_secret")
+        assert cache.get("intent") == {"id": "pi_1"}
+
+        event = cache.evict_from_webhook(payload, header, "secret")
+        assert event["type"] == "payment_intent.succeeded"
+        assert cache.get("intent") is None
+
+
+class TestClientResponseCache:
+    def test_gets_are_answered_from_the_cache(self, mock_client):
+        requests = []
+        client = mock_client(
+            build_handler(requests), cache=ResponseCache(ttls={"/v1/links": 60})
+        )
+        first = client.request("/v1/links/link_1")
+        second = client.request("/v1/links/link_1")
+        client.request("/v1/accounts/acc_1")
+        client.request("/v1/accounts/acc_1")
+        assert first == second == {"id": "link_1", "count": 1}
+        assert len(requests) == 3
+
+    def test_writes_evict_the_cached_responses(self, mock_client):
+        requests = []
+        client = mock_client(
+            build_handler(requests), cache=ResponseCache(default_ttl=60)
+        )
+        client.request("/v1/links/link_1")
+        client.request("/v1/links/link_1", method="patch", json={"active": False})
+        assert client.request("/v1/links/link_1")["count"] == 3
+
+    def test_async_gets_are_answered_from_the_cache(self, mock_client):
+        requests = []
+        client = mock_client(
+            build_handler(requests),
+            client_class=AsyncClient,
+            cache=ResponseCache(default_ttl=60),
+        )
+
+        async def run():
+            return [
+                await client.request("/v1/links/link_1"),
+                await client.request("/v1/links/link_1"),
+            ]
+
+        assert asyncio.run(run()) == [{"id": "link_1", "count": 1}] * 2
+        assert len(requests) == 1
+
+    def test_cache_is_passed_to_the_clients(self):
+        cache = ResponseCache(default_ttl=60)
+        fintoc = Fintoc("super_secret_api_key", cache=cache)
+        assert fintoc._client.cache is cache
+        assert fintoc._client.extend(params={"link_token": "token"}).cache is cache
@@ -1,9 +1,10 @@
-from types import GeneratorType
+import asyncio
+from types import AsyncGeneratorType, GeneratorType
 
 import httpx
 import pytest
 
-from fintoc.client import Client
+from fintoc.client import AsyncClient, Client
 
 
 class TestClientCreationFunctionality:
@@ -132,3 +133,51 @@ class TestClientRequestFunctionality:
 
         idempotency_key = data["headers"]["idempotency-key"]
         assert idempotency_key == "1234"
+
+
+class TestAsyncClientRequestFunctionality:
+    @pytest.fixture(autouse=True)
+    def patch_async_http_client(self, patch_async_http_client):
+        pass
+
+    def setup_method(self):
+        self.base_url = "https://test.com"
+        self.api_key = "super_secret_api_key"
+        self.api_version = None
+        self.user_agent = "fintoc-python/test"
+        self.client = AsyncClient(
+            self.base_url,
+            self.api_key,
+            self.api_version,
+            self.user_agent,
+        )
+
+    def test_paginated_request(self):
+        data = self.client.request("/movements", paginated=True)
+        assert isinstance(data, AsyncGeneratorType)
+
+        async def consume():
+            return [element async for element in data]
+
+        elements = asyncio.run(consume())
+        assert len(elements) == 100
+
+    def test_get_request(self):
+        data = asyncio.run(self.client.request("/movements/3", method="get"))
+        assert isinstance(data, dict)
+        assert data["url"] == "movements/3"
+
+    def test_delete_request(self):
+        data = asyncio.run(self.client.request("/movements/3", method="delete"))
+        assert data == {}
+
+    def test_post_request_with_custom_idempotency_key(self):
+        data = asyncio.run(
+            self.client.request("/v2/transfers", method="post", idempotency_key="1234")
+        )
+        assert data["headers"]["idempotency-key"] == "1234"
+
+    def test_client_extension(self):
+        new_client = self.client.extend(params={"link_token": "link_token"})
+        assert isinstance(new_client, AsyncClient)
+        assert new_client.params == {"link_token": "link_token"}
@@ -0,0 +1,118 @@
+import asyncio
+import datetime
+from array import array
+
+import pytest
+
+from fintoc import columns
+from fintoc.columns import (
+    MOVEMENT_COLUMNS,
+    NULL_DATETIME,
+    NULL_INTEGER,
+    ColumnTable,
+    build_column_table,
+    to_epoch_microseconds,
+)
+
+
+def build_movements():
+    return [
+        {
+            "id": f"mov_{index}",
+            "amount": 1000 * index,
+            "currency": "CLP",
+            "type": "transfer",
+            "description": f"Movement {index}",
+            "post_date": "2021-08-13T13:40:40Z",
+            "transaction_date": None,
+        }
+        for index in range(5)
+    ]
+
+
+class TestToEpochMicroseconds:
+    def test_valid_datetime(self):
+        expected = datetime.datetime(
+            2021, 8, 13, 13, 40, 40, 811000
+        ) - datetime.datetime(1970, 1, 1)
+        assert to_epoch_microseconds("2021-08-13T13:40:40.811Z") == (
+            expected // datetime.timedelta(microseconds=1)
+        )
+
+    def test_invalid_datetime(self):
+        assert to_epoch_microseconds("This is not a date") == NULL_DATETIME
+        assert to_epoch_microseconds(None) == NULL_DATETIME
+
+
+class TestColumnTable:
+    def test_append_elements(self):
+        table = ColumnTable(MOVEMENT_COLUMNS)
+        table.extend(build_movements())
+        assert len(table) == 5
+        assert isinstance(table["amount"], array)
+        assert list(table["amount"]) == [0, 1000, 2000, 3000, 4000]
+        assert table["id"][1] == "mov_1"
+        assert table["currency"][0] is table["currency"][4]
+        assert table["post_date"][0] == to_epoch_microseconds("2021-08-13T13:40:40Z")
+        assert table["transaction_date"][0] == NULL_DATETIME
+
+    def test_missing_integers(self):
+        table = ColumnTable(MOVEMENT_COLUMNS)
+        table.extend([{"amount": 0}, {"amount": None}, {}])
+        assert list(table["amount"]) == [0, NULL_INTEGER, NULL_INTEGER]
+
+    def test_empty_table(self):
+        table = ColumnTable(MOVEMENT_COLUMNS)
+        assert len(table) == 0
+        assert len(ColumnTable({})) == 0
+
+    def test_to_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        table = ColumnTable(MOVEMENT_COLUMNS)
+        table.extend(build_movements())
+        table.append({"id": "mov_5", "amount": None})
+        arrays = table.to_numpy()
+        assert arrays["amount"].dtype == numpy.int64
+        assert arrays["amount"].sum() == 10000
+        assert arrays["amount"].mask.tolist() == [False] * 5 + [True]
+        assert arrays["post_date"][0] == numpy.datetime64("2021-08-13T13:40:40")
+        assert numpy.isnat(arrays["transaction_date"][0])
+
+    def test_to_arrow(self):
+        pytest.importorskip("pyarrow")
+        table = ColumnTable(MOVEMENT_COLUMNS)
+        table.extend(build_movements())
+        table.append({"id": "mov_5", "amount": None})
+        arrow_table = table.to_arrow()
+        assert arrow_table.num_rows == 6
+        assert arrow_table.column("amount").null_count == 1
+        assert arrow_table.column("transaction_date").null_count == 6
+
+    @pytest.mark.parametrize(
+        ("module", "method"), [("numpy", "to_numpy"), ("pyarrow", "to_arrow")]
+    )
+    def test_missing_optional_package(self, monkeypatch, module, method):
+        monkeypatch.setattr(columns, module, None)
+        table = ColumnTable(MOVEMENT_COLUMNS)
+        with pytest.raises(ImportError):
+            getattr(table, method)()
+
+
+class TestBuildColumnTable:
+    def test_build_from_pages(self):
+        movements = build_movements()
+        table = build_column_table([movements[:3], movements[3:]], MOVEMENT_COLUMNS)
+        assert isinstance(table, ColumnTable)
+        assert list(table["id"]) == [movement["id"] for movement in movements]
+
+    def test_build_from_async_pages(self):
+        async def get_pages():
+            yield build_movements()
+            yield build_movements()
+
+        table = asyncio.run(build_column_table(get_pages(), MOVEMENT_COLUMNS))
+        assert len(table) == 10
+
+    def test_invalid_output(self):
+        with pytest.raises(ValueError):
+            build_column_table([], MOVEMENT_COLUMNS, output="pandas")
@@ -0,0 +1,171 @@
+import asyncio
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from fintoc.cache import ValidatorCache
+from fintoc.client import AsyncClient, Client
+from fintoc.core import Fintoc
+from fintoc.managers import AccountsManager
+from fintoc.mixins import ResourceMixin
+from fintoc.resources import Account
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the accounts of the server with an ETag, answering 304 if unchanged."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.server.requests.append(dict(self.headers))
+        account = self.server.accounts.get(self.path.split("?")[0].split("/")[-1])
+        if account is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = json.dumps(account).encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    server.accounts = {"acc_1": {"id": "acc_1", "name": "Checking", "balance": 100}}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def build_client(server, client_class=Client, **kwargs):
+    host, port = server.server_address
+    return client_class(
+        base_url=f"http://{host}:{port}",
+        api_key="super_secret_api_key",
+        api_version=None,
+        user_agent="fintoc-python/test",
+        validators=ValidatorCache(),
+        **kwargs,
+    )
+
+
+class TestValidatorCache:
+    def test_remembers_responses_with_validators(self):
+        validators = ValidatorCache()
+        data = {"id": "acc_1"}
+        validators.set("key", httpx.Headers({"ETag": '"v1"'}), data)
+        data["id"] = "changed"
+        assert validators.get("key") == ('"v1"', None, {"id": "acc_1"})
+
+    def test_forgets_responses_without_validators(self):
+        validators = ValidatorCache()
+        validators.set("key", httpx.Headers({"ETag": '"v1"'}), {})
+        validators.set("key", httpx.Headers(), {})
+        assert validators.get("key") is None
+
+    def test_least_recently_used_responses_get_evicted(self):
+        validators = ValidatorCache(max_entries=1)
+        validators.set("first", httpx.Headers({"ETag": '"v1"'}), {})
+        validators.set("second", httpx.Headers({"ETag": '"v2"'}), {})
+        assert validators.get("first") is None
+        assert len(validators) == 1
+
+
+class TestConditionalRequests:
+    def test_requests_send_the_remembered_validators(self, server):
+        client = build_client(server)
+        first = client.request("/v1/accounts/acc_1")
+        second = client.request("/v1/accounts/acc_1")
+        assert first == second == server.accounts["acc_1"]
+        assert "If-None-Match" not in server.requests[0]
+        assert server.requests[1]["If-None-Match"].startswith('"')
+        assert server.requests[1]["If-Modified-Since"] == (
+            "Wed, 01 Jan 2025 00:00:00 GMT"
+        )
+
+    def test_unchanged_responses_get_copied(self, server):
+        client = build_client(server)
+        first = client.request("/v1/accounts/acc_1")
+        first["name"] = "Mutated"
+        assert client.request("/v1/accounts/acc_1")["name"] == "Checking"
+
+    def test_refresh_keeps_unchanged_resources(self, server):
+        manager = AccountsManager("/v1/accounts", build_client(server))
+        account = manager.get("acc_1")
+        assert isinstance(account, ResourceMixin)
+        assert account.refresh() is account
+        assert account.balance == 100
+        assert len(server.requests) == 2
+
+    def test_refresh_updates_changed_resources(self, server):
+        manager = AccountsManager("/v1/accounts", build_client(server))
+        account = manager.get("acc_1")
+        server.accounts["acc_1"] = {"id": "acc_1", "name": "Savings", "balance": 50}
+        assert account.refresh() is account
+        assert account.name == "Savings"
+        assert account.balance == 50
+
+    def test_refresh_works_without_validators(self, server):
+        client = build_client(server)
+        client.validators = None
+        account = AccountsManager("/v1/accounts", client).get("acc_1")
+        server.accounts["acc_1"]["balance"] = 0
+        assert account.refresh().balance == 0
+        assert "If-None-Match" not in server.requests[1]
+
+    def test_refresh_of_compact_records(self, server):
+        manager = AccountsManager("/v1/accounts", build_client(server, compact=True))
+        account = manager.get("acc_1")
+        assert account.refresh() is account
+        server.accounts["acc_1"]["balance"] = 10
+        assert account.refresh().balance == 10
+
+    def test_refresh_requires_get(self, server):
+        account = Account(build_client(server), {}, ["list"], "/v1/accounts", id="a")
+        with pytest.raises(AttributeError):
+            account.refresh()
+
+    def test_refresh_requires_path(self, server):
+        account = Account(build_client(server), {}, ["get"], None, id="acc_1")
+        with pytest.raises(ValueError):
+            account.refresh()
+        assert server.requests == []
+
+    def test_async_refresh(self, server):
+        client = build_client(server, client_class=AsyncClient)
+        manager = AccountsManager("/v1/accounts", client)
+
+        async def run():
+            account = await manager.get("acc_1")
+            unchanged = await account.refresh()
+            server.accounts["acc_1"]["name"] = "Savings"
+            changed = await account.refresh()
+            return account, unchanged, changed
+
+        account, unchanged, changed = asyncio.run(run())
+        assert unchanged is changed is account
+        assert account.name == "Savings"
+
+    def test_conditional_requests_option(self):
+        fintoc = Fintoc("super_secret_api_key", conditional_requests=True)
+        assert isinstance(fintoc._client.validators, ValidatorCache)
+        assert Fintoc("super_secret_api_key")._client.validators is None
@@ -1,5 +1,5 @@
-from fintoc.client import Client
-from fintoc.core import Fintoc
+from fintoc.client import AsyncClient, Client
+from fintoc.core import AsyncFintoc, Fintoc
 from fintoc.mixins import ManagerMixin
 
 
@@ -24,3 +24,18 @@ class TestCoreFintocObject:
         api_key = "super_secret_api_key"
         fintoc = Fintoc(api_key)
         assert "Fintoc-Version" not in fintoc._client.headers
+
+    def test_async_object_creation(self):
+        # pylint: disable=protected-access
+        api_key = "super_secret_api_key"
+        fintoc = AsyncFintoc(api_key)
+        assert isinstance(fintoc._client, AsyncClient)
+        assert isinstance(fintoc.links, ManagerMixin)
+        assert isinstance(fintoc.v2.transfers, ManagerMixin)
+        assert fintoc.v2.transfers._client is fintoc._client
+
+    def test_fintoc_creation_with_raw_mode(self):
+        # pylint: disable=protected-access
+        fintoc = Fintoc("super_secret_api_key", raw=True)
+        assert fintoc._client.raw
+        assert fintoc._client.extend(params={"link_token": "token"}).raw
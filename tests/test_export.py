@@ -0,0 +1,150 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from fintoc.__main__ import main
+from fintoc.core import Fintoc
+from fintoc.export import (
+    export,
+    export_to_file,
+    infer_format,
+    resolve_manager,
+    write_csv,
+    write_ndjson,
+)
+
+
+class TestResolveManager:
+    def setup_method(self):
+        self.fintoc = Fintoc("super_secret_api_key")
+
+    def test_valid_resources(self):
+        assert resolve_manager(self.fintoc, "links") is self.fintoc.links
+        manager = resolve_manager(self.fintoc, "v2.accounts.movements")
+        assert manager is self.fintoc.v2.accounts.movements
+
+    def test_invalid_resources(self):
+        with pytest.raises(ValueError):
+            resolve_manager(self.fintoc, "v2.this_resource_does_not_exist")
+        with pytest.raises(ValueError):
+            resolve_manager(self.fintoc, "v2")
+        with pytest.raises(ValueError):
+            resolve_manager(self.fintoc, "_client")
+
+
+class TestInferFormat:
+    def test_known_extensions(self):
+        assert infer_format("movements.ndjson") == "ndjson"
+        assert infer_format("movements.jsonl.gz") == "ndjson"
+        assert infer_format("movements.CSV") == "csv"
+
+    def test_unknown_extension(self):
+        assert infer_format("movements.txt") is None
+
+
+class TestWriters:
+    def setup_method(self):
+        self.elements = [
+            {"id": "mov_1", "amount": 1000, "metadata": {"order": "1"}},
+            {"id": "mov_2", "amount": 2000, "metadata": {}},
+        ]
+
+    def test_write_ndjson(self):
+        stream = io.StringIO()
+        assert write_ndjson(iter(self.elements), stream) == 2
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == self.elements
+
+    def test_write_csv(self):
+        stream = io.StringIO()
+        assert write_csv(iter(self.elements), stream) == 2
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        assert rows[0] == {
+            "id": "mov_1",
+            "amount": "1000",
+            "metadata": '{"order": "1"}',
+        }
+
+    def test_write_csv_fields(self):
+        stream = io.StringIO()
+        write_csv(iter(self.elements), stream, fields=["id"])
+        assert stream.getvalue().splitlines() == ["id", "mov_1", "mov_2"]
+
+    def test_write_nothing(self):
+        stream = io.StringIO()
+        assert write_csv(iter([]), stream) == 0
+        assert stream.getvalue() == ""
+
+
+class TestExport:
+    @pytest.fixture(autouse=True)
+    def patch_http_client(self, patch_http_client):
+        pass
+
+    def setup_method(self):
+        self.fintoc = Fintoc("super_secret_api_key")
+        self.manager = self.fintoc.v2.accounts.movements
+
+    def test_export_ndjson(self):
+        stream = io.StringIO()
+        assert export(self.manager, stream, account_id="acc_123") == 100
+        element = json.loads(stream.getvalue().splitlines()[0])
+        assert element["url"] == "v2/accounts/acc_123/movements"
+
+    def test_export_invalid_format(self):
+        with pytest.raises(ValueError):
+            export(self.manager, io.StringIO(), format_="xml")
+
+    def test_export_to_gzip_file(self, tmp_path):
+        path = str(tmp_path / "movements.csv.gz")
+        count = export_to_file(
+            self.manager, path, fields=["id", "url"], account_id="acc_123"
+        )
+        assert count == 100
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            rows = list(csv.DictReader(file))
+        assert len(rows) == 100
+        assert rows[0] == {"id": "idx", "url": "v2/accounts/acc_123/movements"}
+
+
+class TestExportCommand:
+    @pytest.fixture(autouse=True)
+    def patch_http_client(self, patch_http_client):
+        pass
+
+    def test_export_command(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("FINTOC_API_KEY", "super_secret_api_key")
+        path = tmp_path / "movements.ndjson"
+        argv = [
+            "export",
+            "v2.accounts.movements",
+            "--param",
+            "account_id=acc_123",
+            "--output",
+            str(path),
+        ]
+        # The default is read when the parser gets built
+        assert main(argv) == 0
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 100
+        assert "Exported 100" in capsys.readouterr().err
+
+    def test_export_command_to_stdout(self, capsys):
+        argv = ["export", "links", "--api-key", "super_secret_api_key"]
+        assert main(argv) == 0
+        assert len(capsys.readouterr().out.splitlines()) == 100
+
+    def test_export_command_without_api_key(self, monkeypatch):
+        monkeypatch.delenv("FINTOC_API_KEY", raising=False)
+        with pytest.raises(SystemExit):
+            main(["export", "links"])
+
+    def test_export_command_invalid_resource(self):
+        with pytest.raises(SystemExit):
+            main(["export", "nothing", "--api-key", "super_secret_api_key"])
+
+    def test_export_command_invalid_param(self):
+        with pytest.raises(SystemExit):
+            main(["export", "links", "--param", "account_id"])
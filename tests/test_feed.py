@@ -0,0 +1,157 @@
+import asyncio
+import datetime
+
+import httpx
+import pytest
+
+from fintoc.client import AsyncClient, Client
+from fintoc.feed import get_date_key, merge_movements, merge_streams
+from fintoc.managers import MovementsManager
+from fintoc.managers.v2 import MovementsManager as MovementsManagerV2
+
+PAGE_SIZE = 2
+
+
+def build_movements(account_id, days):
+    """Build a movement of :account_id: for each of :days: (of 2024), newest first."""
+    return [
+        {
+            "id": f"{account_id}_{day}",
+            "post_date": f"2024-01-{day:02}T10:00:00Z",
+        }
+        for day in sorted(days, reverse=True)
+    ]
+
+
+def build_handler(movements, requests):
+    """
+    Build a handler that serves the :movements: of each account in pages
+    of PAGE_SIZE elements.
+    """
+
+    def handler(request):
+        account_id = request.url.path.split("/")[3]
+        page = int(request.url.params.get("page", 1))
+        requests.append((account_id, page))
+        elements = movements[account_id]
+        start = (page - 1) * PAGE_SIZE
+        headers = {}
+        if start + PAGE_SIZE < len(elements):
+            next_url = f"https://test.com{request.url.path}?page={page + 1}"
+            headers["link"] = f'<{next_url}>; rel="next"'
+        return httpx.Response(
+            200, json=elements[start : start + PAGE_SIZE], headers=headers
+        )
+
+    return handler
+
+
+class TestMergeStreams:
+    def test_merge_in_descending_order(self):
+        key = get_date_key("post_date")
+        streams = [
+            [{"post_date": "2024-01-05"}, {"post_date": "2024-01-01"}],
+            [{"post_date": "2024-01-04"}, {"post_date": None}],
+            [],
+        ]
+        merged = list(merge_streams(streams, key, reverse=True))
+        assert [element["post_date"] for element in merged] == [
+            "2024-01-05",
+            "2024-01-04",
+            "2024-01-01",
+            None,
+        ]
+
+    def test_merge_datetimes_with_different_precisions(self):
+        key = get_date_key("post_date")
+        streams = [
+            [{"post_date": "2024-01-01T10:00:00.500Z"}],
+            [
+                {"post_date": "2024-01-01T10:00:01Z"},
+                {"post_date": "2024-01-01T10:00:00Z"},
+            ],
+        ]
+        merged = list(merge_streams(streams, key, reverse=True))
+        assert [element["post_date"] for element in merged] == [
+            "2024-01-01T10:00:01Z",
+            "2024-01-01T10:00:00.500Z",
+            "2024-01-01T10:00:00Z",
+        ]
+
+    def test_date_key_of_resources(self):
+        class Movement:
+            post_date = datetime.datetime(2024, 1, 1)
+
+        assert get_date_key("post_date")(Movement()) == (True, Movement.post_date)
+
+
+class TestMergeMovements:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_client):
+        self.mock_client = mock_client
+        self.requests = []
+        self.movements = {
+            "acc_1": build_movements("acc_1", [1, 4, 7, 10]),
+            "acc_2": build_movements("acc_2", [2, 3, 8]),
+            "acc_3": build_movements("acc_3", [5, 6, 9, 11, 12]),
+        }
+
+    def build_client(self, client_class=Client):
+        handler = build_handler(self.movements, self.requests)
+        return self.mock_client(handler, client_class=client_class)
+
+    def expected_ids(self):
+        elements = [
+            element for movements in self.movements.values() for element in movements
+        ]
+        elements.sort(key=lambda element: element["post_date"], reverse=True)
+        return [element["id"] for element in elements]
+
+    def test_v1_movements_get_merged_chronologically(self):
+        client = self.build_client()
+        sources = [
+            MovementsManager(f"/v1/accounts/{account_id}/movements", client)
+            for account_id in self.movements
+        ]
+        feed = merge_movements(sources)
+        assert [movement.id for movement in feed] == self.expected_ids()
+
+    def test_prefetched_movements_get_merged_chronologically(self):
+        client = self.build_client()
+        sources = [
+            MovementsManager(f"/v1/accounts/{account_id}/movements", client)
+            for account_id in self.movements
+        ]
+        feed = merge_movements(sources, prefetch=1, raw=True)
+        assert [movement["id"] for movement in feed] == self.expected_ids()
+
+    def test_v2_movements_get_merged_chronologically(self):
+        client = self.build_client()
+        manager = MovementsManagerV2("/v2/accounts/{account_id}/movements", client)
+        sources = [
+            (manager, {"account_id": account_id}) for account_id in self.movements
+        ]
+        feed = merge_movements(sources, raw=True)
+        assert [movement["id"] for movement in feed] == self.expected_ids()
+
+    def test_pages_get_fetched_only_when_needed(self):
+        client = self.build_client()
+        sources = [
+            MovementsManager(f"/v1/accounts/{account_id}/movements", client)
+            for account_id in self.movements
+        ]
+        feed = merge_movements(sources, raw=True)
+        assert next(feed)["id"] == "acc_3_12"
+        assert sorted(self.requests) == [("acc_1", 1), ("acc_2", 1), ("acc_3", 1)]
+
+    def test_async_movements_get_merged_chronologically(self):
+        client = self.build_client(client_class=AsyncClient)
+        sources = [
+            MovementsManager(f"/v1/accounts/{account_id}/movements", client)
+            for account_id in self.movements
+        ]
+
+        async def run():
+            return [movement.id async for movement in merge_movements(sources)]
+
+        assert asyncio.run(run()) == self.expected_ids()
@@ -0,0 +1,180 @@
+import asyncio
+import datetime
+
+import pytest
+
+from fintoc.client import AsyncClient, Client
+from fintoc.core import Fintoc
+from fintoc.history import HistoryStore, parse_date, split_months
+from fintoc.managers import ChargesManager, MovementsManager
+
+TODAY = datetime.datetime.utcnow().date()
+
+
+def build_movements():
+    """Build a movement for every fifth day of the last 120 days, newest first."""
+    return [
+        {"id": f"mov_{days}", "post_date": str(TODAY - datetime.timedelta(days=days))}
+        for days in range(0, 120, 5)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.db"), settlement_days=30)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def build_client(mock_client, movements_handler):
+    def build(store, requests, movements, client_class=Client):
+        handler = movements_handler(movements, requests)
+        return mock_client(handler, client_class=client_class, history=store)
+
+    return build
+
+
+class TestHelpers:
+    def test_parse_date(self):
+        assert parse_date("2025-02-03") == datetime.date(2025, 2, 3)
+        assert parse_date(datetime.date(2025, 2, 3)) == datetime.date(2025, 2, 3)
+        assert parse_date("2025-02-03T10:00:00Z") is None
+        assert parse_date(datetime.datetime(2025, 2, 3)) is None
+        assert parse_date("not-a-date") is None
+
+    def test_split_months(self):
+        windows = split_months(datetime.date(2024, 12, 15), datetime.date(2025, 2, 3))
+        assert windows == [
+            (datetime.date(2025, 2, 1), datetime.date(2025, 2, 3)),
+            (datetime.date(2025, 1, 1), datetime.date(2025, 1, 31)),
+            (datetime.date(2024, 12, 15), datetime.date(2024, 12, 31)),
+        ]
+
+    def test_plan(self, store):
+        month = store.cutoff().replace(day=1)
+        since = month - datetime.timedelta(days=70)
+        recent_params, windows = store.plan({"since": since.isoformat()})
+        assert recent_params == {"since": month.isoformat()}
+        assert windows[0][1] == month - datetime.timedelta(days=1)
+        assert windows[-1][0] == since
+
+    def test_plan_keeps_windows_between_days(self, store, monkeypatch):
+        plans = []
+        for day in (1, 17, 18, 30):
+            cutoff = datetime.date(2026, 9, day)
+            monkeypatch.setattr(store, "cutoff", lambda cutoff=cutoff: cutoff)
+            plans.append(store.plan({"since": "2026-07-15"}))
+        assert all(plan == plans[0] for plan in plans)
+        assert plans[0] == (
+            {"since": "2026-09-01"},
+            [
+                (datetime.date(2026, 8, 1), datetime.date(2026, 8, 31)),
+                (datetime.date(2026, 7, 15), datetime.date(2026, 7, 31)),
+            ],
+        )
+
+    def test_plan_of_recent_ranges(self, store):
+        since = store.cutoff().replace(day=1)
+        recent_params, windows = store.plan({"since": since.isoformat()})
+        assert recent_params == {"since": since.isoformat()}
+        assert windows == []
+
+    def test_plan_of_old_ranges(self, store):
+        until = store.cutoff() - datetime.timedelta(days=40)
+        recent_params, windows = store.plan({"since": "2020-01-01", "until": until})
+        assert recent_params is None
+        assert windows[0][1] == until
+
+    def test_plan_without_plain_dates(self, store):
+        assert store.plan({}) is None
+        assert store.plan({"since": "2025-01-01T00:00:00Z"}) is None
+        assert store.plan({"since": "2025-01-01", "until": "now"}) is None
+
+    def test_scope_ignores_dates_and_hides_secrets(self):
+        scope = HistoryStore.build_scope(
+            "https://test.com/v1/movements", {"since": "2025-01-01"}, "sk_secret"
+        )
+        assert "sk_secret" not in scope
+        assert scope == HistoryStore.build_scope(
+            "https://test.com/v1/movements", {"since": "2024-01-01"}, "sk_secret"
+        )
+
+
+class TestHistoryStore:
+    def test_history_is_served_from_the_store(self, store, build_client):
+        requests = []
+        movements = build_movements()
+        client = build_client(store, requests, movements)
+        manager = MovementsManager("/v1/accounts/{account_id}/movements", client)
+        since = str(TODAY - datetime.timedelta(days=200))
+
+        first = [
+            movement.id for movement in manager.list(account_id="acc_1", since=since)
+        ]
+        first_requests = len(requests)
+        second = [
+            movement.id for movement in manager.list(account_id="acc_1", since=since)
+        ]
+
+        assert first == second == [movement["id"] for movement in movements]
+        assert first_requests > 1
+        assert len(requests) == first_requests + 1
+        month = store.cutoff().replace(day=1)
+        assert requests[-1].url.params["since"] == month.isoformat()
+
+    def test_history_is_shared_between_stores(self, store, tmp_path, build_client):
+        requests = []
+        movements = build_movements()
+        since = str(TODAY - datetime.timedelta(days=200))
+        manager = MovementsManager(
+            "/v1/movements", build_client(store, requests, movements)
+        )
+        list(manager.list(since=since, raw=True))
+
+        other_requests = []
+        other_store = HistoryStore(store.path, settlement_days=30)
+        other_manager = MovementsManager(
+            "/v1/movements", build_client(other_store, other_requests, movements)
+        )
+        assert len(list(other_manager.list(since=since, raw=True))) == len(movements)
+        assert len(other_requests) == 1
+
+    def test_requests_without_dates_are_not_stored(self, store, build_client):
+        requests = []
+        manager = MovementsManager(
+            "/v1/movements", build_client(store, requests, build_movements())
+        )
+        list(manager.list(raw=True))
+        list(manager.list(raw=True))
+        assert [dict(request.url.params) for request in requests] == [{}, {}]
+
+    def test_mutable_resources_are_not_stored(self, store, build_client):
+        requests = []
+        manager = ChargesManager(
+            "/v1/charges", build_client(store, requests, build_movements())
+        )
+        since = str(TODAY - datetime.timedelta(days=200))
+        list(manager.list(since=since, raw=True))
+        assert [dict(request.url.params) for request in requests] == [{"since": since}]
+
+    def test_async_history_is_served_from_the_store(self, store, build_client):
+        requests = []
+        movements = build_movements()
+        client = build_client(store, requests, movements, client_class=AsyncClient)
+        manager = MovementsManager("/v1/movements", client)
+        since = str(TODAY - datetime.timedelta(days=200))
+
+        async def run():
+            first = [movement.id async for movement in manager.list(since=since)]
+            first_requests = len(requests)
+            second = [movement.id async for movement in manager.list(since=since)]
+            return first, second, first_requests
+
+        first, second, first_requests = asyncio.run(run())
+        assert first == second == [movement["id"] for movement in movements]
+        assert len(requests) == first_requests + 1
+
+    def test_history_option(self, store):
+        fintoc = Fintoc("super_secret_api_key", history=store)
+        assert fintoc._client.history is store
@@ -0,0 +1,224 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from fintoc.client import AsyncClient, Client
+from fintoc.errors import InvalidRequestError, RateLimitExceededError
+from fintoc.journal import FileJournal, JournalEntry, SQLiteJournal, is_settled
+from fintoc.rate_limiter import RateLimiter
+
+
+def build_handler(requests, fail_with=None, status=None):
+    """
+    Build a handler that stores every request and answers with its body,
+    raising :fail_with: or answering with :status: instead when given.
+    """
+
+    def handler(request):
+        requests.append(request)
+        if fail_with is not None:
+            raise fail_with
+        if status is not None:
+            return httpx.Response(status, text="<html>Unavailable</html>")
+        if json.loads(request.content or "{}").get("invalid"):
+            error = {"type": "invalid_request_error", "message": "Invalid"}
+            return httpx.Response(400, json={"error": error})
+        return httpx.Response(201, json=json.loads(request.content or "{}"))
+
+    return handler
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def journal(request, tmp_path):
+    if request.param == "sqlite":
+        journal = SQLiteJournal(str(tmp_path / "journal.db"))
+    else:
+        journal = FileJournal(str(tmp_path / "journal.ndjson"))
+    yield journal
+    journal.close()
+
+
+def build_entry(amount=1000):
+    request = httpx.Request(
+        "POST",
+        "https://test.com/v2/transfers",
+        headers={"Idempotency-Key": "key"},
+        json={"amount": amount},
+    )
+    return JournalEntry.from_request(request)
+
+
+class TestJournalEntry:
+    def test_entry_from_request(self):
+        entry = build_entry()
+        assert entry.method == "POST"
+        assert entry.url == "https://test.com/v2/transfers"
+        assert entry.json == {"amount": 1000}
+        assert entry.idempotency_key == "key"
+        assert entry.is_intact()
+
+    def test_corrupted_entry(self):
+        entry = build_entry()
+        entry.body = '{"amount": 9000}'
+        assert not entry.is_intact()
+
+
+@pytest.mark.parametrize(
+    "status_code,settled",
+    [(200, True), (201, True), (400, True), (404, True), (429, False)]
+    + [(500, False), (502, False), (503, False), (504, False)],
+)
+def test_is_settled(status_code, settled):
+    assert is_settled(status_code) == settled
+
+
+class TestJournals:
+    def test_record_and_complete(self, journal):
+        first, second = build_entry(1), build_entry(2)
+        journal.record(first)
+        journal.record(second)
+        assert [entry.id for entry in journal.pending()] == [first.id, second.id]
+
+        journal.complete(first.id, 201)
+        pending = journal.pending()
+        assert [entry.id for entry in pending] == [second.id]
+        assert pending[0].to_dict() == second.to_dict()
+
+    def test_empty_journal(self, journal):
+        assert journal.pending() == []
+
+    def test_file_journal_ignores_truncated_lines(self, tmp_path):
+        journal = FileJournal(str(tmp_path / "journal.ndjson"))
+        entry = build_entry()
+        journal.record(entry)
+        with open(journal.path, "a", encoding="utf-8") as file:
+            file.write('{"event": "rec')
+        assert [pending.id for pending in journal.pending()] == [entry.id]
+
+
+class TestClientJournal:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_client):
+        self.mock_client = mock_client
+
+    def build_client(
+        self,
+        journal,
+        requests,
+        fail_with=None,
+        status=None,
+        client_class=Client,
+        **kwargs
+    ):
+        handler = build_handler(requests, fail_with, status)
+        return self.mock_client(
+            handler, client_class=client_class, journal=journal, **kwargs
+        )
+
+    def test_completed_requests(self, journal):
+        requests = []
+        client = self.build_client(journal, requests)
+        client.request("/v2/transfers", method="post", json={"amount": 1000})
+        client.request("/v2/transfers", method="get")
+        with pytest.raises(httpx.HTTPStatusError):
+            client.request("/v2/transfers", method="post", json={"invalid": True})
+        assert journal.pending() == []
+
+    def test_replay_pending_requests(self, journal):
+        requests = []
+        client = self.build_client(journal, requests, fail_with=httpx.ConnectError(""))
+        with pytest.raises(httpx.ConnectError):
+            client.request(
+                "/v2/transfers",
+                method="post",
+                json={"amount": 1000},
+                idempotency_key="transfer_1",
+            )
+        [entry] = journal.pending()
+        assert entry.idempotency_key == "transfer_1"
+
+        client = self.build_client(journal, requests)
+        result = client.replay_journal()
+        assert result[0].key.id == entry.id
+        assert result[0].value == {"amount": 1000}
+        assert requests[-1].headers["idempotency-key"] == "transfer_1"
+        assert journal.pending() == []
+
+    @pytest.mark.parametrize("status", [429, 502, 503, 504])
+    def test_unsettled_requests_stay_pending(self, journal, status):
+        requests = []
+        client = self.build_client(journal, requests, status=status)
+        with pytest.raises(httpx.HTTPStatusError):
+            client.request("/v2/transfers", method="post", json={"amount": 1000})
+        [entry] = journal.pending()
+        assert entry.idempotency_key == requests[0].headers["idempotency-key"]
+
+        client = self.build_client(journal, requests)
+        assert client.replay_journal().values == [{"amount": 1000}]
+        assert journal.pending() == []
+
+    def test_rate_limited_requests_are_not_recorded(self, journal):
+        requests = []
+        limiter = RateLimiter(rate=0.001, blocking=False)
+        client = self.build_client(journal, requests, rate_limiter=limiter)
+        client.request("/v2/transfers", method="post", json={"amount": 1000})
+        with pytest.raises(RateLimitExceededError):
+            client.request("/v2/transfers", method="post", json={"amount": 2000})
+        assert len(requests) == 1
+        assert journal.pending() == []
+
+    def test_async_rate_limited_requests_are_not_recorded(self, journal):
+        limiter = RateLimiter(rate=0.001, blocking=False)
+
+        async def create():
+            client = self.build_client(
+                journal, [], client_class=AsyncClient, rate_limiter=limiter
+            )
+            await client.request("/v2/transfers", method="post", json={"amount": 1})
+            await client.request("/v2/transfers", method="post", json={"amount": 2})
+
+        with pytest.raises(RateLimitExceededError):
+            asyncio.run(create())
+        assert journal.pending() == []
+
+    def test_replay_failed_requests(self, journal):
+        journal.record(build_entry())
+        entry = build_entry()
+        entry.body = '{"invalid": true}'
+        entry.body_hash = JournalEntry.from_request(
+            httpx.Request("POST", "https://test.com", content=entry.body)
+        ).body_hash
+        journal.record(entry)
+
+        client = self.build_client(journal, [])
+        result = client.replay_journal()
+        assert result[0].ok
+        assert isinstance(result[1].error, InvalidRequestError)
+        assert journal.pending() == []
+
+    def test_replay_corrupted_entry(self, journal):
+        entry = build_entry()
+        entry.body = '{"amount": 9000}'
+        journal.record(entry)
+        client = self.build_client(journal, [])
+        with pytest.raises(ValueError):
+            client.replay_journal()
+
+    def test_replay_without_journal(self):
+        client = Client("https://test.com", "super_secret_api_key", None, "test")
+        with pytest.raises(ValueError):
+            client.replay_journal()
+
+    def test_async_replay(self, journal):
+        requests = []
+        journal.record(build_entry())
+
+        async def replay():
+            client = self.build_client(journal, requests, client_class=AsyncClient)
+            return await client.replay_journal()
+
+        result = asyncio.run(replay())
+        assert result.values == [{"amount": 1000}]
+        assert journal.pending() == []
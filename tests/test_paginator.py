@@ -1,9 +1,25 @@
-from types import GeneratorType
+import asyncio
+import threading
+import time
+from types import AsyncGeneratorType, GeneratorType
 
 import httpx
 import pytest
 
-from fintoc.paginator import paginate, parse_link, parse_link_headers, request
+from fintoc.paginator import (
+    Page,
+    decode_cursor,
+    encode_cursor,
+    get_page_urls,
+    paginate,
+    paginate_async,
+    paginate_pages,
+    parse_link,
+    parse_link_headers,
+    prefetch_pages,
+    prefetch_pages_async,
+    request,
+)
 
 
 class TestParseLink:
@@ -76,6 +92,12 @@ class TestRequest:
         assert "elements" in data
         assert isinstance(data["elements"], list)
 
+    def test_request_response_metadata(self):
+        client = httpx.Client(base_url="https://test.com")
+        data = request(client, "/movements")
+        assert data["links"] == {"next": data["next"]}
+        assert data["headers"]["link"] is not None
+
     def test_request_params_get_passed_to_next_url(self):
         client = httpx.Client(base_url="https://test.com")
         data = request(client, "/movements", params={"link_token": "sample_link_token"})
@@ -98,3 +120,261 @@ class TestPaginate:
 
         for element in elements:
             assert isinstance(element, dict)
+
+
+class TestPaginateAsync:
+    @pytest.fixture(autouse=True)
+    def patch_async_http_client(self, patch_async_http_client):
+        pass
+
+    def test_pagination(self):
+        client = httpx.AsyncClient(base_url="https://test.com")
+        data = paginate_async(client, "/movements", {}, {})
+        assert isinstance(data, AsyncGeneratorType)
+
+        async def consume():
+            return [element async for element in data]
+
+        elements = asyncio.run(consume())
+        assert len(elements) == 100
+
+        for element in elements:
+            assert isinstance(element, dict)
+
+
+class TestPaginatePages:
+    @pytest.fixture(autouse=True)
+    def patch_http_client(self, patch_http_client):
+        pass
+
+    def test_pagination(self):
+        client = httpx.Client(base_url="https://test.com")
+        pages = list(paginate_pages(client, "/movements", {}, {}))
+        assert len(pages) == 10
+        for page in pages:
+            assert len(page["elements"]) == 10
+        assert pages[-1]["next"] is None
+
+
+class TestPrefetchPages:
+    def test_prefetch_keeps_order(self):
+        pages = list(prefetch_pages(iter(range(20)), 3))
+        assert pages == list(range(20))
+
+    def test_prefetch_is_bounded(self):
+        produced = []
+
+        def pages():
+            for page in range(20):
+                produced.append(page)
+                yield page
+
+        prefetched = prefetch_pages(pages(), 2)
+        assert next(prefetched) == 0
+        time.sleep(0.3)
+        # The consumed page, the buffered ones and the one being put
+        assert len(produced) <= 4
+        prefetched.close()
+
+    def test_prefetch_propagates_errors_in_order(self):
+        def pages():
+            yield 1
+            yield 2
+            raise httpx.HTTPStatusError("error", request=None, response=None)
+
+        prefetched = prefetch_pages(pages(), 5)
+        assert next(prefetched) == 1
+        assert next(prefetched) == 2
+        with pytest.raises(httpx.HTTPStatusError):
+            next(prefetched)
+
+    def test_async_prefetch(self):
+        async def pages():
+            for page in range(10):
+                yield page
+            raise ValueError("failed")
+
+        async def consume():
+            consumed = []
+            with pytest.raises(ValueError):
+                async for page in prefetch_pages_async(pages(), 2):
+                    consumed.append(page)
+            return consumed
+
+        assert asyncio.run(consume()) == list(range(10))
+
+
+class TestPaginatePrefetch:
+    @pytest.fixture(autouse=True)
+    def patch_http_client(self, patch_http_client):
+        pass
+
+    def test_pagination(self):
+        client = httpx.Client(base_url="https://test.com")
+        elements = list(paginate(client, "/movements", {}, {}, prefetch=2))
+        assert len(elements) == 100
+        assert [element["page"] for element in elements[::10]] == list(range(1, 11))
+
+
+class TestPage:
+    def test_page(self):
+        page = Page([1, 2, 3], "https://test.com/movements?page=2", headers={"a": 1})
+        assert list(page) == [1, 2, 3]
+        assert len(page) == 3
+        assert page.next == "https://test.com/movements?page=2"
+        assert page.links == {}
+        assert page.headers == {"a": 1}
+
+
+class TestCursors:
+    def setup_method(self):
+        self.base_url = "https://api.fintoc.com/v1/accounts/acc_1/movements"
+
+    def test_page_cursor(self):
+        next_url = f"{self.base_url}?since=2025-01-01&page=3"
+        page = Page([], next_url)
+        assert decode_cursor(page.cursor, self.base_url) == next_url
+        assert Page([]).cursor is None
+
+    def test_cursor_is_opaque(self):
+        cursor = encode_cursor(f"{self.base_url}?page=2")
+        assert "/" not in cursor
+        assert "?" not in cursor
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValueError):
+            decode_cursor("invalid", self.base_url)
+
+    def test_cursor_of_another_resource(self):
+        cursor = encode_cursor("https://api.fintoc.com/v1/links?page=2")
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, self.base_url)
+
+    def test_cursor_of_another_host(self):
+        cursor = encode_cursor("https://evil.com/v1/accounts/acc_1/movements?page=2")
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, self.base_url)
+
+
+def build_numbered_handler(pages, requests, with_last=True, delay=0):
+    """
+    Build a handler that serves :pages: pages of ten elements, exposing the
+    page numbers (and the last page, if :with_last:).
+    """
+    active = []
+    lock = threading.Lock()
+
+    def handler(request):
+        page = int(request.url.params.get("page", 1))
+        with lock:
+            active.append(page)
+            requests.append((page, len(active)))
+        time.sleep(delay)
+        with lock:
+            active.remove(page)
+        base_url = "https://test.com/movements?per_page=10"
+        links = []
+        if page < pages:
+            links.append(f'<{base_url}&page={page + 1}>; rel="next"')
+        if with_last:
+            links.append(f'<{base_url}&page={pages}>; rel="last"')
+        return httpx.Response(
+            200,
+            json=[{"id": f"mov_{page}_{index}"} for index in range(10)],
+            headers={"link": ", ".join(links)} if links else {},
+        )
+
+    return handler
+
+
+class TestGetPageUrls:
+    def test_numbered_pages(self):
+        links = {
+            "next": "https://test.com/movements?page=2&per_page=10",
+            "last": "https://test.com/movements?page=4&per_page=10",
+        }
+        assert get_page_urls(links) == [
+            "https://test.com/movements?page=2&per_page=10",
+            "https://test.com/movements?page=3&per_page=10",
+            "https://test.com/movements?page=4&per_page=10",
+        ]
+
+    def test_pages_without_last(self):
+        assert get_page_urls({"next": "https://test.com/movements?page=2"}) is None
+        assert get_page_urls(None) is None
+
+    def test_pages_that_are_not_numbered(self):
+        assert (
+            get_page_urls(
+                {
+                    "next": "https://test.com/movements?cursor=abc",
+                    "last": "https://test.com/movements?cursor=xyz",
+                }
+            )
+            is None
+        )
+        assert (
+            get_page_urls(
+                {
+                    "next": "https://test.com/movements?page=2&since=2024",
+                    "last": "https://test.com/movements?page=4&since=2025",
+                }
+            )
+            is None
+        )
+        assert (
+            get_page_urls(
+                {
+                    "next": "https://test.com/movements?page=2",
+                    "last": "https://other.com/movements?page=4",
+                }
+            )
+            is None
+        )
+
+
+class TestParallelPages:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_http_client):
+        self.mock_http_client = mock_http_client
+
+    def test_numbered_pages_get_fetched_concurrently_in_order(self):
+        requests = []
+        client = self.mock_http_client(build_numbered_handler(8, requests, delay=0.05))
+        elements = list(
+            paginate(client, "https://test.com/movements", page_concurrency=3)
+        )
+        assert [element["id"] for element in elements] == [
+            f"mov_{page}_{index}" for page in range(1, 9) for index in range(10)
+        ]
+        assert max(active for _, active in requests) == 3
+        assert len(requests) == 8
+
+    def test_pages_without_last_get_followed_sequentially(self):
+        requests = []
+        client = self.mock_http_client(
+            build_numbered_handler(4, requests, with_last=False)
+        )
+        elements = list(
+            paginate(client, "https://test.com/movements", page_concurrency=3)
+        )
+        assert len(elements) == 40
+        assert max(active for _, active in requests) == 1
+
+    def test_async_numbered_pages(self):
+        requests = []
+        client = self.mock_http_client(
+            build_numbered_handler(5, requests, delay=0.05), asynchronous=True
+        )
+
+        async def run():
+            return [
+                element["id"]
+                async for element in paginate_async(
+                    client, "https://test.com/movements", page_concurrency=2
+                )
+            ]
+
+        assert asyncio.run(run()) == [
+            f"mov_{page}_{index}" for page in range(1, 6) for index in range(10)
+        ]
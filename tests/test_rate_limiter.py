@@ -0,0 +1,147 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from fintoc.client import Client
+from fintoc.errors import RateLimitExceededError
+from fintoc.rate_limiter import RateLimiter, RateLimitRule, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr("fintoc.rate_limiter.time.monotonic", fake_clock.monotonic)
+    monkeypatch.setattr("fintoc.rate_limiter.time.sleep", fake_clock.sleep)
+    return fake_clock
+
+
+class TestTokenBucket:
+    def test_starts_full(self, clock):
+        bucket = TokenBucket(rate=2, capacity=3)
+        assert all(bucket.reserve() == 0 for _ in range(3))
+        assert bucket.reserve() == pytest.approx(0.5)
+
+    def test_refills_over_time(self, clock):
+        bucket = TokenBucket(rate=2, capacity=1)
+        assert bucket.reserve() == 0
+        clock.now += 0.5
+        assert bucket.reserve() == 0
+
+    def test_non_blocking_acquire(self, clock):
+        bucket = TokenBucket(rate=1, capacity=1)
+        assert bucket.acquire(blocking=False)
+        assert not bucket.acquire(blocking=False)
+
+    def test_blocking_acquire_waits(self, clock):
+        bucket = TokenBucket(rate=4, capacity=1)
+        assert bucket.acquire()
+        assert bucket.acquire()
+        assert clock.now == pytest.approx(0.25)
+
+    def test_blocking_acquire_timeout(self, clock):
+        bucket = TokenBucket(rate=1, capacity=1)
+        assert bucket.acquire()
+        assert not bucket.acquire(timeout=0.5)
+        assert clock.now == 0
+
+    def test_async_acquire(self, clock, monkeypatch):
+        async def fake_sleep(seconds):
+            clock.sleep(seconds)
+
+        monkeypatch.setattr("fintoc.rate_limiter.asyncio.sleep", fake_sleep)
+        bucket = TokenBucket(rate=2, capacity=1)
+
+        async def acquire_twice():
+            return [await bucket.acquire_async(), await bucket.acquire_async()]
+
+        assert asyncio.run(acquire_twice()) == [True, True]
+        assert clock.now == pytest.approx(0.5)
+
+    def test_thread_safety(self):
+        bucket = TokenBucket(rate=0.001, capacity=50)
+        results = []
+
+        def worker():
+            results.extend(bucket.acquire(blocking=False) for _ in range(10))
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results.count(True) == 50
+
+
+class TestRateLimiter:
+    def setup_method(self):
+        self.limiter = RateLimiter(
+            rate=10,
+            rules=[
+                RateLimitRule("/v2/transfers", rate=1, methods=["post"]),
+                RateLimitRule("/", rate=5, methods=["get"]),
+            ],
+        )
+
+    def test_rule_buckets(self):
+        transfers = self.limiter.get_bucket("key", "POST", "/v2/transfers")
+        reads = self.limiter.get_bucket("key", "GET", "/v2/transfers")
+        default = self.limiter.get_bucket("key", "PATCH", "/v1/links/link")
+        assert transfers.rate == 1
+        assert reads.rate == 5
+        assert default.rate == 10
+        assert transfers is self.limiter.get_bucket("key", "post", "/v2/transfers/x")
+
+    def test_buckets_keyed_by_api_key(self):
+        first = self.limiter.get_bucket("first_key", "GET", "/v1/links")
+        second = self.limiter.get_bucket("second_key", "GET", "/v1/links")
+        assert first is not second
+
+    def test_acquire_request_raises_when_non_blocking(self, clock):
+        limiter = RateLimiter(rate=1, blocking=False)
+        request = httpx.Request(
+            "GET", "https://test.com/v1/links", headers={"Authorization": "key"}
+        )
+        limiter.acquire_request(request)
+        with pytest.raises(RateLimitExceededError):
+            limiter.acquire_request(request)
+
+
+class TestClientRateLimiting:
+    def test_shared_between_clients(self, clock, mock_http_client):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={})
+
+        limiter = RateLimiter(rate=1, blocking=False)
+        http_client = mock_http_client(handler)
+        first, second = (
+            Client(
+                "https://test.com",
+                "super_secret_api_key",
+                None,
+                "fintoc-python/test",
+                http_client=http_client,
+                rate_limiter=limiter,
+            )
+            for _ in range(2)
+        )
+        first.request("/v1/links/link_token")
+        with pytest.raises(RateLimitExceededError):
+            second.request("/v1/links/link_token")
+        assert len(requests) == 1
+        assert first.extend(params={"a": "b"}).rate_limiter is limiter
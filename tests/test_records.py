@@ -0,0 +1,143 @@
+import datetime
+import sys
+
+import pytest
+
+from fintoc.client import Client
+from fintoc.managers import MovementsManager
+from fintoc.mixins import ManagerMixin, RecordMixin
+from fintoc.records import RECORD_FIELDS, get_record_class
+from fintoc.resources import Account, Movement, TransferAccount
+
+
+class MovementsMockManager(ManagerMixin):
+    resource = "movement"
+    methods = ["list", "get", "update", "delete"]
+
+
+class TestGetRecordClass:
+    def test_resource_with_record(self):
+        record_class = get_record_class("movement")
+        assert issubclass(record_class, RecordMixin)
+        assert record_class.resource_class is Movement
+        assert record_class.__slots__ == RECORD_FIELDS["movement"]
+        assert get_record_class("movement") is record_class
+
+    def test_resource_without_record(self):
+        assert get_record_class("link") is None
+
+
+class TestRecordMixin:
+    @pytest.fixture(autouse=True)
+    def patch_http_client(self, patch_http_client):
+        pass
+
+    def setup_method(self):
+        self.client = Client(
+            "https://test.com", "super_secret_api_key", None, "fintoc-python/test"
+        )
+        self.handlers = {
+            "update": lambda object_, identifier, **kwargs: object_,
+            "delete": lambda identifier, **kwargs: identifier,
+        }
+        self.data = {
+            "id": "mov_123",
+            "amount": 1000,
+            "post_date": "2021-08-13T13:40:40Z",
+            "recipient_account": {"holder_id": "123", "number": "456"},
+            "unknown_field": "value",
+        }
+        self.record_class = get_record_class("movement")
+
+    def build_record(self, methods=()):
+        return self.record_class(
+            self.client, self.handlers, list(methods), "/movements", **self.data
+        )
+
+    def test_record_attributes(self):
+        record = self.build_record()
+        assert record.id == "mov_123"
+        assert record.post_date == datetime.datetime(2021, 8, 13, 13, 40, 40)
+        assert isinstance(record.recipient_account, TransferAccount)
+        assert record.unknown_field == "value"
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.description  # pylint: disable=pointless-statement
+
+    def test_records_share_context(self):
+        build = self.record_class.objetizer(
+            self.client, self.handlers, [], "/movements"
+        )
+        first = build(self.data)
+        second = build(self.data)
+        other = self.build_record()
+        # pylint: disable=protected-access
+        assert first._context is second._context
+        assert first._context is not other._context
+        assert first._client is self.client
+        assert first.serialize() == other.serialize()
+
+    def test_record_is_smaller_than_resource(self):
+        record = self.build_record()
+        resource = Movement(self.client, self.handlers, [], "/movements", **self.data)
+        resource_size = sys.getsizeof(resource) + sys.getsizeof(resource.__dict__)
+        assert sys.getsizeof(record) < resource_size
+
+    def test_record_serialization(self):
+        record = self.build_record()
+        assert record.serialize() == self.data
+
+    def test_record_methods(self):
+        record = self.build_record(methods=["update", "delete"])
+        record.update(amount=2000)
+        assert record.id == "mov_123"
+        assert record.method == "patch"
+        assert record.json.amount == 2000
+        assert record.delete() == "mov_123"
+
+    def test_record_missing_methods(self):
+        record = self.build_record()
+        with pytest.raises(AttributeError):
+            record.update()
+
+    def test_account_record_keeps_movements(self):
+        record = get_record_class("account")(
+            self.client, self.handlers, [], "/accounts", id="acc_123"
+        )
+        assert record.resource_class is Account
+        assert isinstance(record.movements, MovementsManager)
+
+
+class TestCompactManager:
+    @pytest.fixture(autouse=True)
+    def patch_http_client(self, patch_http_client):
+        pass
+
+    def setup_method(self):
+        self.client = Client(
+            "https://test.com", "super_secret_api_key", None, "fintoc-python/test"
+        )
+        self.manager = MovementsMockManager("/movements", self.client)
+
+    def test_compact_methods(self):
+        record_class = get_record_class("movement")
+        assert isinstance(next(self.manager.list(compact=True)), record_class)
+        page = next(self.manager.list_pages(compact=True))
+        assert all(isinstance(x, record_class) for x in page)
+        assert isinstance(self.manager.get("mov_123", compact=True), record_class)
+        assert isinstance(self.manager.get("mov_123"), Movement)
+
+    def test_client_compact_mode(self):
+        self.client.compact = True
+        assert isinstance(next(self.manager.list()), get_record_class("movement"))
+        assert isinstance(self.manager.get("mov_123", compact=False), Movement)
+
+    def test_each_list_builds_its_own_context(self):
+        # pylint: disable=protected-access
+        first = list(self.manager.list(compact=True))
+        second = list(self.manager.list(compact=True))
+        page = next(self.manager.list_pages(compact=True))
+        assert len({record._context for record in first}) == 1
+        assert first[0]._context is not second[0]._context
+        assert len({record._context for record in page}) == 1
+        assert page.elements[0]._context is not first[0]._context
@@ -0,0 +1,229 @@
+import asyncio
+
+import httpx
+import pytest
+
+from fintoc.client import AsyncClient, Client
+from fintoc.paginator import paginate
+from fintoc.retry import (
+    RetryPolicy,
+    parse_retry_after,
+    send_with_retries,
+    send_with_retries_async,
+)
+
+
+def build_handler(statuses, requests):
+    """
+    Build a handler that answers with each status of :statuses: in order
+    (the last one repeats) and stores every request.
+    """
+
+    def handler(request):
+        status = statuses[min(len(requests), len(statuses) - 1)]
+        requests.append(request)
+        return httpx.Response(status, json={"url": str(request.url)})
+
+    return handler
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr("fintoc.retry.time.sleep", calls.append)
+    return calls
+
+
+class TestRetryPolicy:
+    def test_no_retry_after_max_attempts(self):
+        policy = RetryPolicy(max_attempts=2)
+        response = httpx.Response(503)
+        assert policy.get_retry_delay("GET", 1, response) is not None
+        assert policy.get_retry_delay("GET", 2, response) is None
+
+    def test_no_retry_on_non_retryable_status(self):
+        policy = RetryPolicy()
+        assert policy.get_retry_delay("GET", 1, httpx.Response(400)) is None
+
+    def test_backoff_with_full_jitter(self, monkeypatch):
+        monkeypatch.setattr("fintoc.retry.random.uniform", lambda low, high: high)
+        policy = RetryPolicy(max_attempts=10, backoff_factor=1, max_backoff=5)
+        assert policy.get_backoff(1) == 1
+        assert policy.get_backoff(3) == 4
+        assert policy.get_backoff(5) == 5
+
+    def test_retry_after_header(self):
+        policy = RetryPolicy()
+        response = httpx.Response(429, headers={"retry-after": "7"})
+        assert policy.get_retry_delay("GET", 1, response) == 7
+
+    def test_retry_after_header_is_capped(self):
+        response = httpx.Response(429, headers={"retry-after": "86400"})
+        assert RetryPolicy().get_retry_delay("GET", 1, response) == 60
+        policy = RetryPolicy(max_retry_after=5)
+        assert policy.get_retry_delay("GET", 1, response) == 5
+
+    def test_ignore_retry_after_header(self):
+        policy = RetryPolicy(respect_retry_after=False, max_backoff=1)
+        response = httpx.Response(429, headers={"retry-after": "7"})
+        assert policy.get_retry_delay("GET", 1, response) <= 1
+
+    def test_method_statuses(self):
+        policy = RetryPolicy(method_statuses={"POST": [429], "DELETE": []})
+        assert policy.get_retry_delay("POST", 1, httpx.Response(429)) is not None
+        assert policy.get_retry_delay("POST", 1, httpx.Response(503)) is None
+        assert policy.get_retry_delay("DELETE", 1, httpx.Response(503)) is None
+        assert policy.get_retry_delay("DELETE", 1) is None
+        assert policy.get_retry_delay("GET", 1, httpx.Response(503)) is not None
+
+    def test_connection_errors(self):
+        assert RetryPolicy().get_retry_delay("GET", 1) is not None
+        policy = RetryPolicy(retry_on_connection_errors=False)
+        assert policy.get_retry_delay("GET", 1) is None
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3
+
+    def test_http_date_in_the_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+    def test_invalid_value(self):
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestSendWithRetries:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_http_client):
+        self.mock_http_client = mock_http_client
+
+    def test_retries_until_success(self, sleeps):
+        requests = []
+        client = self.mock_http_client(build_handler([502, 503, 200], requests))
+        request = httpx.Request("GET", "https://test.com/v1/links")
+        response = send_with_retries(client, request, RetryPolicy(max_attempts=3))
+        assert response.status_code == 200
+        assert len(requests) == 3
+        assert len(sleeps) == 2
+
+    def test_returns_last_failed_response(self, sleeps):
+        requests = []
+        client = self.mock_http_client(build_handler([503], requests))
+        request = httpx.Request("GET", "https://test.com/v1/links")
+        response = send_with_retries(client, request, RetryPolicy(max_attempts=2))
+        assert response.status_code == 503
+        assert len(requests) == 2
+
+    def test_before_send_runs_once(self, sleeps):
+        requests, calls = [], []
+        client = self.mock_http_client(build_handler([503, 200], requests))
+        request = httpx.Request("POST", "https://test.com/v2/transfers")
+        send_with_retries(
+            client, request, RetryPolicy(), before_send=lambda: calls.append(1)
+        )
+        assert len(requests) == 2
+        assert calls == [1]
+
+    def test_retries_connection_errors(self, sleeps):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("Connection reset", request=request)
+            return httpx.Response(200, json={})
+
+        client = self.mock_http_client(handler)
+        request = httpx.Request("GET", "https://test.com/v1/links")
+        response = send_with_retries(client, request, RetryPolicy())
+        assert response.status_code == 200
+        assert len(attempts) == 2
+
+    def test_without_policy(self, sleeps):
+        requests = []
+        client = self.mock_http_client(build_handler([503], requests))
+        request = httpx.Request("GET", "https://test.com/v1/links")
+        assert send_with_retries(client, request).status_code == 503
+        assert len(requests) == 1
+        assert not sleeps
+
+    def test_async_retries_until_success(self, monkeypatch):
+        async def no_sleep(_delay):
+            pass
+
+        monkeypatch.setattr("fintoc.retry.asyncio.sleep", no_sleep)
+        requests = []
+        client = self.mock_http_client(
+            build_handler([429, 200], requests), asynchronous=True
+        )
+        request = httpx.Request("GET", "https://test.com/v1/links")
+        response = asyncio.run(send_with_retries_async(client, request, RetryPolicy()))
+        assert response.status_code == 200
+        assert len(requests) == 2
+
+
+class TestClientRetries:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_http_client, mock_client):
+        self.mock_http_client = mock_http_client
+        self.mock_client = mock_client
+
+    def create_client(self, statuses, requests, client_class=Client):
+        return self.mock_client(
+            build_handler(statuses, requests),
+            client_class=client_class,
+            retry_policy=RetryPolicy(max_attempts=3),
+        )
+
+    def test_post_reuses_idempotency_key(self, sleeps):
+        requests = []
+        client = self.create_client([503, 503, 200], requests)
+        client.request("/v2/transfers", method="post", json={"amount": 100})
+        keys = {request.headers["idempotency-key"] for request in requests}
+        assert len(requests) == 3
+        assert len(keys) == 1
+
+    def test_raises_after_max_attempts(self, sleeps):
+        requests = []
+        client = self.create_client([502], requests)
+        with pytest.raises(httpx.HTTPStatusError):
+            client.request("/v1/links/link_token")
+        assert len(requests) == 3
+
+    def test_extended_client_keeps_policy(self):
+        client = self.create_client([200], [])
+        assert client.extend(params={"a": "b"}).retry_policy is client.retry_policy
+
+    def test_async_client_retries(self, monkeypatch):
+        async def no_sleep(_delay):
+            pass
+
+        monkeypatch.setattr("fintoc.retry.asyncio.sleep", no_sleep)
+        requests = []
+        client = self.create_client([503, 200], requests, client_class=AsyncClient)
+        asyncio.run(client.request("/v2/transfers", method="post"))
+        assert len(requests) == 2
+        assert requests[0].headers["idempotency-key"] == (
+            requests[1].headers["idempotency-key"]
+        )
+
+    def test_pagination_resumes_at_failed_page(self, sleeps):
+        first_page = "https://test.com/v1/links"
+        second_page = "https://test.com/v1/links?page=2"
+        requests = []
+
+        def handler(request):
+            requests.append(str(request.url))
+            if str(request.url) == second_page and requests.count(second_page) == 1:
+                return httpx.Response(503)
+            headers = {}
+            if str(request.url) == first_page:
+                headers["link"] = f'<{second_page}>; rel="next"'
+            return httpx.Response(200, headers=headers, json=[{"id": "idx"}])
+
+        client = self.mock_http_client(handler)
+        elements = list(paginate(client, first_page, retry_policy=RetryPolicy()))
+        assert len(elements) == 2
+        assert requests == [first_page, second_page, second_page]
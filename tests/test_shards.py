@@ -0,0 +1,207 @@
+import asyncio
+import datetime
+import threading
+import time
+
+import httpx
+import pytest
+
+from fintoc.client import AsyncClient, Client
+from fintoc.errors import ApiError
+from fintoc.managers import MovementsManager
+from fintoc.managers.v2 import MovementsManager as MovementsManagerV2
+from fintoc.mixins import ResourceMixin
+from fintoc.shards import merge_windows, parse_bound, split_interval
+
+
+def build_movements():
+    """Build a movement for each day of 2024, newest first."""
+    first_day = datetime.date(2024, 1, 1)
+    return [
+        {"id": f"mov_{day}", "post_date": f"{first_day + datetime.timedelta(days=day)}"}
+        for day in range(365, -1, -1)
+    ]
+
+
+class TestSplitInterval:
+    def test_parse_bound(self):
+        assert parse_bound("2024-01-01") == datetime.date(2024, 1, 1)
+        assert parse_bound("2024-01-01T10:00:00Z") == datetime.datetime(2024, 1, 1, 10)
+        aware = datetime.datetime(2024, 1, 1, 10, tzinfo=datetime.timezone.utc)
+        assert parse_bound(aware) == datetime.datetime(2024, 1, 1, 10)
+        with pytest.raises(ValueError):
+            parse_bound("yesterday")
+
+    def test_split_dates(self):
+        windows = split_interval(
+            datetime.date(2024, 1, 1), datetime.date(2024, 1, 10), 3
+        )
+        assert windows == [
+            ("2024-01-07", "2024-01-10"),
+            ("2024-01-04", "2024-01-06"),
+            ("2024-01-01", "2024-01-03"),
+        ]
+
+    def test_split_dates_into_more_shards_than_days(self):
+        windows = split_interval(
+            datetime.date(2024, 1, 1), datetime.date(2024, 1, 2), 5
+        )
+        assert windows == [("2024-01-02", "2024-01-02"), ("2024-01-01", "2024-01-01")]
+
+    def test_split_datetimes(self):
+        windows = split_interval(
+            datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 1, 4), 2
+        )
+        assert windows == [
+            ("2024-01-01T02:00:00Z", "2024-01-01T04:00:00Z"),
+            ("2024-01-01T00:00:00Z", "2024-01-01T02:00:00Z"),
+        ]
+
+    def test_invalid_intervals(self):
+        with pytest.raises(ValueError):
+            split_interval(datetime.date(2024, 1, 1), datetime.date(2024, 1, 2), 0)
+        with pytest.raises(ValueError):
+            split_interval(datetime.date(2024, 1, 2), datetime.date(2024, 1, 1), 2)
+        with pytest.raises(ValueError):
+            split_interval(datetime.date(2024, 1, 1), datetime.datetime(2024, 1, 2), 2)
+
+    def test_merge_windows_skips_repeated_ids_on_shared_bounds(self):
+        bound = datetime.datetime(2024, 1, 2)
+        windows = [
+            [{"id": "mov_3", "post_date": "2024-01-03T00:00:00Z"}]
+            + [{"id": "mov_2", "post_date": "2024-01-02T00:00:00Z"}],
+            [{"id": "mov_2", "post_date": "2024-01-02T00:00:00Z"}]
+            + [{"id": "mov_1", "post_date": "2024-01-01T00:00:00Z"}],
+            [{"id": "mov_3", "post_date": "2024-01-01T00:00:00Z"}],
+        ]
+        merged = merge_windows(windows, [bound, None, None])
+        assert [element["id"] for element in merged] == [
+            "mov_3",
+            "mov_2",
+            "mov_1",
+            "mov_3",
+        ]
+
+
+class TestShardedList:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_client, movements_handler):
+        self.requests = []
+        self.movements = build_movements()
+        self.mock_client = mock_client
+        self.movements_handler = movements_handler
+
+    def build_client(self, movements=None, client_class=Client, delay=0):
+        if movements is None:
+            movements = self.movements
+        handler = self.movements_handler(movements, self.requests, delay=delay)
+        return self.mock_client(handler, client_class=client_class)
+
+    def listed_params(self):
+        return [dict(request.url.params) for request in self.requests]
+
+    def test_shards_are_merged_in_order(self):
+        client = self.build_client()
+        manager = MovementsManager("/v1/accounts/acc_1/movements", client)
+        movements = list(
+            manager.list(since="2024-01-01", until="2024-12-31", shards=12)
+        )
+        assert [movement.id for movement in movements] == [
+            movement["id"] for movement in self.movements
+        ]
+        assert all(isinstance(movement, ResourceMixin) for movement in movements)
+        assert len(self.requests) == 12
+        assert {"since": "2024-01-01", "until": "2024-01-30"} in self.listed_params()
+
+    def test_shards_are_listed_concurrently(self):
+        client = self.build_client(delay=0.2)
+        manager = MovementsManagerV2("/v2/accounts/{account_id}/movements", client)
+        start = time.monotonic()
+        movements = manager.list(
+            account_id="acc_1",
+            since="2024-01-01",
+            until="2024-12-31",
+            shards=4,
+            raw=True,
+            lazy=False,
+        )
+        assert time.monotonic() - start < 0.6
+        assert isinstance(movements, list)
+        assert len(movements) == len(self.movements)
+
+    def test_windows_get_streamed(self):
+        client = self.build_client()
+        manager = MovementsManager("/v1/movements", client)
+        movements = manager.list(
+            since="2024-01-01", until="2024-12-31", shards=12, concurrency=2, raw=True
+        )
+        assert next(movements)["id"] == "mov_365"
+        assert len(self.requests) <= 3
+        movements.close()
+
+    def test_shared_bounds_of_datetimes_are_not_repeated(self):
+        movements = [
+            {"id": "mov_2", "post_date": "2024-01-01T02:00:00Z"},
+            {"id": "mov_1", "post_date": "2024-01-01T01:00:00Z"},
+        ]
+        client = self.build_client(movements)
+        manager = MovementsManager("/v1/movements", client)
+        listed = manager.list(
+            since="2024-01-01T00:00:00Z", until="2024-01-01T04:00:00Z", shards=2
+        )
+        assert [movement.id for movement in listed] == ["mov_2", "mov_1"]
+
+    def test_concurrency_limits_the_connections(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def handler(request):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return httpx.Response(200, json=[])
+
+        manager = MovementsManager("/v1/movements", self.mock_client(handler))
+        list(
+            manager.list(
+                since="2024-01-01", until="2024-01-31", shards=6, concurrency=2
+            )
+        )
+        assert max(peak) <= 2
+
+    def test_open_interval_keeps_the_newest_window_open(self):
+        client = self.build_client()
+        manager = MovementsManager("/v1/movements", client)
+        list(manager.list(since="2024-12-01", shards=2, raw=True))
+        assert any("until" not in params for params in self.listed_params())
+
+    def test_shards_require_since(self):
+        manager = MovementsManager("/v1/movements", self.build_client())
+        with pytest.raises(ValueError):
+            manager.list(shards=2)
+
+    def test_errors_of_a_shard_are_raised(self):
+        def handler(request):
+            return httpx.Response(500, json={"error": {"type": "api_error"}})
+
+        manager = MovementsManager("/v1/movements", self.mock_client(handler))
+        with pytest.raises(ApiError):
+            list(manager.list(since="1999-12-01", until="1999-12-31", shards=2))
+
+    def test_async_shards(self):
+        client = self.build_client(client_class=AsyncClient)
+        manager = MovementsManager("/v1/movements", client)
+
+        async def run():
+            return [
+                movement.id
+                async for movement in manager.list(
+                    since="2024-01-01", until="2024-12-31", shards=4
+                )
+            ]
+
+        assert asyncio.run(run()) == [movement["id"] for movement in self.movements]
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from fintoc.client import AsyncClient
+from fintoc.core import AsyncFintoc, Fintoc
+from fintoc.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def run_concurrently(function, times):
+    with ThreadPoolExecutor(max_workers=times) as executor:
+        return list(executor.map(lambda _: function(), range(times)))
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_get_coalesced(self):
+        single_flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def function():
+            calls.append(1)
+            release.wait(1)
+            return {"nested": {"value": 1}}
+
+        def call():
+            return single_flight.do("key", function)
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(call) for _ in range(5)]
+            time.sleep(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result == {"nested": {"value": 1}} for result in results)
+        assert len({id(result["nested"]) for result in results}) == 5
+
+    def test_sequential_calls_do_not_get_coalesced(self):
+        single_flight = SingleFlight()
+        calls = []
+        for _ in range(3):
+            single_flight.do("key", lambda: calls.append(1))
+        assert len(calls) == 3
+
+    def test_errors_are_shared(self):
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def function():
+            release.wait(1)
+            raise ValueError("Failed")
+
+        def call():
+            try:
+                single_flight.do("key", function)
+            except ValueError as error:
+                return error
+            return None
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(call) for _ in range(3)]
+            time.sleep(0.1)
+            release.set()
+            errors = [future.result() for future in futures]
+        assert all(isinstance(error, ValueError) for error in errors)
+        assert len({id(error) for error in errors}) == 1
+
+    def test_async_concurrent_calls_get_coalesced(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def function():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"value": 1}
+
+        async def run():
+            return await asyncio.gather(
+                *[single_flight.do("key", function) for _ in range(5)]
+            )
+
+        results = asyncio.run(run())
+        assert len(calls) == 1
+        assert all(result == {"value": 1} for result in results)
+        assert len({id(result) for result in results}) == 5
+
+
+def build_handler(requests):
+    """Build a handler that answers slowly, storing each request."""
+
+    def handler(request):
+        requests.append(request)
+        time.sleep(0.1)
+        return httpx.Response(200, json={"id": request.url.path.split("/")[-1]})
+
+    return handler
+
+
+class TestClientSingleFlight:
+    def test_identical_gets_get_coalesced(self, mock_client):
+        requests = []
+        client = mock_client(build_handler(requests), single_flight=SingleFlight())
+        results = run_concurrently(lambda: client.request("/v1/links/link_1"), 4)
+        assert len(requests) == 1
+        assert results == [{"id": "link_1"}] * 4
+
+    def test_different_gets_do_not_get_coalesced(self, mock_client):
+        requests = []
+        client = mock_client(build_handler(requests), single_flight=SingleFlight())
+        paths = iter(["/v1/links/link_1", "/v1/links/link_2"])
+        lock = threading.Lock()
+
+        def request():
+            with lock:
+                path = next(paths)
+            return client.request(path)
+
+        run_concurrently(request, 2)
+        assert len(requests) == 2
+
+    def test_posts_do_not_get_coalesced(self, mock_client):
+        requests = []
+        client = mock_client(build_handler(requests), single_flight=SingleFlight())
+        run_concurrently(lambda: client.request("/v2/transfers", method="post"), 3)
+        assert len(requests) == 3
+
+    def test_async_identical_gets_get_coalesced(self, mock_client):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"id": "link_1"})
+
+        async def run():
+            client = mock_client(
+                handler, client_class=AsyncClient, single_flight=AsyncSingleFlight()
+            )
+            return await asyncio.gather(
+                *[client.request("/v1/links/link_1") for _ in range(3)]
+            )
+
+        assert asyncio.run(run()) == [{"id": "link_1"}] * 3
+        assert len(requests) == 1
+
+
+class TestCoalesceRequestsOption:
+    @pytest.mark.parametrize(
+        "fintoc_class, single_flight_class",
+        [(Fintoc, SingleFlight), (AsyncFintoc, AsyncSingleFlight)],
+    )
+    def test_option(self, fintoc_class, single_flight_class):
+        # pylint: disable=protected-access
+        fintoc = fintoc_class("super_secret_api_key", coalesce_requests=True)
+        assert isinstance(fintoc._client.single_flight, single_flight_class)
+        assert fintoc._client.extend().single_flight is fintoc._client.single_flight
+        assert Fintoc("super_secret_api_key")._client.single_flight is None
@@ -0,0 +1,133 @@
+import asyncio
+import datetime
+
+import pytest
+
+from fintoc.client import AsyncClient
+from fintoc.managers import MovementsManager
+from fintoc.managers.v2 import MovementsManager as MovementsManagerV2
+from fintoc.mixins import ResourceMixin
+from fintoc.sync import (
+    MemoryWatermarkStore,
+    MovementSync,
+    SQLiteWatermarkStore,
+    Watermark,
+)
+
+SINCE = "2025-01-01"
+
+
+def movement(id_, post_date):
+    return {"id": id_, "amount": 1000, "post_date": post_date}
+
+
+class TestWatermarkStores:
+    @pytest.fixture(params=["memory", "sqlite"])
+    def store(self, request, tmp_path):
+        if request.param == "memory":
+            return MemoryWatermarkStore()
+        return SQLiteWatermarkStore(str(tmp_path / "watermarks.db"))
+
+    def test_set_get_and_delete(self, store):
+        watermark = Watermark("2025-01-02T10:00:00Z", ["mov_1", "mov_2"])
+        assert store.get("acc_1") is None
+        store.set("acc_1", watermark)
+        assert store.get("acc_1") == watermark
+        store.delete("acc_1")
+        assert store.get("acc_1") is None
+
+    def test_sqlite_watermarks_persist(self, tmp_path):
+        path = str(tmp_path / "watermarks.db")
+        SQLiteWatermarkStore(path).set("acc_1", Watermark("2025-01-02T10:00:00Z"))
+        assert SQLiteWatermarkStore(path).get("acc_1").date == "2025-01-02T10:00:00Z"
+
+
+class TestMovementSync:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_client, movements_handler):
+        self.requests = []
+        self.movements = [
+            movement("mov_2", "2025-01-02T10:00:00Z"),
+            movement("mov_1", "2025-01-01T10:00:00Z"),
+        ]
+        self.handler = movements_handler(self.movements, self.requests)
+        self.mock_client = mock_client
+        self.client = mock_client(self.handler)
+        self.manager = MovementsManager("/v1/accounts/acc_1/movements", self.client)
+
+    def test_first_sync_lists_every_movement_since(self):
+        sync = MovementSync()
+        batch = sync.run(self.manager, "acc_1", since=SINCE)
+        assert [element.id for element in batch] == ["mov_2", "mov_1"]
+        assert all(isinstance(element, ResourceMixin) for element in batch)
+        assert self.requests[0].url.params["since"] == SINCE
+        assert sync.store.get("acc_1") is None
+        sync.commit(batch)
+        assert sync.store.get("acc_1") == Watermark("2025-01-02T10:00:00Z", ["mov_2"])
+
+    def test_first_sync_needs_since(self):
+        with pytest.raises(ValueError):
+            MovementSync().run(self.manager, "acc_1")
+        assert self.requests == []
+
+    def test_later_syncs_list_only_new_movements(self):
+        sync = MovementSync()
+        sync.commit(sync.run(self.manager, "acc_1", since=SINCE))
+        self.movements.insert(0, movement("mov_3", "2025-01-03T10:00:00Z"))
+        self.movements.insert(0, movement("mov_4", "2025-01-02T10:00:00Z"))
+        batch = sync.run(self.manager, "acc_1", raw=True, since=SINCE)
+        assert self.requests[-1].url.params["since"] == "2025-01-02T10:00:00Z"
+        assert [element["id"] for element in batch] == ["mov_4", "mov_3"]
+        sync.commit(batch)
+        assert sync.store.get("acc_1") == Watermark("2025-01-03T10:00:00Z", ["mov_3"])
+        assert len(sync.run(self.manager, "acc_1")) == 0
+
+    def test_uncommitted_batches_get_listed_again(self):
+        sync = MovementSync()
+        sync.commit(sync.run(self.manager, "acc_1", since=SINCE))
+        self.movements.insert(0, movement("mov_3", "2025-01-03T10:00:00Z"))
+        sync.run(self.manager, "acc_1", raw=True)
+        batch = sync.run(self.manager, "acc_1", raw=True)
+        assert [element["id"] for element in batch] == ["mov_3"]
+
+    def test_overlap_catches_late_movements(self):
+        sync = MovementSync(overlap=datetime.timedelta(days=1))
+        sync.run(self.manager, "acc_1", commit=True, since=SINCE)
+        self.movements.append(movement("mov_late", "2025-01-01T12:00:00Z"))
+        batch = sync.run(self.manager, "acc_1", commit=True, raw=True)
+        assert self.requests[-1].url.params["since"] == "2025-01-01T10:00:00Z"
+        assert [element["id"] for element in batch] == ["mov_late"]
+        assert sync.store.get("acc_1").ids == {"mov_1", "mov_2", "mov_late"}
+
+    def test_duplicated_movements_get_skipped(self):
+        self.movements.append(dict(self.movements[0]))
+        batch = MovementSync().run(self.manager, "acc_1", raw=True, since=SINCE)
+        assert [element["id"] for element in batch] == ["mov_2", "mov_1"]
+
+    def test_committed_batches(self):
+        sync = MovementSync()
+        batch = sync.run(self.manager, "acc_1", commit=True, since=SINCE)
+        assert sync.store.get("acc_1") == batch.watermark
+        sync.reset("acc_1")
+        assert sync.store.get("acc_1") is None
+
+    def test_v2_movements(self):
+        manager = MovementsManagerV2("/v2/accounts/{account_id}/movements", self.client)
+        batch = MovementSync().run(manager, "acc_1", raw=True, since=SINCE)
+        assert len(batch) == 2
+        assert self.requests[0].url.path == "/v2/accounts/acc_1/movements"
+
+    def test_async_sync(self):
+        client = self.mock_client(self.handler, client_class=AsyncClient)
+        manager = MovementsManager("/v1/accounts/acc_1/movements", client)
+        sync = MovementSync()
+
+        async def run():
+            first = await sync.run(manager, "acc_1", since=SINCE)
+            sync.commit(first)
+            second = await sync.run(manager, "acc_1")
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert [element.id for element in first] == ["mov_2", "mov_1"]
+        assert len(second) == 0
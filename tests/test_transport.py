@@ -0,0 +1,100 @@
+import asyncio
+
+import httpx
+
+from fintoc.client import AsyncClient, Client
+from fintoc.core import AsyncFintoc, Fintoc
+from fintoc.transport import TransportConfig
+
+
+class TestTransportConfig:
+    def test_default_limits(self):
+        limits = TransportConfig().build_limits()
+        assert limits.max_connections == 100
+        assert limits.max_keepalive_connections == 20
+        assert limits.keepalive_expiry == 5.0
+
+    def test_custom_limits(self):
+        config = TransportConfig(
+            max_connections=500, max_keepalive_connections=50, keepalive_expiry=30
+        )
+        limits = config.build_limits()
+        assert limits.max_connections == 500
+        assert limits.max_keepalive_connections == 50
+        assert limits.keepalive_expiry == 30
+
+    def test_timeouts_fall_back_to_default(self):
+        config = TransportConfig(timeout=10, pool_timeout=60)
+        timeout = config.build_timeout()
+        assert timeout.connect == 10
+        assert timeout.read == 10
+        assert timeout.write == 10
+        assert timeout.pool == 60
+
+    def test_build_clients(self):
+        config = TransportConfig(read_timeout=30)
+        client = config.build_client()
+        assert isinstance(client, httpx.Client)
+        assert client.timeout.read == 30
+
+        async_client = config.build_async_client()
+        assert isinstance(async_client, httpx.AsyncClient)
+        assert async_client.timeout.read == 30
+
+
+class TestFintocTransport:
+    # pylint: disable=protected-access
+    def test_default_pool_is_shared(self):
+        first = Fintoc("first_api_key")
+        second = Fintoc("second_api_key")
+        assert first._client._client is Client._client
+        assert first._client._client is second._client._client
+
+    def test_transport_builds_own_pool(self):
+        first = Fintoc("first_api_key", transport=TransportConfig())
+        second = Fintoc("second_api_key", transport=TransportConfig())
+        assert first._client._client is not Client._client
+        assert first._client._client is not second._client._client
+        assert first.links._client._client is first._client._client
+
+    def test_explicitly_shared_pool(self):
+        pool = TransportConfig(max_connections=10).build_client()
+        first = Fintoc("first_api_key", http_client=pool)
+        second = Fintoc("second_api_key", http_client=pool)
+        assert first._client._client is pool
+        assert second._client._client is pool
+        assert first._client.extend(params={"a": "b"})._client is pool
+
+    def test_close_owned_pool(self):
+        fintoc = Fintoc("api_key", transport=TransportConfig())
+        fintoc.close()
+        assert fintoc._client._client.is_closed
+
+    def test_close_does_not_close_shared_pool(self):
+        pool = httpx.Client()
+        fintoc = Fintoc("api_key", http_client=pool)
+        fintoc.close()
+        assert not pool.is_closed
+
+    def test_async_transport_builds_own_pool(self):
+        fintoc = AsyncFintoc("api_key", transport=TransportConfig())
+        assert isinstance(fintoc._client._client, httpx.AsyncClient)
+
+        asyncio.run(fintoc.close())
+        assert fintoc._client._client.is_closed
+
+    def test_async_default_pool_is_not_shared(self):
+        first = AsyncFintoc("first_api_key")
+        second = AsyncFintoc("second_api_key")
+        assert first._client._client is not second._client._client
+        assert first.links._client._client is first._client._client
+
+    def test_async_default_pool_works_across_event_loops(self, local_server):
+        local_server.routes["/v1/accounts/acc_1"] = (200, {"id": "acc_1"})
+        client = AsyncClient(local_server.url, "api_key", None, "fintoc-python/test")
+        extended = client.extend(params={"a": "b"})
+
+        assert asyncio.run(client.request("/v1/accounts/acc_1")) == {"id": "acc_1"}
+        assert asyncio.run(client.request("/v1/accounts/acc_1")) == {"id": "acc_1"}
+        assert asyncio.run(extended.request("/v1/accounts/acc_1")) == {"id": "acc_1"}
+        assert len(local_server.requests) == 3
@@ -6,8 +6,9 @@ import pytest
 
 from fintoc.constants import DATE_TIME_PATTERN
 from fintoc.errors import ApiError, FintocError
-from fintoc.resources import GenericFintocResource, Link
+from fintoc.resources import AccountV2, GenericFintocResource, Link, TaxReturn
 from fintoc.utils import (
+    RESOURCE_CLASSES,
     can_raise_fintoc_error,
     get_error_class,
     get_resource_class,
@@ -15,6 +16,9 @@ from fintoc.utils import (
     objetize,
     objetize_datetime,
     objetize_generator,
+    objetize_string,
+    parse_iso_datetime,
+    pascal_to_snake,
     serialize,
     singularize,
     snake_to_pascal,
@@ -38,6 +42,17 @@ class TestSnakeToPascal:
         assert pascal == "Thisisatest"
 
 
+class TestPascalToSnake:
+    def test_simple_string(self):
+        assert pascal_to_snake("Link") == "link"
+
+    def test_complex_string(self):
+        assert pascal_to_snake("InstitutionTaxReturn") == "institution_tax_return"
+
+    def test_string_with_version(self):
+        assert pascal_to_snake("AccountV2") == "account_v2"
+
+
 class TestSingularize:
     def test_plural_string(self):
         string = "movements"
@@ -72,6 +87,36 @@ class TestIsISODateTime:
         invalid_iso_datetime_string = "1105122"
         assert not is_iso_datetime(invalid_iso_datetime_string)
 
+    def test_invalid_iso_lookalike_format(self):
+        assert not is_iso_datetime("2021-13-13T13:40:40Z")
+        assert not is_iso_datetime("2021-08-13T13:40:40.Z")
+        assert not is_iso_datetime("2021-08-13T13:40:40,811Z")
+        assert not is_iso_datetime("2021-08-13T13:40:40.8a1Z")
+        assert not is_iso_datetime("2021-08-13 13:40:40Z")
+        assert not is_iso_datetime("2021-08-13T13:40:40.1234567Z")
+
+
+class TestParseISODateTime:
+    def test_naive_datetime(self):
+        parsed = parse_iso_datetime("2021-08-13T13:40:40Z")
+        assert parsed == datetime.datetime(2021, 8, 13, 13, 40, 40)
+        assert parsed.tzinfo is None
+
+    def test_fraction_datetime(self):
+        parsed = parse_iso_datetime("2021-08-13T13:40:40.811Z")
+        assert parsed == datetime.datetime(2021, 8, 13, 13, 40, 40, 811000)
+        parsed = parse_iso_datetime("2021-08-13T13:40:40.000811Z")
+        assert parsed.microsecond == 811
+
+    def test_aware_datetime(self):
+        parsed = parse_iso_datetime("2021-08-13T13:40:40Z", aware=True)
+        assert parsed == datetime.datetime(
+            2021, 8, 13, 13, 40, 40, tzinfo=datetime.timezone.utc
+        )
+
+    def test_invalid_datetime(self):
+        assert parse_iso_datetime("This is not a date") is None
+
 
 class TestGetResourceClass:
     def test_default_valid_resource(self):
@@ -84,6 +129,18 @@ class TestGetResourceClass:
         klass = get_resource_class(resource)
         assert klass is GenericFintocResource
 
+    def test_registry_is_populated(self):
+        assert RESOURCE_CLASSES["link"] is Link
+        assert RESOURCE_CLASSES["tax_return"] is TaxReturn
+        assert RESOURCE_CLASSES["account_v2"] is AccountV2
+
+    def test_unknown_resources_get_cached(self):
+        resource = "another_resource_that_does_not_exist"
+        RESOURCE_CLASSES.pop(resource, None)
+        klass = get_resource_class(resource)
+        assert klass is GenericFintocResource
+        assert RESOURCE_CLASSES[resource] is GenericFintocResource
+
     def test_iso_datetime_resource(self):
         resource = "any_resource"
         klass = get_resource_class(resource, value="2021-08-13T13:40:40.811Z")
@@ -156,6 +213,24 @@ class TestCanRaiseFintocError:
             wrapped()
         assert isinstance(execinfo.value, FintocError)
 
+    @pytest.mark.parametrize(
+        "status_code,error_class", [(502, ApiError), (404, FintocError)]
+    )
+    def test_http_status_error_without_json(self, status_code, error_class):
+        def raise_gateway_error():
+            raise httpx.HTTPStatusError(
+                message="HTTP Status Error",
+                response=httpx.Response(
+                    status_code=status_code, text="<html>Bad Gateway</html>"
+                ),
+                request=httpx.Request("GET", "/"),
+            )
+
+        wrapped = can_raise_fintoc_error(raise_gateway_error)
+        with pytest.raises(error_class) as execinfo:
+            wrapped()
+        assert str(status_code) in str(execinfo.value)
+
     def test_connect_error(self):
         wrapped = can_raise_fintoc_error(self.raise_connect_error)
         with pytest.raises(Exception) as execinfo:
@@ -261,6 +336,25 @@ class TestObjetizeDateTime:
             objetize_datetime(self.deceptively_invalid_string)
 
 
+class TestObjetizeString:
+    def setup_method(self):
+        self.datetime_string = "2021-12-16T12:24:44Z"
+
+    def test_naive_mode(self):
+        parsed = objetize_string(self.datetime_string, "naive")
+        assert parsed == datetime.datetime(2021, 12, 16, 12, 24, 44)
+
+    def test_aware_mode(self):
+        parsed = objetize_string(self.datetime_string, "aware")
+        assert parsed.tzinfo == datetime.timezone.utc
+
+    def test_string_mode(self):
+        assert objetize_string(self.datetime_string, "string") == self.datetime_string
+
+    def test_non_datetime_string(self):
+        assert objetize_string("This is not a date") == "This is not a date"
+
+
 class TestObjetizeGenerator:
     def setup_method(self):
         self.client = "This is a client"